@@ -83,8 +83,13 @@ IMPORT_REWRITES: dict[str, str] = {
     "vclient.testing._client": "vclient._sync.testing._client",
 }
 
-# Combined lookup for renaming any identifier (class or factory function)
-_ALL_RENAMES: dict[str, str] = {**RENAME_CLASSES, **FACTORY_RENAMES}
+# Async helpers replaced by a sync counterpart with the same signature
+HELPER_RENAMES: dict[str, str] = {
+    "gather_bounded": "run_sequentially",
+}
+
+# Combined lookup for renaming any identifier (class, factory function or helper)
+_ALL_RENAMES: dict[str, str] = {**RENAME_CLASSES, **FACTORY_RENAMES, **HELPER_RENAMES}
 
 
 class AsyncToSyncTransformer(ast.NodeTransformer):
@@ -94,6 +99,27 @@ class AsyncToSyncTransformer(ast.NodeTransformer):
     constructs so the resulting tree is fully synchronous.
     """
 
+    def __init__(self) -> None:
+        """Initialize per-module bookkeeping for the ``asyncio`` import rewrite."""
+        super().__init__()
+        self._asyncio_imports: list[ast.Import] = []
+        self._imports_time = False
+
+    def visit_Module(self, node: ast.Module) -> ast.Module:
+        """Transform the module, dropping the rewritten ``import time`` when it is redundant.
+
+        A module that already imports ``time`` itself would otherwise end up importing it
+        twice once ``import asyncio`` is rewritten.
+        """
+        self.generic_visit(node)
+        if self._imports_time:
+            for import_node in self._asyncio_imports:
+                import_node.names = [alias for alias in import_node.names if alias.name != "time"]
+            node.body = [
+                stmt for stmt in node.body if not (isinstance(stmt, ast.Import) and not stmt.names)
+            ]
+        return node
+
     # ------------------------------------------------------------------
     # Async construct removal
     # ------------------------------------------------------------------
@@ -243,8 +269,11 @@ class AsyncToSyncTransformer(ast.NodeTransformer):
     def visit_Import(self, node: ast.Import) -> ast.Import:
         """Replace ``import asyncio`` with ``import time``."""
         for alias in node.names:
-            if alias.name == "asyncio":
+            if alias.name == "time":
+                self._imports_time = True
+            elif alias.name == "asyncio":
                 alias.name = "time"
+                self._asyncio_imports.append(node)
         return node
 
     # ------------------------------------------------------------------
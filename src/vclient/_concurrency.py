@@ -0,0 +1,58 @@
+"""Bounded fan-out for bulk service helpers.
+
+The async services await ``gather_bounded``; the code generator renames it to
+``run_sequentially`` in the sync services, whose calls already ran while the
+generator of arguments was consumed.
+"""
+
+import asyncio
+from collections.abc import Coroutine, Iterable
+from typing import Any
+
+
+async def gather_bounded[R](calls: Iterable[Coroutine[Any, Any, R]], limit: int) -> list[R]:
+    """Await coroutines with at most ``limit`` running at once, keeping input order.
+
+    ``limit`` workers pull the next call from ``calls`` as each finishes, so a generator
+    only creates a coroutine when it is about to be awaited. The first failure cancels
+    the calls in flight, leaves the rest of ``calls`` unconsumed, and is re-raised as-is
+    so callers see the same exception a single request would raise rather than an
+    ``ExceptionGroup``.
+
+    Args:
+        calls: The coroutines to run, typically a generator of one request per item.
+        limit: Maximum number of coroutines awaited concurrently.
+
+    Returns:
+        The coroutine results, in the same order as ``calls``.
+    """
+    pending = enumerate(calls)
+    results: dict[int, R] = {}
+
+    async def worker() -> None:
+        for index, call in pending:
+            results[index] = await call
+
+    try:
+        async with asyncio.TaskGroup() as group:
+            for _ in range(limit):
+                group.create_task(worker())
+    except BaseExceptionGroup as error:
+        raise error.exceptions[0] from None
+    return [results[index] for index in range(len(results))]
+
+
+def run_sequentially[R](calls: Iterable[R], limit: int) -> list[R]:  # noqa: ARG001
+    """Collect the results of sync calls made one after another.
+
+    Sync counterpart of ``gather_bounded``: each call runs as ``calls`` is consumed, so
+    the first failure stops the remaining calls from being made.
+
+    Args:
+        calls: Lazily evaluated results, typically a generator of request calls.
+        limit: Accepted for parity with ``gather_bounded``; calls never overlap.
+
+    Returns:
+        The results, in the same order as ``calls``.
+    """
+    return list(calls)
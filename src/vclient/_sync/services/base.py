@@ -1,22 +1,29 @@
 # AUTO-GENERATED — do not edit. Run 'uv run duty generate_sync' to regenerate.
 """Base service class for API services."""
 
+import functools
 import random
 import time
 import uuid
 from collections.abc import Iterator
-from typing import TYPE_CHECKING, Any, TypeVar
+from typing import TYPE_CHECKING, Any, BinaryIO, TypedDict, TypeVar
 
 import httpx2
 from loguru import logger
-from pydantic import BaseModel, ValidationError as PydanticValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError as PydanticValidationError
+from pydantic_core import from_json
 
+from vclient._concurrency import run_sequentially
 from vclient.constants import (
+    CACHE_CONTROL_HEADER,
     DEFAULT_PAGE_LIMIT,
+    ETAG_HEADER,
+    HTTP_304_NOT_MODIFIED,
     HTTP_500_INTERNAL_SERVER_ERROR,
     HTTP_600_UPPER_BOUND,
     IDEMPOTENCY_KEY_HEADER,
     IDEMPOTENT_HTTP_METHODS,
+    IF_NONE_MATCH_HEADER,
     MAX_PAGE_LIMIT,
     ON_BEHALF_OF_HEADER,
     RATE_LIMIT_HEADER,
@@ -37,7 +44,98 @@ from vclient.exceptions import (
 from vclient.models.pagination import PaginatedResponse
 
 T = TypeVar("T", bound=BaseModel)
+
+
+class _Page[M](TypedDict, total=False):
+    """Wire shape of a paginated response body."""
+
+    items: list[M]
+    limit: int
+    offset: int
+    total: int
+
+
+@functools.cache
+def _page_adapter[M: BaseModel](model_class: type[M]) -> TypeAdapter[_Page[M]]:
+    """Return a cached adapter that decodes and validates a page body in one call.
+
+    Validating the raw JSON bytes as ``_Page[model_class]`` lets pydantic-core parse the
+    body and build the item models in a single pass, without materializing the items as
+    dicts first. Adapters are built on first use and reused.
+
+    Args:
+        model_class: Pydantic model class of the page items.
+
+    Returns:
+        A TypeAdapter for a page of ``model_class`` items.
+    """
+    page_type: Any = _Page
+    return TypeAdapter(page_type[model_class])
+
+
+@functools.cache
+def _list_adapter[M: BaseModel](model_class: type[M]) -> TypeAdapter[list[M]]:
+    """Return a cached adapter that decodes and validates a bare JSON array in one call.
+
+    Args:
+        model_class: Pydantic model class of the array items.
+
+    Returns:
+        A TypeAdapter for a list of ``model_class`` items.
+    """
+    list_type: Any = list
+    return TypeAdapter(list_type[model_class])
+
+
+def _freshness_lifetime(response: httpx2.Response) -> float | None:
+    """Return how long a response may be reused without revalidation.
+
+    Reads the ``max-age`` directive of the Cache-Control header. ``no-cache`` (or no
+    max-age) means the response must be revalidated before every reuse.
+
+    Args:
+        response: The response to inspect.
+
+    Returns:
+        The freshness lifetime in seconds, or None when ``no-store`` forbids caching.
+    """
+    directives = {}
+    for directive in response.headers.get(CACHE_CONTROL_HEADER, "").split(","):
+        name, _, value = directive.strip().partition("=")
+        directives[name.lower()] = value.strip('"')
+    if "no-store" in directives:
+        return None
+    if "no-cache" in directives:
+        return 0.0
+    try:
+        return max(float(directives.get("max-age", 0)), 0.0)
+    except ValueError:
+        return 0.0
+
+
+def _owning_resource(path: str) -> str:
+    """Return the resource whose cached reads a write to ``path`` may have changed.
+
+    Company-scoped paths belong to the ``/companies/{id}/{collection}/{id}`` resource
+    they sit under, so adding XP to a user covers that user's experience reads and a
+    trait change covers the character's full sheet. Other paths belong to their
+    parent (``/developers/me/new-key`` belongs to ``/developers/me``).
+
+    Args:
+        path: The path a write request succeeded against.
+
+    Returns:
+        The owning resource's path, the written path itself when nothing is above it.
+    """
+    segments = path.rstrip("/").split("/")
+    if "companies" in segments:
+        return "/".join(segments[: segments.index("companies") + 4])
+    return "/".join(segments[:-1]) or path
+
+
 if TYPE_CHECKING:
+    from collections import OrderedDict
+
     from vclient._sync.client import SyncVClient
 
 
@@ -134,9 +232,11 @@ class SyncBaseService:
         *,
         params: dict[str, Any] | None = None,
         json: dict[str, Any] | list[Any] | None = None,
+        content: bytes | None = None,
         data: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
         files: Any | None = None,
+        allow_not_modified: bool = False,
     ) -> httpx2.Response:
         """Make an HTTP request with automatic retry on transient errors.
 
@@ -151,9 +251,12 @@ class SyncBaseService:
             path: API endpoint path (will be appended to base_url).
             params: Query parameters.
             json: JSON body data.
+            content: Pre-serialized JSON body bytes, sent as ``application/json``.
             data: Form data.
             headers: Additional headers to include in the request.
             files: Files to upload (passed through to httpx2).
+            allow_not_modified: Return a 304 Not Modified response instead of raising.
+                Only ``_get`` sets this, for a conditional request it holds a cached body for.
 
         Returns:
             The HTTP response.
@@ -165,7 +268,7 @@ class SyncBaseService:
             httpx2.TimeoutException: When request times out and max retries are exhausted.
             APIError: For other API error responses.
         """
-        headers = self._merge_on_behalf_of_header(headers)
+        headers = self._merge_json_content_type(self._merge_on_behalf_of_header(headers), content)
         config = self._client._config
         max_attempts = config.max_retries + 1 if config.auto_retry_rate_limit else 1
         retry_statuses = config.retry_statuses
@@ -179,6 +282,7 @@ class SyncBaseService:
                     url=path,
                     params=params,
                     json=json,
+                    content=content,
                     data=data,
                     headers=headers,
                     files=files,
@@ -197,8 +301,11 @@ class SyncBaseService:
                 time.sleep(delay)
                 continue
             try:
-                self._raise_for_status(response, method, path, params=params)
+                self._raise_for_status(
+                    response, method, path, params=params, allow_not_modified=allow_not_modified
+                )
                 self._log_success_response(response, request_logger)
+                self._invalidate_cached(method, path)
                 return response
             except RateLimitError as e:
                 last_error = e
@@ -262,7 +369,13 @@ class SyncBaseService:
                 response_data["request_id"] = header_id
 
     def _raise_for_status(
-        self, response: httpx2.Response, method: str, url: str, params: dict[str, Any] | None = None
+        self,
+        response: httpx2.Response,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None = None,
+        *,
+        allow_not_modified: bool = False,
     ) -> None:
         """Raise appropriate exception for error responses.
 
@@ -272,6 +385,8 @@ class SyncBaseService:
             url: The URL path of the request.
             params: The query parameters of the request, logged to disambiguate
                 paginated calls that share the same path.
+            allow_not_modified: Accept a 304 Not Modified as success, for a conditional
+                request whose cached body the caller will return.
 
         Raises:
             AuthenticationError: For 401 responses.
@@ -284,7 +399,9 @@ class SyncBaseService:
             ServerError: For 5xx responses.
             APIError: For other error responses.
         """
-        if response.is_success:
+        if response.is_success or (
+            allow_not_modified and response.status_code == HTTP_304_NOT_MODIFIED
+        ):
             return
         status_code = response.status_code
         try:
@@ -411,9 +528,84 @@ class SyncBaseService:
             headers: Additional headers (e.g. an Accept override for binary downloads).
 
         Returns:
-            The HTTP response.
+            The HTTP response. When the client's ETag cache is enabled, a response still
+            fresh per its Cache-Control max-age is returned without a request, and a
+            304 Not Modified answer returns the previously cached response.
         """
-        return self._request("GET", path, params=params, headers=headers)
+        cache = self._client._etag_cache
+        if cache is None or headers is not None:
+            return self._request("GET", path, params=params, headers=headers)
+        key = (path, str(httpx2.QueryParams(params or {})), self._on_behalf_of)
+        with self._client._etag_cache_lock:
+            cached = cache.get(key)
+            if cached is not None and time.monotonic() < cached[1]:
+                cache.move_to_end(key)
+                return cached[0]
+        if cached is not None and ETAG_HEADER in cached[0].headers:
+            headers = {IF_NONE_MATCH_HEADER: cached[0].headers[ETAG_HEADER]}
+        response = self._request(
+            "GET", path, params=params, headers=headers, allow_not_modified=headers is not None
+        )
+        if response.status_code == HTTP_304_NOT_MODIFIED and cached is not None:
+            self._cache_response(cache, key, cached[0], _freshness_lifetime(response))
+            return cached[0]
+        self._cache_response(cache, key, response, _freshness_lifetime(response))
+        return response
+
+    def _cache_response(
+        self,
+        cache: "OrderedDict[tuple[str, str, str | None], tuple[httpx2.Response, float]]",
+        key: tuple[str, str, str | None],
+        response: httpx2.Response,
+        lifetime: float | None,
+    ) -> None:
+        """Store a GET response in the client's cache, or drop it if it is not reusable.
+
+        A response is kept when it can be revalidated (it has an ETag) or reused as-is
+        for a while (a positive max-age). The least recently used entry is evicted once
+        the cache exceeds ``etag_cache_size``.
+
+        Args:
+            cache: The client's ETag cache, already checked to be enabled.
+            key: The (path, query, on-behalf-of) cache key.
+            response: The response whose body is stored.
+            lifetime: Freshness lifetime in seconds, or None if caching is forbidden.
+        """
+        with self._client._etag_cache_lock:
+            if lifetime is None or (lifetime <= 0 and ETAG_HEADER not in response.headers):
+                cache.pop(key, None)
+                return
+            cache[key] = (response, time.monotonic() + lifetime)
+            cache.move_to_end(key)
+            if len(cache) > self._client._config.etag_cache_size:
+                cache.popitem(last=False)
+
+    def _invalidate_cached(self, method: str, path: str) -> None:
+        """Drop cached GET responses a successful write to ``path`` may have made stale.
+
+        Entries for every path under the owning resource (see ``_owning_resource``) and
+        for the collections above it are removed, whatever their query or On-Behalf-Of
+        user. Writes made by other clients, or that change resources outside that
+        subtree, are only picked up once the cached entry expires or is revalidated.
+
+        Args:
+            method: The HTTP method that succeeded; GET requests invalidate nothing.
+            path: The path the request succeeded against.
+        """
+        cache = self._client._etag_cache
+        if method == "GET" or not cache:
+            return
+        owner = _owning_resource(path)
+        with self._client._etag_cache_lock:
+            stale = [
+                key
+                for key in cache
+                if key[0] == owner
+                or key[0].startswith(f"{owner}/")
+                or path.startswith(f"{key[0].rstrip('/')}/")
+            ]
+            for key in stale:
+                del cache[key]
 
     def _merge_on_behalf_of_header(self, headers: dict[str, str] | None) -> dict[str, str] | None:
         """Merge the On-Behalf-Of header into headers when _on_behalf_of is set.
@@ -432,6 +624,27 @@ class SyncBaseService:
             return headers
         return {ON_BEHALF_OF_HEADER: self._on_behalf_of, **(headers or {})}
 
+    @staticmethod
+    def _merge_json_content_type(
+        headers: dict[str, str] | None, content: bytes | None
+    ) -> dict[str, str] | None:
+        """Add a JSON Content-Type header when sending a pre-serialized body.
+
+        httpx2 only sets Content-Type itself for ``json=`` bodies; raw ``content=``
+        bytes would otherwise go out untyped.
+
+        Args:
+            headers: Existing request headers, or None.
+            content: The pre-serialized request body, or None.
+
+        Returns:
+            A new headers dict with Content-Type included, or the original value
+            unchanged when there is no pre-serialized body.
+        """
+        if content is None:
+            return headers
+        return {"Content-Type": "application/json", **(headers or {})}
+
     def _build_idempotency_headers(self, idempotency_key: str | None) -> dict[str, str] | None:
         """Build headers dict with idempotency key if provided.
 
@@ -458,11 +671,43 @@ class SyncBaseService:
         params = {k: v for k, v in kwargs.items() if v is not None}
         return params or None
 
+    @staticmethod
+    def _validate_list(response: httpx2.Response, model_class: type[T]) -> list[T]:
+        """Validate a response whose body is a bare JSON array of ``model_class`` items.
+
+        Args:
+            response: The HTTP response to parse.
+            model_class: Pydantic model class to validate each item into.
+
+        Returns:
+            The validated model instances, in response order.
+        """
+        return _list_adapter(model_class).validate_json(response.content)
+
+    @staticmethod
+    def _serialize_body(body: BaseModel) -> bytes:
+        """Serialize a request model to JSON bytes for the ``content`` argument.
+
+        Produces the same payload as ``model_dump(exclude_none=True, exclude_unset=True,
+        mode="json")`` but in a single pass through pydantic-core, instead of building a
+        dict that httpx2 then encodes again with the stdlib json module. The core
+        serializer is called directly because ``model_dump_json`` decodes its bytes to
+        ``str``, which would only be encoded again here.
+
+        Args:
+            body: The validated request model.
+
+        Returns:
+            The JSON-encoded request body.
+        """
+        return body.__pydantic_serializer__.to_json(body, exclude_none=True, exclude_unset=True)
+
     def _post(
         self,
         path: str,
         *,
         json: dict[str, Any] | list[Any] | None = None,
+        content: bytes | None = None,
         data: dict[str, Any] | None = None,
         params: dict[str, Any] | None = None,
         idempotency_key: str | None = None,
@@ -472,6 +717,7 @@ class SyncBaseService:
         Args:
             path: API endpoint path.
             json: JSON body data.
+            content: Pre-serialized JSON body bytes (see ``_serialize_body``).
             data: Form data.
             params: Query parameters.
             idempotency_key: Optional idempotency key for safe retries.
@@ -485,6 +731,7 @@ class SyncBaseService:
             "POST",
             path,
             json=json,
+            content=content,
             data=data,
             params=params,
             headers=self._build_idempotency_headers(idempotency_key),
@@ -495,6 +742,7 @@ class SyncBaseService:
         path: str,
         *,
         json: dict[str, Any] | list[Any] | None = None,
+        content: bytes | None = None,
         data: dict[str, Any] | None = None,
         params: dict[str, Any] | None = None,
         idempotency_key: str | None = None,
@@ -504,6 +752,7 @@ class SyncBaseService:
         Args:
             path: API endpoint path.
             json: JSON body data.
+            content: Pre-serialized JSON body bytes (see ``_serialize_body``).
             data: Form data.
             params: Query parameters.
             idempotency_key: Optional idempotency key for safe retries.
@@ -517,6 +766,7 @@ class SyncBaseService:
             "PUT",
             path,
             json=json,
+            content=content,
             data=data,
             params=params,
             headers=self._build_idempotency_headers(idempotency_key),
@@ -527,6 +777,7 @@ class SyncBaseService:
         path: str,
         *,
         json: dict[str, Any] | list[Any] | None = None,
+        content: bytes | None = None,
         data: dict[str, Any] | None = None,
         params: dict[str, Any] | None = None,
         idempotency_key: str | None = None,
@@ -536,6 +787,7 @@ class SyncBaseService:
         Args:
             path: API endpoint path.
             json: JSON body data.
+            content: Pre-serialized JSON body bytes (see ``_serialize_body``).
             data: Form data.
             params: Query parameters.
             idempotency_key: Optional idempotency key for safe retries.
@@ -549,6 +801,7 @@ class SyncBaseService:
             "PATCH",
             path,
             json=json,
+            content=content,
             data=data,
             params=params,
             headers=self._build_idempotency_headers(idempotency_key),
@@ -567,13 +820,18 @@ class SyncBaseService:
         return self._request("DELETE", path, params=params)
 
     def _post_file(
-        self, path: str, *, file: tuple[str, bytes, str], idempotency_key: str | None = None
+        self,
+        path: str,
+        *,
+        file: tuple[str, bytes | BinaryIO, str],
+        idempotency_key: str | None = None,
     ) -> httpx2.Response:
         """Make a POST request with a file upload (multipart/form-data).
 
         Args:
             path: API endpoint path.
-            file: Tuple of (filename, content, content_type) for the file to upload.
+            file: Tuple of (filename, content, content_type) for the file to upload. A file
+                object is streamed by httpx2 and rewound before each retry.
             idempotency_key: Optional idempotency key for safe retries.
 
         Returns:
@@ -593,7 +851,11 @@ class SyncBaseService:
         )
 
     def _put_file(
-        self, path: str, *, file: tuple[str, bytes, str], idempotency_key: str | None = None
+        self,
+        path: str,
+        *,
+        file: tuple[str, bytes | BinaryIO, str],
+        idempotency_key: str | None = None,
     ) -> httpx2.Response:
         """Make a PUT request with a file upload (multipart/form-data).
 
@@ -601,7 +863,8 @@ class SyncBaseService:
 
         Args:
             path: API endpoint path.
-            file: Tuple of (filename, content, content_type) for the file to upload.
+            file: Tuple of (filename, content, content_type) for the file to upload. A file
+                object is streamed by httpx2 and rewound before each retry.
             idempotency_key: Optional idempotency key for safe retries.
 
         Returns:
@@ -620,6 +883,23 @@ class SyncBaseService:
             headers=self._build_idempotency_headers(idempotency_key),
         )
 
+    @staticmethod
+    def _build_page_params(
+        limit: int, offset: int, params: dict[str, Any] | None, max_limit: int
+    ) -> dict[str, Any]:
+        """Build the query params for a single page request.
+
+        Args:
+            limit: Requested page size, clamped to ``0..max_limit``.
+            offset: Number of items to skip, clamped to be non-negative.
+            params: Additional query parameters.
+            max_limit: Upper bound the limit is clamped to.
+
+        Returns:
+            The merged query params.
+        """
+        return {"limit": min(max(limit, 0), max_limit), "offset": max(offset, 0), **(params or {})}
+
     def _get_paginated(
         self,
         path: str,
@@ -642,13 +922,8 @@ class SyncBaseService:
         Returns:
             A PaginatedResponse containing the items and pagination metadata.
         """
-        request_params = {
-            "limit": min(max(limit, 0), max_limit),
-            "offset": max(offset, 0),
-            **(params or {}),
-        }
-        response = self._get(path, params=request_params)
-        return PaginatedResponse.from_dict(response.json())
+        response = self._get(path, params=self._build_page_params(limit, offset, params, max_limit))
+        return PaginatedResponse.from_dict(from_json(response.content))
 
     def _get_paginated_as(
         self,
@@ -674,14 +949,9 @@ class SyncBaseService:
         Returns:
             A PaginatedResponse containing validated model instances.
         """
-        response = self._get_paginated(
-            path, limit=limit, offset=offset, params=params, max_limit=max_limit
-        )
-        return PaginatedResponse(
-            items=[model_class.model_validate(item) for item in response.items],
-            limit=response.limit,
-            offset=response.offset,
-            total=response.total,
+        response = self._get(path, params=self._build_page_params(limit, offset, params, max_limit))
+        return PaginatedResponse.from_dict(
+            _page_adapter(model_class).validate_json(response.content)
         )
 
     def _iter_all_pages(
@@ -752,3 +1022,122 @@ class SyncBaseService:
             item
             for item in self._iter_all_pages(path, limit=limit, params=params, max_limit=max_limit)
         ]
+
+    def _iter_all_pages_as(
+        self,
+        path: str,
+        model_class: type[T],
+        *,
+        limit: int = MAX_PAGE_LIMIT,
+        params: dict[str, Any] | None = None,
+        max_limit: int = MAX_PAGE_LIMIT,
+    ) -> Iterator[T]:
+        """Iterate through all pages of a paginated endpoint, parsing items into a model.
+
+        Shared implementation behind the services' ``iter_all*`` methods so every
+        paginated listing validates items through a single code path.
+
+        Args:
+            path: API endpoint path.
+            model_class: Pydantic model class to validate each item into.
+            limit: Items per page (default 100 for efficiency).
+            params: Additional query parameters.
+            max_limit: Upper bound the per-page limit is clamped to (default 100).
+                Reference/catalog endpoints pass a higher bound (MAX_REFERENCE_PAGE_LIMIT).
+
+        Yields:
+            Validated model instances from each page.
+        """
+        for page in self._iter_pages_as(
+            path, model_class, limit=limit, params=params, max_limit=max_limit
+        ):
+            for item in page:
+                yield item
+
+    def _iter_pages_as(
+        self,
+        path: str,
+        model_class: type[T],
+        *,
+        limit: int = MAX_PAGE_LIMIT,
+        params: dict[str, Any] | None = None,
+        max_limit: int = MAX_PAGE_LIMIT,
+    ) -> Iterator[list[T]]:
+        """Iterate through a paginated endpoint one validated page at a time.
+
+        Args:
+            path: API endpoint path.
+            model_class: Pydantic model class to validate each item into.
+            limit: Items per page (default 100 for efficiency).
+            params: Additional query parameters.
+            max_limit: Upper bound the per-page limit is clamped to (default 100).
+                Reference/catalog endpoints pass a higher bound (MAX_REFERENCE_PAGE_LIMIT).
+
+        Yields:
+            The validated items of each page, in order.
+        """
+        offset = 0
+        while True:
+            page = self._get_paginated_as(
+                path, model_class, limit=limit, offset=offset, params=params, max_limit=max_limit
+            )
+            yield page.items
+            if not page.has_more:
+                break
+            offset = page.next_offset
+
+    def _get_all_as(
+        self,
+        path: str,
+        model_class: type[T],
+        *,
+        limit: int = MAX_PAGE_LIMIT,
+        params: dict[str, Any] | None = None,
+        max_limit: int = MAX_PAGE_LIMIT,
+    ) -> list[T]:
+        """Fetch all items from a paginated endpoint, parsing them into a model.
+
+        Shared implementation behind the services' ``list_all*`` methods. The first page
+        reports the total, so the remaining pages are requested concurrently in batches
+        of the client's ``page_fetch_concurrency`` (1 fetches them one at a time) and
+        reassembled in offset order. Each request keeps its own 429 retry and backoff,
+        so a smaller batch only lowers the burst sent at once. A failed page fetch
+        cancels the rest of its batch and is re-raised. The sync client requests them one
+        after another.
+
+        Args:
+            path: API endpoint path.
+            model_class: Pydantic model class to validate each item into.
+            limit: Items per page (default 100 for efficiency).
+            params: Additional query parameters.
+            max_limit: Upper bound the per-page limit is clamped to (default 100).
+                Reference/catalog endpoints pass a higher bound (MAX_REFERENCE_PAGE_LIMIT).
+
+        Returns:
+            A list of validated model instances from all pages.
+        """
+        page = self._get_paginated_as(
+            path, model_class, limit=limit, params=params, max_limit=max_limit
+        )
+        items = page.items
+        concurrency = max(self._client._config.page_fetch_concurrency, 1)
+        while page.has_more and page.limit > 0:
+            offsets = range(page.next_offset, max(page.total, page.next_offset + 1), page.limit)
+            pages = run_sequentially(
+                (
+                    self._get_paginated_as(
+                        path,
+                        model_class,
+                        limit=limit,
+                        offset=offset,
+                        params=params,
+                        max_limit=max_limit,
+                    )
+                    for offset in offsets[:concurrency]
+                ),
+                concurrency,
+            )
+            for fetched in pages:
+                items.extend(fetched.items)
+            page = pages[-1]
+        return items
@@ -3,7 +3,7 @@
 
 import mimetypes
 from collections.abc import Iterator, Sequence
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, BinaryIO
 
 from vclient._sync.services.base import SyncBaseService
 from vclient.constants import DEFAULT_PAGE_LIMIT, ChapterInclude
@@ -106,7 +106,7 @@ class SyncChaptersService(SyncBaseService):
             self._format_endpoint(Endpoints.BOOK_CHAPTER, chapter_id=chapter_id),
             params=self._build_params(include=list(include) if include else None),
         )
-        return CampaignChapterDetail.model_validate(response.json())
+        return CampaignChapterDetail.model_validate_json(response.content)
 
     def create(self, request: ChapterCreate | None = None, **kwargs) -> CampaignChapter:
         """Create a new campaign book chapter.
@@ -121,7 +121,7 @@ class SyncChaptersService(SyncBaseService):
             self._format_endpoint(Endpoints.BOOK_CHAPTERS),
             json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
         )
-        return CampaignChapter.model_validate(response.json())
+        return CampaignChapter.model_validate_json(response.content)
 
     def update(
         self, chapter_id: str, request: ChapterUpdate | None = None, **kwargs
@@ -139,7 +139,7 @@ class SyncChaptersService(SyncBaseService):
             self._format_endpoint(Endpoints.BOOK_CHAPTER, chapter_id=chapter_id),
             json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
         )
-        return CampaignChapter.model_validate(response.json())
+        return CampaignChapter.model_validate_json(response.content)
 
     def delete(self, chapter_id: str) -> None:
         """Delete a campaign book chapter."""
@@ -153,7 +153,7 @@ class SyncChaptersService(SyncBaseService):
                 exclude_none=True, exclude_unset=True, mode="json"
             ),
         )
-        return CampaignChapter.model_validate(response.json())
+        return CampaignChapter.model_validate_json(response.content)
 
     def get_notes_page(
         self, chapter_id: str, *, limit: int = DEFAULT_PAGE_LIMIT, offset: int = 0
@@ -238,7 +238,7 @@ class SyncChaptersService(SyncBaseService):
                 Endpoints.BOOK_CHAPTER_NOTE, chapter_id=chapter_id, note_id=note_id
             )
         )
-        return Note.model_validate(response.json())
+        return Note.model_validate_json(response.content)
 
     def create_note(self, chapter_id: str, request: NoteCreate | None = None, **kwargs) -> Note:
         """Create a new note for a chapter.
@@ -265,7 +265,7 @@ class SyncChaptersService(SyncBaseService):
             self._format_endpoint(Endpoints.BOOK_CHAPTER_NOTES, chapter_id=chapter_id),
             json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
         )
-        return Note.model_validate(response.json())
+        return Note.model_validate_json(response.content)
 
     def update_note(
         self, chapter_id: str, note_id: str, request: NoteUpdate | None = None, **kwargs
@@ -297,7 +297,7 @@ class SyncChaptersService(SyncBaseService):
             ),
             json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
         )
-        return Note.model_validate(response.json())
+        return Note.model_validate_json(response.content)
 
     def delete_note(self, chapter_id: str, note_id: str) -> None:
         """Remove a note from a chapter.
@@ -401,10 +401,14 @@ class SyncChaptersService(SyncBaseService):
                 Endpoints.BOOK_CHAPTER_ASSET, chapter_id=chapter_id, asset_id=asset_id
             )
         )
-        return Asset.model_validate(response.json())
+        return Asset.model_validate_json(response.content)
 
     def upload_asset(
-        self, chapter_id: str, filename: str, content: bytes, content_type: str | None = None
+        self,
+        chapter_id: str,
+        filename: str,
+        content: bytes | BinaryIO,
+        content_type: str | None = None,
     ) -> Asset:
         """Upload a new image asset for a chapter.
 
@@ -421,7 +425,8 @@ class SyncChaptersService(SyncBaseService):
         Args:
             chapter_id: The ID of the chapter to upload the asset for.
             filename: The original filename of the asset.
-            content: The raw bytes of the file to upload.
+            content: The raw bytes of the file to upload, or a binary file object,
+                which is streamed in chunks rather than read into memory.
             content_type: The MIME type of the file. If not provided, inferred from filename.
 
         Returns:
@@ -438,7 +443,7 @@ class SyncChaptersService(SyncBaseService):
             self._format_endpoint(Endpoints.BOOK_CHAPTER_ASSET_UPLOAD, chapter_id=chapter_id),
             file=(filename, content, content_type),
         )
-        return Asset.model_validate(response.json())
+        return Asset.model_validate_json(response.content)
 
     def delete_asset(self, chapter_id: str, asset_id: str) -> None:
         """Delete an asset from a chapter.
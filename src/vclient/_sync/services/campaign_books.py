@@ -3,7 +3,7 @@
 
 import mimetypes
 from collections.abc import Iterator, Sequence
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, BinaryIO
 
 from vclient._sync.services.base import SyncBaseService
 from vclient.constants import DEFAULT_PAGE_LIMIT, BookInclude
@@ -136,7 +136,7 @@ class SyncBooksService(SyncBaseService):
             self._format_endpoint(Endpoints.CAMPAIGN_BOOK, book_id=book_id),
             params=self._build_params(include=list(include) if include else None),
         )
-        return CampaignBookDetail.model_validate(response.json())
+        return CampaignBookDetail.model_validate_json(response.content)
 
     def create(self, request: BookCreate | None = None, **kwargs) -> CampaignBook:
         """Create a new campaign book.
@@ -159,7 +159,7 @@ class SyncBooksService(SyncBaseService):
             self._format_endpoint(Endpoints.CAMPAIGN_BOOKS),
             json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
         )
-        return CampaignBook.model_validate(response.json())
+        return CampaignBook.model_validate_json(response.content)
 
     def update(self, book_id: str, request: BookUpdate | None = None, **kwargs) -> CampaignBook:
         """Modify a campaign book's properties.
@@ -186,7 +186,7 @@ class SyncBooksService(SyncBaseService):
             self._format_endpoint(Endpoints.CAMPAIGN_BOOK, book_id=book_id),
             json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
         )
-        return CampaignBook.model_validate(response.json())
+        return CampaignBook.model_validate_json(response.content)
 
     def delete(self, book_id: str) -> None:
         """Remove a campaign book from the system.
@@ -227,7 +227,7 @@ class SyncBooksService(SyncBaseService):
             self._format_endpoint(Endpoints.CAMPAIGN_BOOK_NUMBER, book_id=book_id),
             json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
         )
-        return CampaignBook.model_validate(response.json())
+        return CampaignBook.model_validate_json(response.content)
 
     def get_notes_page(
         self, book_id: str, *, limit: int = DEFAULT_PAGE_LIMIT, offset: int = 0
@@ -310,7 +310,7 @@ class SyncBooksService(SyncBaseService):
         response = self._get(
             self._format_endpoint(Endpoints.BOOK_NOTE, book_id=book_id, note_id=note_id)
         )
-        return Note.model_validate(response.json())
+        return Note.model_validate_json(response.content)
 
     def create_note(self, book_id: str, request: NoteCreate | None = None, **kwargs) -> Note:
         """Create a new note for a book.
@@ -337,7 +337,7 @@ class SyncBooksService(SyncBaseService):
             self._format_endpoint(Endpoints.BOOK_NOTES, book_id=book_id),
             json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
         )
-        return Note.model_validate(response.json())
+        return Note.model_validate_json(response.content)
 
     def update_note(
         self, book_id: str, note_id: str, request: NoteUpdate | None = None, **kwargs
@@ -367,7 +367,7 @@ class SyncBooksService(SyncBaseService):
             self._format_endpoint(Endpoints.BOOK_NOTE, book_id=book_id, note_id=note_id),
             json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
         )
-        return Note.model_validate(response.json())
+        return Note.model_validate_json(response.content)
 
     def delete_note(self, book_id: str, note_id: str) -> None:
         """Remove a note from a book.
@@ -465,10 +465,14 @@ class SyncBooksService(SyncBaseService):
         response = self._get(
             self._format_endpoint(Endpoints.BOOK_ASSET, book_id=book_id, asset_id=asset_id)
         )
-        return Asset.model_validate(response.json())
+        return Asset.model_validate_json(response.content)
 
     def upload_asset(
-        self, book_id: str, filename: str, content: bytes, content_type: str | None = None
+        self,
+        book_id: str,
+        filename: str,
+        content: bytes | BinaryIO,
+        content_type: str | None = None,
     ) -> Asset:
         """Upload a new image asset for a book.
 
@@ -485,7 +489,8 @@ class SyncBooksService(SyncBaseService):
         Args:
             book_id: The ID of the book to upload the asset for.
             filename: The original filename of the asset.
-            content: The raw bytes of the file to upload.
+            content: The raw bytes of the file to upload, or a binary file object,
+                which is streamed in chunks rather than read into memory.
             content_type: The MIME type of the file. If not provided, inferred from filename.
 
         Returns:
@@ -502,7 +507,7 @@ class SyncBooksService(SyncBaseService):
             self._format_endpoint(Endpoints.BOOK_ASSET_UPLOAD, book_id=book_id),
             file=(filename, content, content_type),
         )
-        return Asset.model_validate(response.json())
+        return Asset.model_validate_json(response.content)
 
     def delete_asset(self, book_id: str, asset_id: str) -> None:
         """Delete an asset from a book.
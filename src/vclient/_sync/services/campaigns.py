@@ -3,7 +3,7 @@
 
 import mimetypes
 from collections.abc import Iterator
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, BinaryIO
 
 from vclient._sync.services.base import SyncBaseService
 from vclient.constants import DEFAULT_PAGE_LIMIT
@@ -118,7 +118,7 @@ class SyncCampaignsService(SyncBaseService):
             AuthorizationError: If you don't have access.
         """
         response = self._get(self._format_endpoint(Endpoints.CAMPAIGN, campaign_id=campaign_id))
-        return Campaign.model_validate(response.json())
+        return Campaign.model_validate_json(response.content)
 
     def create(self, request: CampaignCreate | None = None, **kwargs) -> Campaign:
         """Create a new campaign.
@@ -143,7 +143,7 @@ class SyncCampaignsService(SyncBaseService):
             self._format_endpoint(Endpoints.CAMPAIGNS),
             json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
         )
-        return Campaign.model_validate(response.json())
+        return Campaign.model_validate_json(response.content)
 
     def update(self, campaign_id: str, request: CampaignUpdate | None = None, **kwargs) -> Campaign:
         """Modify a campaign's properties.
@@ -174,7 +174,7 @@ class SyncCampaignsService(SyncBaseService):
         response = self._patch(
             self._format_endpoint(Endpoints.CAMPAIGN, campaign_id=campaign_id), json=payload
         )
-        return Campaign.model_validate(response.json())
+        return Campaign.model_validate_json(response.content)
 
     def delete(self, campaign_id: str) -> None:
         """Remove a campaign from the system.
@@ -211,7 +211,7 @@ class SyncCampaignsService(SyncBaseService):
             self._format_endpoint(Endpoints.CAMPAIGN_STATISTICS, campaign_id=campaign_id),
             params={"num_top_traits": num_top_traits},
         )
-        return RollStatistics.model_validate(response.json())
+        return RollStatistics.model_validate_json(response.content)
 
     def get_assets_page(
         self, campaign_id: str, *, limit: int = DEFAULT_PAGE_LIMIT, offset: int = 0
@@ -296,7 +296,7 @@ class SyncCampaignsService(SyncBaseService):
                 Endpoints.CAMPAIGN_ASSET, campaign_id=campaign_id, asset_id=asset_id
             )
         )
-        return Asset.model_validate(response.json())
+        return Asset.model_validate_json(response.content)
 
     def delete_asset(self, campaign_id: str, asset_id: str) -> None:
         """Delete an asset from a campaign.
@@ -318,7 +318,11 @@ class SyncCampaignsService(SyncBaseService):
         )
 
     def upload_asset(
-        self, campaign_id: str, filename: str, content: bytes, content_type: str | None = None
+        self,
+        campaign_id: str,
+        filename: str,
+        content: bytes | BinaryIO,
+        content_type: str | None = None,
     ) -> Asset:
         """Upload a new image asset for a campaign.
 
@@ -335,7 +339,8 @@ class SyncCampaignsService(SyncBaseService):
         Args:
             campaign_id: The ID of the campaign to upload the asset for.
             filename: The original filename of the asset.
-            content: The raw bytes of the file to upload.
+            content: The raw bytes of the file to upload, or a binary file object,
+                which is streamed in chunks rather than read into memory.
             content_type: The MIME type of the file. If not provided, inferred from filename.
 
         Returns:
@@ -352,7 +357,7 @@ class SyncCampaignsService(SyncBaseService):
             self._format_endpoint(Endpoints.CAMPAIGN_ASSET_UPLOAD, campaign_id=campaign_id),
             file=(filename, content, content_type),
         )
-        return Asset.model_validate(response.json())
+        return Asset.model_validate_json(response.content)
 
     def get_notes_page(
         self, campaign_id: str, *, limit: int = DEFAULT_PAGE_LIMIT, offset: int = 0
@@ -435,7 +440,7 @@ class SyncCampaignsService(SyncBaseService):
         response = self._get(
             self._format_endpoint(Endpoints.CAMPAIGN_NOTE, campaign_id=campaign_id, note_id=note_id)
         )
-        return Note.model_validate(response.json())
+        return Note.model_validate_json(response.content)
 
     def create_note(self, campaign_id: str, request: NoteCreate | None = None, **kwargs) -> Note:
         """Create a new note for a campaign.
@@ -462,7 +467,7 @@ class SyncCampaignsService(SyncBaseService):
             self._format_endpoint(Endpoints.CAMPAIGN_NOTES, campaign_id=campaign_id),
             json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
         )
-        return Note.model_validate(response.json())
+        return Note.model_validate_json(response.content)
 
     def update_note(
         self, campaign_id: str, note_id: str, request: NoteUpdate | None = None, **kwargs
@@ -494,7 +499,7 @@ class SyncCampaignsService(SyncBaseService):
             ),
             json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
         )
-        return Note.model_validate(response.json())
+        return Note.model_validate_json(response.content)
 
     def delete_note(self, campaign_id: str, note_id: str) -> None:
         """Remove a note from a campaign.
@@ -86,7 +86,7 @@ class SyncCharacterAutogenService(SyncBaseService):
             json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
             params={"campaign_id": campaign_id},
         )
-        return Character.model_validate(response.json())
+        return Character.model_validate_json(response.content)
 
     def start_chargen_session(self, *, campaign_id: str) -> ChargenSessionResponse:
         """Start a chargen session.
@@ -100,7 +100,7 @@ class SyncCharacterAutogenService(SyncBaseService):
         response = self._post(
             self._format_endpoint(Endpoints.CHARGEN_START), params={"campaign_id": campaign_id}
         )
-        return ChargenSessionResponse.model_validate(response.json())
+        return ChargenSessionResponse.model_validate_json(response.content)
 
     def finalize_chargen_session(self, session_id: str, selected_character_id: str) -> Character:
         """Finalize a chargen session."""
@@ -113,7 +113,7 @@ class SyncCharacterAutogenService(SyncBaseService):
             self._format_endpoint(Endpoints.CHARGEN_FINALIZE),
             json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
         )
-        return Character.model_validate(response.json())
+        return Character.model_validate_json(response.content)
 
     def list_all(self) -> list[ChargenSessionResponse]:
         """List all chargen sessions for the current campaign.
@@ -122,7 +122,7 @@ class SyncCharacterAutogenService(SyncBaseService):
             All chargen sessions associated with the current campaign.
         """
         response = self._get(self._format_endpoint(Endpoints.CHARGEN_SESSIONS))
-        return [ChargenSessionResponse.model_validate(item) for item in response.json()]
+        return self._validate_list(response, ChargenSessionResponse)
 
     def get(self, session_id: str) -> ChargenSessionResponse:
         """Retrieve a single chargen session by ID.
@@ -136,4 +136,4 @@ class SyncCharacterAutogenService(SyncBaseService):
         response = self._get(
             self._format_endpoint(Endpoints.CHARGEN_SESSION, session_id=session_id)
         )
-        return ChargenSessionResponse.model_validate(response.json())
+        return ChargenSessionResponse.model_validate_json(response.content)
@@ -102,7 +102,7 @@ class SyncCharacterBlueprintService(SyncBaseService):
         response = self._get(
             self._format_endpoint(Endpoints.BLUEPRINT_SECTION_DETAIL, section_id=section_id)
         )
-        return SheetSection.model_validate(response.json())
+        return SheetSection.model_validate_json(response.content)
 
     def get_categories_page(
         self,
@@ -163,7 +163,7 @@ class SyncCharacterBlueprintService(SyncBaseService):
         response = self._get(
             self._format_endpoint(Endpoints.BLUEPRINT_CATEGORY_DETAIL, category_id=category_id)
         )
-        return TraitCategory.model_validate(response.json())
+        return TraitCategory.model_validate_json(response.content)
 
     def get_subcategories_page(
         self,
@@ -226,7 +226,7 @@ class SyncCharacterBlueprintService(SyncBaseService):
                 Endpoints.BLUEPRINT_SUBCATEGORY_DETAIL, subcategory_id=subcategory_id
             )
         )
-        return TraitSubcategory.model_validate(response.json())
+        return TraitSubcategory.model_validate_json(response.content)
 
     def get_traits_page(
         self,
@@ -317,7 +317,7 @@ class SyncCharacterBlueprintService(SyncBaseService):
         response = self._get(
             self._format_endpoint(Endpoints.BLUEPRINT_TRAIT_DETAIL, trait_id=trait_id)
         )
-        return Trait.model_validate(response.json())
+        return Trait.model_validate_json(response.content)
 
     def get_concepts_page(
         self, *, limit: int = DEFAULT_PAGE_LIMIT, offset: int = 0
@@ -347,7 +347,7 @@ class SyncCharacterBlueprintService(SyncBaseService):
     def get_concept(self, *, concept_id: str) -> CharacterConcept:
         """Get a character concept by ID."""
         response = self._get(self._format_endpoint(Endpoints.CONCEPT_DETAIL, concept_id=concept_id))
-        return CharacterConcept.model_validate(response.json())
+        return CharacterConcept.model_validate_json(response.content)
 
     def get_vampire_clans_page(
         self,
@@ -389,7 +389,7 @@ class SyncCharacterBlueprintService(SyncBaseService):
         response = self._get(
             self._format_endpoint(Endpoints.VAMPIRE_CLAN_DETAIL, vampire_clan_id=vampire_clan_id)
         )
-        return VampireClan.model_validate(response.json())
+        return VampireClan.model_validate_json(response.content)
 
     def get_werewolf_auspices_page(
         self,
@@ -433,7 +433,7 @@ class SyncCharacterBlueprintService(SyncBaseService):
                 Endpoints.WEREWOLF_AUSPICE_DETAIL, werewolf_auspice_id=werewolf_auspice_id
             )
         )
-        return WerewolfAuspice.model_validate(response.json())
+        return WerewolfAuspice.model_validate_json(response.content)
 
     def get_werewolf_tribes_page(
         self,
@@ -477,4 +477,4 @@ class SyncCharacterBlueprintService(SyncBaseService):
                 Endpoints.WEREWOLF_TRIBE_DETAIL, werewolf_tribe_id=werewolf_tribe_id
             )
         )
-        return WerewolfTribe.model_validate(response.json())
+        return WerewolfTribe.model_validate_json(response.content)
@@ -135,7 +135,7 @@ class SyncCharacterTraitsService(SyncBaseService):
         response = self._get(
             self._format_endpoint(Endpoints.CHARACTER_TRAIT, character_trait_id=character_trait_id)
         )
-        return CharacterTrait.model_validate(response.json())
+        return CharacterTrait.model_validate_json(response.content)
 
     def delete(self, character_trait_id: str, currency: TraitModifyCurrency | None = None) -> None:
         """Delete a character trait.
@@ -185,7 +185,7 @@ class SyncCharacterTraitsService(SyncBaseService):
             self._format_endpoint(Endpoints.CHARACTER_TRAIT_ASSIGN),
             json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
         )
-        return CharacterTrait.model_validate(response.json())
+        return CharacterTrait.model_validate_json(response.content)
 
     def bulk_assign(self, items: list[CharacterTraitAdd]) -> BulkAssignTraitResponse:
         """Assign multiple traits to a character in a single request.
@@ -208,7 +208,7 @@ class SyncCharacterTraitsService(SyncBaseService):
                 for item in items
             ],
         )
-        return BulkAssignTraitResponse.model_validate(response.json())
+        return BulkAssignTraitResponse.model_validate_json(response.content)
 
     def create(self, request: TraitCreate | None = None, **kwargs) -> CharacterTrait:
         """Create a new custom character trait.
@@ -231,7 +231,7 @@ class SyncCharacterTraitsService(SyncBaseService):
             self._format_endpoint(Endpoints.CHARACTER_TRAIT_CREATE),
             json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
         )
-        return CharacterTrait.model_validate(response.json())
+        return CharacterTrait.model_validate_json(response.content)
 
     def get_value_options(self, character_trait_id: str) -> CharacterTraitValueOptionsResponse:
         """Get the value options for a character trait.
@@ -253,7 +253,7 @@ class SyncCharacterTraitsService(SyncBaseService):
                 Endpoints.CHARACTER_TRAIT_VALUE_OPTIONS, character_trait_id=character_trait_id
             )
         )
-        return CharacterTraitValueOptionsResponse.model_validate(response.json())
+        return CharacterTraitValueOptionsResponse.model_validate_json(response.content)
 
     def change_value(
         self, character_trait_id: str, new_value: int, currency: TraitModifyCurrency
@@ -272,4 +272,4 @@ class SyncCharacterTraitsService(SyncBaseService):
             ),
             json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
         )
-        return CharacterTrait.model_validate(response.json())
+        return CharacterTrait.model_validate_json(response.content)
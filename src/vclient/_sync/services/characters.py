@@ -2,11 +2,13 @@
 """Service for interacting with the Characters API."""
 
 import mimetypes
-from collections.abc import Iterator, Sequence
-from typing import TYPE_CHECKING
+from collections.abc import Iterable, Iterator, Sequence
+from typing import TYPE_CHECKING, BinaryIO
 
+from vclient._concurrency import run_sequentially
 from vclient._sync.services.base import SyncBaseService
 from vclient.constants import (
+    BULK_REQUEST_CONCURRENCY,
     DEFAULT_PAGE_LIMIT,
     CharacterClass,
     CharacterInclude,
@@ -140,9 +142,10 @@ class SyncCharactersService(SyncBaseService):
         Returns:
             A list of all Character objects.
         """
-        return [
-            character
-            for character in self.iter_all(
+        return self._get_all_as(
+            self._format_endpoint(Endpoints.CHARACTERS),
+            Character,
+            params=self._build_params(
                 campaign_id=campaign_id,
                 user_player_id=user_player_id,
                 user_creator_id=user_creator_id,
@@ -150,8 +153,8 @@ class SyncCharactersService(SyncBaseService):
                 character_type=character_type,
                 status=status,
                 is_temporary=is_temporary,
-            )
-        ]
+            ),
+        )
 
     def iter_all(
         self,
@@ -187,8 +190,9 @@ class SyncCharactersService(SyncBaseService):
             >>> async for character in characters.iter_all():
             ...     print(character.name)
         """
-        for item in self._iter_all_pages(
+        for character in self._iter_all_pages_as(
             self._format_endpoint(Endpoints.CHARACTERS),
+            Character,
             limit=limit,
             params=self._build_params(
                 campaign_id=campaign_id,
@@ -200,7 +204,7 @@ class SyncCharactersService(SyncBaseService):
                 is_temporary=is_temporary,
             ),
         ):
-            yield Character.model_validate(item)
+            yield character
 
     def get(
         self, character_id: str, *, include: Sequence[CharacterInclude] | None = None
@@ -226,7 +230,7 @@ class SyncCharactersService(SyncBaseService):
             self._format_endpoint(Endpoints.CHARACTER, character_id=character_id),
             params=self._build_params(include=list(include) if include else None),
         )
-        return CharacterDetail.model_validate(response.json())
+        return CharacterDetail.model_validate_json(response.content)
 
     def create(self, request: CharacterCreate | None = None, **kwargs) -> Character:
         """Create a new character within the campaign.
@@ -255,10 +259,9 @@ class SyncCharactersService(SyncBaseService):
         """
         body = request if request is not None else self._validate_request(CharacterCreate, **kwargs)
         response = self._post(
-            self._format_endpoint(Endpoints.CHARACTERS),
-            json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
+            self._format_endpoint(Endpoints.CHARACTERS), content=self._serialize_body(body)
         )
-        return Character.model_validate(response.json())
+        return Character.model_validate_json(response.content)
 
     def update(
         self, character_id: str, request: CharacterUpdate | None = None, **kwargs
@@ -295,7 +298,7 @@ class SyncCharactersService(SyncBaseService):
         response = self._patch(
             self._format_endpoint(Endpoints.CHARACTER, character_id=character_id), json=payload
         )
-        return Character.model_validate(response.json())
+        return Character.model_validate_json(response.content)
 
     def delete(self, character_id: str) -> None:
         """Remove a character from the campaign.
@@ -333,7 +336,7 @@ class SyncCharactersService(SyncBaseService):
             self._format_endpoint(Endpoints.CHARACTER_STATISTICS, character_id=character_id),
             params={"num_top_traits": num_top_traits},
         )
-        return RollStatistics.model_validate(response.json())
+        return RollStatistics.model_validate_json(response.content)
 
     def get_full_sheet(
         self, character_id: str, *, include_available_traits: bool = False
@@ -361,7 +364,7 @@ class SyncCharactersService(SyncBaseService):
             self._format_endpoint(Endpoints.CHARACTER_FULL_SHEET, character_id=character_id),
             params=params,
         )
-        return CharacterFullSheet.model_validate(response.json())
+        return CharacterFullSheet.model_validate_json(response.content)
 
     def get_full_sheet_category(
         self, character_id: str, category_id: str, *, include_available_traits: bool = False
@@ -393,7 +396,7 @@ class SyncCharactersService(SyncBaseService):
             ),
             params=params,
         )
-        return FullSheetTraitCategory.model_validate(response.json())
+        return FullSheetTraitCategory.model_validate_json(response.content)
 
     def get_assets_page(
         self, character_id: str, *, limit: int = DEFAULT_PAGE_LIMIT, offset: int = 0
@@ -435,7 +438,9 @@ class SyncCharactersService(SyncBaseService):
             NotFoundError: If the character does not exist.
             AuthorizationError: If you don't have access.
         """
-        return [asset for asset in self.iter_all_assets(character_id)]
+        return self._get_all_as(
+            self._format_endpoint(Endpoints.CHARACTER_ASSETS, character_id=character_id), Asset
+        )
 
     def iter_all_assets(self, character_id: str, *, limit: int = 100) -> Iterator[Asset]:
         """Iterate through all assets for a character.
@@ -454,11 +459,12 @@ class SyncCharactersService(SyncBaseService):
             >>> async for asset in characters.iter_all_assets("character_id"):
             ...     print(asset.original_filename)
         """
-        for item in self._iter_all_pages(
+        for asset in self._iter_all_pages_as(
             self._format_endpoint(Endpoints.CHARACTER_ASSETS, character_id=character_id),
+            Asset,
             limit=limit,
         ):
-            yield Asset.model_validate(item)
+            yield asset
 
     def get_asset(self, character_id: str, asset_id: str) -> Asset:
         """Retrieve details of a specific asset including its URL and metadata.
@@ -479,7 +485,7 @@ class SyncCharactersService(SyncBaseService):
                 Endpoints.CHARACTER_ASSET, character_id=character_id, asset_id=asset_id
             )
         )
-        return Asset.model_validate(response.json())
+        return Asset.model_validate_json(response.content)
 
     def delete_asset(self, character_id: str, asset_id: str) -> None:
         """Delete an asset from a campaign.
@@ -501,7 +507,11 @@ class SyncCharactersService(SyncBaseService):
         )
 
     def upload_asset(
-        self, character_id: str, filename: str, content: bytes, content_type: str | None = None
+        self,
+        character_id: str,
+        filename: str,
+        content: bytes | BinaryIO,
+        content_type: str | None = None,
     ) -> Asset:
         """Upload a new image asset for a character.
 
@@ -518,7 +528,8 @@ class SyncCharactersService(SyncBaseService):
         Args:
             character_id: The ID of the character to upload the asset for.
             filename: The original filename of the asset.
-            content: The raw bytes of the file to upload.
+            content: The raw bytes of the file to upload, or a binary file object,
+                which is streamed in chunks rather than read into memory.
             content_type: The MIME type of the file. If not provided, inferred from filename.
 
         Returns:
@@ -535,7 +546,7 @@ class SyncCharactersService(SyncBaseService):
             self._format_endpoint(Endpoints.CHARACTER_ASSET_UPLOAD, character_id=character_id),
             file=(filename, content, content_type),
         )
-        return Asset.model_validate(response.json())
+        return Asset.model_validate_json(response.content)
 
     def get_notes_page(
         self, character_id: str, *, limit: int = DEFAULT_PAGE_LIMIT, offset: int = 0
@@ -577,7 +588,9 @@ class SyncCharactersService(SyncBaseService):
             NotFoundError: If the character does not exist.
             AuthorizationError: If you don't have access.
         """
-        return [note for note in self.iter_all_notes(character_id)]
+        return self._get_all_as(
+            self._format_endpoint(Endpoints.CHARACTER_NOTES, character_id=character_id), Note
+        )
 
     def iter_all_notes(self, character_id: str, *, limit: int = 100) -> Iterator[Note]:
         """Iterate through all notes for a character.
@@ -596,10 +609,12 @@ class SyncCharactersService(SyncBaseService):
             >>> async for note in characters.iter_all_notes("character_id"):
             ...     print(note.title)
         """
-        for item in self._iter_all_pages(
-            self._format_endpoint(Endpoints.CHARACTER_NOTES, character_id=character_id), limit=limit
+        for note in self._iter_all_pages_as(
+            self._format_endpoint(Endpoints.CHARACTER_NOTES, character_id=character_id),
+            Note,
+            limit=limit,
         ):
-            yield Note.model_validate(item)
+            yield note
 
     def get_note(self, character_id: str, note_id: str) -> Note:
         """Retrieve a specific note including its content and metadata.
@@ -620,7 +635,7 @@ class SyncCharactersService(SyncBaseService):
                 Endpoints.CHARACTER_NOTE, character_id=character_id, note_id=note_id
             )
         )
-        return Note.model_validate(response.json())
+        return Note.model_validate_json(response.content)
 
     def create_note(self, character_id: str, request: NoteCreate | None = None, **kwargs) -> Note:
         """Create a new note for a character.
@@ -645,9 +660,9 @@ class SyncCharactersService(SyncBaseService):
         body = request if request is not None else self._validate_request(NoteCreate, **kwargs)
         response = self._post(
             self._format_endpoint(Endpoints.CHARACTER_NOTES, character_id=character_id),
-            json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
+            content=self._serialize_body(body),
         )
-        return Note.model_validate(response.json())
+        return Note.model_validate_json(response.content)
 
     def update_note(
         self, character_id: str, note_id: str, request: NoteUpdate | None = None, **kwargs
@@ -677,9 +692,9 @@ class SyncCharactersService(SyncBaseService):
             self._format_endpoint(
                 Endpoints.CHARACTER_NOTE, character_id=character_id, note_id=note_id
             ),
-            json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
+            content=self._serialize_body(body),
         )
-        return Note.model_validate(response.json())
+        return Note.model_validate_json(response.content)
 
     def delete_note(self, character_id: str, note_id: str) -> None:
         """Remove a note from a character.
@@ -740,7 +755,10 @@ class SyncCharactersService(SyncBaseService):
             NotFoundError: If the character does not exist.
             AuthorizationError: If you don't have access.
         """
-        return [item for item in self.iter_all_inventory(character_id)]
+        return self._get_all_as(
+            self._format_endpoint(Endpoints.CHARACTER_INVENTORY, character_id=character_id),
+            InventoryItem,
+        )
 
     def iter_all_inventory(self, character_id: str, *, limit: int = 100) -> Iterator[InventoryItem]:
         """Iterate through all inventory items for a character.
@@ -759,11 +777,12 @@ class SyncCharactersService(SyncBaseService):
             >>> async for item in characters.iter_all_inventory("character_id"):
             ...     print(item.name)
         """
-        for item in self._iter_all_pages(
+        for item in self._iter_all_pages_as(
             self._format_endpoint(Endpoints.CHARACTER_INVENTORY, character_id=character_id),
+            InventoryItem,
             limit=limit,
         ):
-            yield InventoryItem.model_validate(item)
+            yield item
 
     def get_inventory_item(self, character_id: str, item_id: str) -> InventoryItem:
         """Retrieve a specific inventory item including its content and metadata.
@@ -784,7 +803,7 @@ class SyncCharactersService(SyncBaseService):
                 Endpoints.CHARACTER_INVENTORY_ITEM, character_id=character_id, item_id=item_id
             )
         )
-        return InventoryItem.model_validate(response.json())
+        return InventoryItem.model_validate_json(response.content)
 
     def create_inventory_item(
         self, character_id: str, request: InventoryItemCreate | None = None, **kwargs
@@ -814,9 +833,9 @@ class SyncCharactersService(SyncBaseService):
         )
         response = self._post(
             self._format_endpoint(Endpoints.CHARACTER_INVENTORY, character_id=character_id),
-            json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
+            content=self._serialize_body(body),
         )
-        return InventoryItem.model_validate(response.json())
+        return InventoryItem.model_validate_json(response.content)
 
     def update_inventory_item(
         self, character_id: str, item_id: str, request: InventoryItemUpdate | None = None, **kwargs
@@ -851,9 +870,9 @@ class SyncCharactersService(SyncBaseService):
             self._format_endpoint(
                 Endpoints.CHARACTER_INVENTORY_ITEM, character_id=character_id, item_id=item_id
             ),
-            json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
+            content=self._serialize_body(body),
         )
-        return InventoryItem.model_validate(response.json())
+        return InventoryItem.model_validate_json(response.content)
 
     def delete_inventory_item(self, character_id: str, item_id: str) -> None:
         """Remove an inventory item from a character.
@@ -873,3 +892,50 @@ class SyncCharactersService(SyncBaseService):
                 Endpoints.CHARACTER_INVENTORY_ITEM, character_id=character_id, item_id=item_id
             )
         )
+
+    def create_inventory_items(
+        self, character_id: str, items: Iterable[InventoryItemCreate]
+    ) -> list[InventoryItem]:
+        """Create several inventory items for a character concurrently.
+
+        At most ``BULK_REQUEST_CONCURRENCY`` requests are in flight at once. The first
+        failure cancels the requests still pending and is re-raised. The sync client
+        sends them one after another and stops at the first failure.
+
+        Args:
+            character_id: The ID of the character to create the inventory items for.
+            items: InventoryItemCreate models, one per item to create.
+
+        Returns:
+            The newly created InventoryItem objects, in the same order as ``items``.
+
+        Raises:
+            NotFoundError: If the character does not exist.
+            AuthorizationError: If you don't have appropriate access.
+            ValidationError: If any item is invalid. Items created before the failure are kept.
+        """
+        return run_sequentially(
+            (self.create_inventory_item(character_id, item) for item in items),
+            BULK_REQUEST_CONCURRENCY,
+        )
+
+    def delete_inventory_items(self, character_id: str, item_ids: Iterable[str]) -> None:
+        """Remove several inventory items from a character concurrently.
+
+        At most ``BULK_REQUEST_CONCURRENCY`` requests are in flight at once. The first
+        failure cancels the requests still pending and is re-raised. The sync client
+        sends them one after another and stops at the first failure.
+        This action cannot be undone.
+
+        Args:
+            character_id: The ID of the character that owns the inventory items.
+            item_ids: The IDs of the inventory items to delete.
+
+        Raises:
+            NotFoundError: If any inventory item does not exist. Items already deleted stay deleted.
+            AuthorizationError: If you don't have appropriate access.
+        """
+        run_sequentially(
+            (self.delete_inventory_item(character_id, item_id) for item_id in item_ids),
+            BULK_REQUEST_CONCURRENCY,
+        )
@@ -65,7 +65,7 @@ class SyncCompaniesService(SyncBaseService):
         Returns:
             A list of all Company objects.
         """
-        return [company for company in self.iter_all()]
+        return self._get_all_as(Endpoints.COMPANIES, Company)
 
     def iter_all(self, *, limit: int = 100) -> Iterator[Company]:
         """Iterate through all companies you have access to.
@@ -83,8 +83,8 @@ class SyncCompaniesService(SyncBaseService):
             >>> async for company in client.companies.iter_all():
             ...     print(company.name)
         """
-        for item in self._iter_all_pages(Endpoints.COMPANIES, limit=limit):
-            yield Company.model_validate(item)
+        for company in self._iter_all_pages_as(Endpoints.COMPANIES, Company, limit=limit):
+            yield company
 
     def get(self, company_id: str) -> Company:
         """Retrieve detailed information about a specific company.
@@ -102,7 +102,7 @@ class SyncCompaniesService(SyncBaseService):
             AuthorizationError: If you don't have access to the company.
         """
         response = self._get(Endpoints.COMPANY.format(company_id=company_id))
-        return Company.model_validate(response.json())
+        return Company.model_validate_json(response.content)
 
     def create(self, request: CompanyCreate | None = None, **kwargs) -> NewCompanyResponse:
         """Create a new company in the system.
@@ -125,11 +125,8 @@ class SyncCompaniesService(SyncBaseService):
             ValidationError: If the request data is invalid.
         """
         body = request if request is not None else self._validate_request(CompanyCreate, **kwargs)
-        response = self._post(
-            Endpoints.COMPANIES,
-            json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
-        )
-        return NewCompanyResponse.model_validate(response.json())
+        response = self._post(Endpoints.COMPANIES, content=self._serialize_body(body))
+        return NewCompanyResponse.model_validate_json(response.content)
 
     def update(self, company_id: str, request: CompanyUpdate | None = None, **kwargs) -> Company:
         """Modify a company's properties.
@@ -154,10 +151,9 @@ class SyncCompaniesService(SyncBaseService):
         """
         body = request if request is not None else self._validate_request(CompanyUpdate, **kwargs)
         response = self._patch(
-            Endpoints.COMPANY.format(company_id=company_id),
-            json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
+            Endpoints.COMPANY.format(company_id=company_id), content=self._serialize_body(body)
         )
-        return Company.model_validate(response.json())
+        return Company.model_validate_json(response.content)
 
     def delete(self, company_id: str) -> None:
         """Delete a company from the system.
@@ -200,9 +196,9 @@ class SyncCompaniesService(SyncBaseService):
         )
         response = self._post(
             Endpoints.COMPANY_ACCESS.format(company_id=company_id),
-            json=body.model_dump(mode="json"),
+            content=self._serialize_body(body),
         )
-        return CompanyPermissions.model_validate(response.json())
+        return CompanyPermissions.model_validate_json(response.content)
 
     def get_statistics(self, company_id: str, *, num_top_traits: int = 5) -> RollStatistics:
         """Retrieve aggregated dice roll statistics for a specific company.
@@ -225,7 +221,7 @@ class SyncCompaniesService(SyncBaseService):
             Endpoints.COMPANY_STATISTICS.format(company_id=company_id),
             params={"num_top_traits": num_top_traits},
         )
-        return RollStatistics.model_validate(response.json())
+        return RollStatistics.model_validate_json(response.content)
 
     def get_audit_log_page(
         self,
@@ -338,10 +334,11 @@ class SyncCompaniesService(SyncBaseService):
             NotFoundError: If the company does not exist.
             AuthorizationError: If you don't have access to the company.
         """
-        return [
-            log
-            for log in self.iter_all_audit_logs(
-                company_id,
+        model = AuditLogDetail if include and "request_details" in include else AuditLog
+        return self._get_all_as(
+            Endpoints.COMPANY_AUDIT_LOGS.format(company_id=company_id),
+            model,
+            params=_build_audit_params(
                 acting_user_id=acting_user_id,
                 user_id=user_id,
                 campaign_id=campaign_id,
@@ -353,8 +350,8 @@ class SyncCompaniesService(SyncBaseService):
                 date_from=date_from,
                 date_to=date_to,
                 include=include,
-            )
-        ]
+            ),
+        )
 
     def iter_all_audit_logs(
         self,
@@ -414,7 +411,10 @@ class SyncCompaniesService(SyncBaseService):
             date_to=date_to,
             include=include,
         )
-        for item in self._iter_all_pages(
-            Endpoints.COMPANY_AUDIT_LOGS.format(company_id=company_id), limit=limit, params=params
+        for log in self._iter_all_pages_as(
+            Endpoints.COMPANY_AUDIT_LOGS.format(company_id=company_id),
+            model,
+            limit=limit,
+            params=params,
         ):
-            yield model.model_validate(item)
+            yield log
@@ -31,7 +31,7 @@ class SyncDeveloperService(SyncBaseService):
             AuthenticationError: If the API key is invalid or missing.
         """
         response = self._get(Endpoints.DEVELOPER_ME)
-        return MeDeveloper.model_validate(response.json())
+        return MeDeveloper.model_validate_json(response.content)
 
     def update_me(self, request: MeDeveloperUpdate | None = None, **kwargs) -> MeDeveloper:
         """Update the current developer's profile.
@@ -55,11 +55,8 @@ class SyncDeveloperService(SyncBaseService):
         body = (
             request if request is not None else self._validate_request(MeDeveloperUpdate, **kwargs)
         )
-        response = self._patch(
-            Endpoints.DEVELOPER_ME,
-            json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
-        )
-        return MeDeveloper.model_validate(response.json())
+        response = self._patch(Endpoints.DEVELOPER_ME, content=self._serialize_body(body))
+        return MeDeveloper.model_validate_json(response.content)
 
     def regenerate_api_key(self) -> MeDeveloperWithApiKey:
         """Generate a new API key for the current developer.
@@ -76,4 +73,4 @@ class SyncDeveloperService(SyncBaseService):
             AuthenticationError: If the current API key is invalid.
         """
         response = self._post(Endpoints.DEVELOPER_ME_NEW_KEY)
-        return MeDeveloperWithApiKey.model_validate(response.json())
+        return MeDeveloperWithApiKey.model_validate_json(response.content)
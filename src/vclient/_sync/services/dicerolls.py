@@ -89,15 +89,16 @@ class SyncDicerollService(SyncBaseService):
         Returns:
             A list of all Diceroll objects.
         """
-        return [
-            diceroll
-            for diceroll in self.iter_all(
+        return self._get_all_as(
+            self._format_endpoint(Endpoints.DICEROLLS),
+            Diceroll,
+            params=self._build_params(
                 userid=userid,
                 characterid=characterid,
                 campaignid=campaignid,
                 character_type=character_type,
-            )
-        ]
+            ),
+        )
 
     def iter_all(
         self,
@@ -121,8 +122,9 @@ class SyncDicerollService(SyncBaseService):
         Yields:
             Individual Diceroll objects.
         """
-        for item in self._iter_all_pages(
+        for diceroll in self._iter_all_pages_as(
             self._format_endpoint(Endpoints.DICEROLLS),
+            Diceroll,
             limit=limit,
             params=self._build_params(
                 userid=userid,
@@ -131,12 +133,12 @@ class SyncDicerollService(SyncBaseService):
                 character_type=character_type,
             ),
         ):
-            yield Diceroll.model_validate(item)
+            yield diceroll
 
     def get(self, diceroll_id: str) -> Diceroll:
         """Retrieve a specific dice roll."""
         response = self._get(self._format_endpoint(Endpoints.DICEROLL, diceroll_id=diceroll_id))
-        return Diceroll.model_validate(response.json())
+        return Diceroll.model_validate_json(response.content)
 
     def create(self, request: DicerollCreate | None = None, **kwargs) -> Diceroll:
         """Create a new dice roll.
@@ -151,10 +153,9 @@ class SyncDicerollService(SyncBaseService):
         """
         body = request if request is not None else DicerollCreate(**kwargs)
         response = self._post(
-            self._format_endpoint(Endpoints.DICEROLLS),
-            json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
+            self._format_endpoint(Endpoints.DICEROLLS), content=self._serialize_body(body)
         )
-        return Diceroll.model_validate(response.json())
+        return Diceroll.model_validate_json(response.content)
 
     def create_from_quickroll(
         self,
@@ -168,12 +169,14 @@ class SyncDicerollService(SyncBaseService):
         """Create a new dice roll using a quickroll template."""
         response = self._post(
             self._format_endpoint(Endpoints.DICEROLL_QUICKROLL),
-            json=_DicerollQuickrollCreate(
-                quickroll_id=quickroll_id,
-                character_id=character_id,
-                comment=comment,
-                difficulty=difficulty,
-                num_desperation_dice=num_desperation_dice,
-            ).model_dump(exclude_none=True, exclude_unset=True, mode="json"),
+            content=self._serialize_body(
+                _DicerollQuickrollCreate(
+                    quickroll_id=quickroll_id,
+                    character_id=character_id,
+                    comment=comment,
+                    difficulty=difficulty,
+                    num_desperation_dice=num_desperation_dice,
+                )
+            ),
         )
-        return Diceroll.model_validate(response.json())
+        return Diceroll.model_validate_json(response.content)
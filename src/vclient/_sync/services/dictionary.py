@@ -1,11 +1,12 @@
 # AUTO-GENERATED — do not edit. Run 'uv run duty generate_sync' to regenerate.
 """Service for interacting with the Dictionary API."""
 
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from typing import TYPE_CHECKING
 
+from vclient._concurrency import run_sequentially
 from vclient._sync.services.base import SyncBaseService
-from vclient.constants import DEFAULT_PAGE_LIMIT, MAX_REFERENCE_PAGE_LIMIT
+from vclient.constants import BULK_REQUEST_CONCURRENCY, DEFAULT_PAGE_LIMIT, MAX_REFERENCE_PAGE_LIMIT
 from vclient.endpoints import Endpoints
 from vclient.models import (
     DictionaryTerm,
@@ -54,24 +55,31 @@ class SyncDictionaryService(SyncBaseService):
 
     def list_all(self, *, term: str | None = None) -> list[DictionaryTerm]:
         """Retrieve all dictionary terms."""
-        return [term for term in self.iter_all(term=term)]
+        return self._get_all_as(
+            self._format_endpoint(Endpoints.DICTIONARY_TERMS),
+            DictionaryTerm,
+            limit=MAX_REFERENCE_PAGE_LIMIT,
+            max_limit=MAX_REFERENCE_PAGE_LIMIT,
+            params=self._build_params(term=term),
+        )
 
     def iter_all(
         self, *, term: str | None = None, limit: int = MAX_REFERENCE_PAGE_LIMIT
     ) -> Iterator[DictionaryTerm]:
         """Iterate through all dictionary terms."""
-        for item in self._iter_all_pages(
+        for dictionary_term in self._iter_all_pages_as(
             self._format_endpoint(Endpoints.DICTIONARY_TERMS),
+            DictionaryTerm,
             limit=limit,
             max_limit=MAX_REFERENCE_PAGE_LIMIT,
             params=self._build_params(term=term),
         ):
-            yield DictionaryTerm.model_validate(item)
+            yield dictionary_term
 
     def get(self, term_id: str) -> DictionaryTerm:
         """Retrieve a specific dictionary term."""
         response = self._get(self._format_endpoint(Endpoints.DICTIONARY_TERM, term_id=term_id))
-        return DictionaryTerm.model_validate(response.json())
+        return DictionaryTerm.model_validate_json(response.content)
 
     def create(self, request: DictionaryTermCreate | None = None, **kwargs) -> DictionaryTerm:
         """Create a new dictionary term.
@@ -84,10 +92,27 @@ class SyncDictionaryService(SyncBaseService):
         """
         body = request if request is not None else DictionaryTermCreate(**kwargs)
         response = self._post(
-            self._format_endpoint(Endpoints.DICTIONARY_TERMS),
-            json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
+            self._format_endpoint(Endpoints.DICTIONARY_TERMS), content=self._serialize_body(body)
+        )
+        return DictionaryTerm.model_validate_json(response.content)
+
+    def create_many(self, requests: Iterable[DictionaryTermCreate]) -> list[DictionaryTerm]:
+        """Create several dictionary terms concurrently.
+
+        At most ``BULK_REQUEST_CONCURRENCY`` requests are in flight at once. The first
+        failure cancels the requests still pending and is re-raised; terms created before
+        it are kept. The sync client sends them one after another and stops at the first
+        failure.
+
+        Args:
+            requests: DictionaryTermCreate models, one per term to create.
+
+        Returns:
+            The newly created DictionaryTerm objects, in the same order as ``requests``.
+        """
+        return run_sequentially(
+            (self.create(request) for request in requests), BULK_REQUEST_CONCURRENCY
         )
-        return DictionaryTerm.model_validate(response.json())
 
     def update(
         self, term_id: str, request: DictionaryTermUpdate | None = None, **kwargs
@@ -104,9 +129,9 @@ class SyncDictionaryService(SyncBaseService):
         body = request if request is not None else DictionaryTermUpdate(**kwargs)
         response = self._patch(
             self._format_endpoint(Endpoints.DICTIONARY_TERM, term_id=term_id),
-            json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
+            content=self._serialize_body(body),
         )
-        return DictionaryTerm.model_validate(response.json())
+        return DictionaryTerm.model_validate_json(response.content)
 
     def delete(self, term_id: str) -> None:
         """Delete a specific dictionary term."""
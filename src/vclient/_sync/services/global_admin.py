@@ -2,11 +2,13 @@
 """Service for interacting with the Global Admin API."""
 
 import re
-from collections.abc import Iterator, Sequence
+from collections.abc import Iterable, Iterator, Sequence
 from datetime import datetime
 
+from vclient._concurrency import run_sequentially
 from vclient._sync.services.base import SyncBaseService
 from vclient.constants import (
+    BULK_REQUEST_CONCURRENCY,
     DEFAULT_LOG_TAIL_LIMIT,
     DEFAULT_PAGE_LIMIT,
     MAX_LOG_TAIL_LIMIT,
@@ -106,9 +108,11 @@ class SyncGlobalAdminService(SyncBaseService):
         Returns:
             A list of all Developer objects.
         """
-        return [
-            developer for developer in self.iter_all_developers(is_global_admin=is_global_admin)
-        ]
+        return self._get_all_as(
+            Endpoints.ADMIN_DEVELOPERS,
+            Developer,
+            params=self._build_params(is_global_admin=is_global_admin),
+        )
 
     def iter_all_developers(
         self, *, limit: int = 100, is_global_admin: bool | None = None
@@ -130,8 +134,10 @@ class SyncGlobalAdminService(SyncBaseService):
             ...     print(developer.username)
         """
         params = self._build_params(is_global_admin=is_global_admin)
-        for item in self._iter_all_pages(Endpoints.ADMIN_DEVELOPERS, limit=limit, params=params):
-            yield Developer.model_validate(item)
+        for developer in self._iter_all_pages_as(
+            Endpoints.ADMIN_DEVELOPERS, Developer, limit=limit, params=params
+        ):
+            yield developer
 
     def get_developer(self, developer_id: str) -> Developer:
         """Retrieve detailed information about a specific developer.
@@ -147,7 +153,7 @@ class SyncGlobalAdminService(SyncBaseService):
             AuthorizationError: If you don't have global admin privileges.
         """
         response = self._get(Endpoints.ADMIN_DEVELOPER.format(developer_id=developer_id))
-        return Developer.model_validate(response.json())
+        return Developer.model_validate_json(response.content)
 
     def create_developer(self, request: DeveloperCreate | None = None, **kwargs) -> Developer:
         """Create a new developer account.
@@ -170,11 +176,8 @@ class SyncGlobalAdminService(SyncBaseService):
             AuthorizationError: If you don't have global admin privileges.
         """
         body = request if request is not None else self._validate_request(DeveloperCreate, **kwargs)
-        response = self._post(
-            Endpoints.ADMIN_DEVELOPERS,
-            json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
-        )
-        return Developer.model_validate(response.json())
+        response = self._post(Endpoints.ADMIN_DEVELOPERS, content=self._serialize_body(body))
+        return Developer.model_validate_json(response.content)
 
     def update_developer(
         self, developer_id: str, request: DeveloperUpdate | None = None, **kwargs
@@ -204,9 +207,9 @@ class SyncGlobalAdminService(SyncBaseService):
         body = request if request is not None else self._validate_request(DeveloperUpdate, **kwargs)
         response = self._patch(
             Endpoints.ADMIN_DEVELOPER.format(developer_id=developer_id),
-            json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
+            content=self._serialize_body(body),
         )
-        return Developer.model_validate(response.json())
+        return Developer.model_validate_json(response.content)
 
     def delete_developer(self, developer_id: str) -> None:
         """Remove a developer account from the system.
@@ -222,6 +225,26 @@ class SyncGlobalAdminService(SyncBaseService):
         """
         self._delete(Endpoints.ADMIN_DEVELOPER.format(developer_id=developer_id))
 
+    def delete_developers(self, developer_ids: Iterable[str]) -> None:
+        """Remove several developer accounts concurrently.
+
+        At most ``BULK_REQUEST_CONCURRENCY`` requests are in flight at once. The first
+        failure cancels the requests still pending and is re-raised. The sync client
+        sends them one after another and stops at the first failure.
+        Each developer's API key is invalidated immediately.
+
+        Args:
+            developer_ids: The IDs of the developers to delete.
+
+        Raises:
+            NotFoundError: If any developer does not exist. Developers already deleted stay deleted.
+            AuthorizationError: If you don't have global admin privileges.
+        """
+        run_sequentially(
+            (self.delete_developer(developer_id) for developer_id in developer_ids),
+            BULK_REQUEST_CONCURRENCY,
+        )
+
     def get_user_page(
         self,
         *,
@@ -278,12 +301,13 @@ class SyncGlobalAdminService(SyncBaseService):
         Returns:
             A list of all matching AdminUser objects.
         """
-        return [
-            user
-            for user in self.iter_all_users(
+        return self._get_all_as(
+            Endpoints.ADMIN_USERS,
+            AdminUser,
+            params=self._build_params(
                 company_id=company_id, role=role, email=email, is_archived=is_archived
-            )
-        ]
+            ),
+        )
 
     def iter_all_users(
         self,
@@ -312,8 +336,10 @@ class SyncGlobalAdminService(SyncBaseService):
         params = self._build_params(
             company_id=company_id, role=role, email=email, is_archived=is_archived
         )
-        for item in self._iter_all_pages(Endpoints.ADMIN_USERS, limit=limit, params=params):
-            yield AdminUser.model_validate(item)
+        for user in self._iter_all_pages_as(
+            Endpoints.ADMIN_USERS, AdminUser, limit=limit, params=params
+        ):
+            yield user
 
     def get_user(self, user_id: str) -> AdminUser:
         """Retrieve a single user by ID, including archived users.
@@ -325,7 +351,7 @@ class SyncGlobalAdminService(SyncBaseService):
             The AdminUser object, with ``is_archived`` reflecting soft-delete state.
         """
         response = self._get(Endpoints.ADMIN_USER.format(user_id=user_id))
-        return AdminUser.model_validate(response.json())
+        return AdminUser.model_validate_json(response.content)
 
     def create_user(self, request: AdminUserCreate | None = None, **kwargs) -> AdminUser:
         """Create a user in a target company.
@@ -343,11 +369,8 @@ class SyncGlobalAdminService(SyncBaseService):
             The newly created AdminUser object.
         """
         body = request if request is not None else self._validate_request(AdminUserCreate, **kwargs)
-        response = self._post(
-            Endpoints.ADMIN_USERS,
-            json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
-        )
-        return AdminUser.model_validate(response.json())
+        response = self._post(Endpoints.ADMIN_USERS, content=self._serialize_body(body))
+        return AdminUser.model_validate_json(response.content)
 
     def update_user(
         self, user_id: str, request: AdminUserUpdate | None = None, **kwargs
@@ -366,10 +389,9 @@ class SyncGlobalAdminService(SyncBaseService):
         """
         body = request if request is not None else self._validate_request(AdminUserUpdate, **kwargs)
         response = self._patch(
-            Endpoints.ADMIN_USER.format(user_id=user_id),
-            json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
+            Endpoints.ADMIN_USER.format(user_id=user_id), content=self._serialize_body(body)
         )
-        return AdminUser.model_validate(response.json())
+        return AdminUser.model_validate_json(response.content)
 
     def delete_user(self, user_id: str) -> None:
         """Soft-delete a user by ID.
@@ -398,7 +420,31 @@ class SyncGlobalAdminService(SyncBaseService):
             AuthorizationError: If you don't have global admin privileges.
         """
         response = self._post(Endpoints.ADMIN_DEVELOPER_NEW_KEY.format(developer_id=developer_id))
-        return DeveloperWithApiKey.model_validate(response.json())
+        return DeveloperWithApiKey.model_validate_json(response.content)
+
+    def create_api_keys(self, developer_ids: Iterable[str]) -> list[DeveloperWithApiKey]:
+        """Generate new API keys for several developers concurrently.
+
+        At most ``BULK_REQUEST_CONCURRENCY`` requests are in flight at once. The first
+        failure cancels the requests still pending and is re-raised. The sync client
+        sends them one after another and stops at the first failure.
+        Each developer's current key is invalidated immediately.
+
+        Args:
+            developer_ids: The IDs of the developers to generate keys for.
+
+        Returns:
+            The Developer objects with their new API keys, in the same order as
+            ``developer_ids``.
+
+        Raises:
+            NotFoundError: If any developer does not exist. Keys already regenerated are kept.
+            AuthorizationError: If you don't have global admin privileges.
+        """
+        return run_sequentially(
+            (self.create_api_key(developer_id) for developer_id in developer_ids),
+            BULK_REQUEST_CONCURRENCY,
+        )
 
     def get_audit_log_page(
         self,
@@ -516,10 +562,11 @@ class SyncGlobalAdminService(SyncBaseService):
             NotFoundError: If the developer does not exist.
             AuthorizationError: If you don't have global admin privileges.
         """
-        return [
-            log
-            for log in self.iter_all_audit_logs(
-                developer_id,
+        model = AuditLogDetail if include and "request_details" in include else AuditLog
+        return self._get_all_as(
+            Endpoints.ADMIN_DEVELOPER_AUDIT_LOGS.format(developer_id=developer_id),
+            model,
+            params=_build_audit_params(
                 company_id=company_id,
                 acting_user_id=acting_user_id,
                 user_id=user_id,
@@ -532,8 +579,8 @@ class SyncGlobalAdminService(SyncBaseService):
                 date_from=date_from,
                 date_to=date_to,
                 include=include,
-            )
-        ]
+            ),
+        )
 
     def iter_all_audit_logs(
         self,
@@ -596,12 +643,13 @@ class SyncGlobalAdminService(SyncBaseService):
             date_to=date_to,
             include=include,
         )
-        for item in self._iter_all_pages(
+        for log in self._iter_all_pages_as(
             Endpoints.ADMIN_DEVELOPER_AUDIT_LOGS.format(developer_id=developer_id),
+            model,
             limit=limit,
             params=params,
         ):
-            yield model.model_validate(item)
+            yield log
 
     def tail_logs(
         self, *, level: LogLevel | None = None, limit: int = DEFAULT_LOG_TAIL_LIMIT
@@ -626,7 +674,7 @@ class SyncGlobalAdminService(SyncBaseService):
         clamped_limit = min(max(limit, MIN_LOG_TAIL_LIMIT), MAX_LOG_TAIL_LIMIT)
         params = self._build_params(level=level, limit=clamped_limit)
         response = self._get(Endpoints.ADMIN_LOGS, params=params)
-        return [ServerLogEntry.model_validate(item) for item in response.json()]
+        return self._validate_list(response, ServerLogEntry)
 
     def download_logs(self) -> ServerLogArchive:
         """Download a zip archive of the server log files.
@@ -1,9 +1,10 @@
 # AUTO-GENERATED — do not edit. Run 'uv run duty generate_sync' to regenerate.
 """Options and enumerations service."""
 
-import json
 from typing import TYPE_CHECKING
 
+from pydantic_core import from_json
+
 from vclient._sync.services.base import SyncBaseService
 from vclient.endpoints import Endpoints
 
@@ -39,4 +40,4 @@ class SyncOptionsService(SyncBaseService):
             A dictionary of options and enumerations for the api.
         """
         response = self._get(self._format_endpoint(Endpoints.OPTIONS))
-        return json.loads(response.content)
+        return from_json(response.content)
@@ -34,4 +34,4 @@ class SyncSystemService(SyncBaseService):
             ...     print("Database is healthy")
         """
         response = self._get(Endpoints.HEALTH)
-        return SystemHealth.model_validate(response.json())
+        return SystemHealth.model_validate_json(response.content)
@@ -29,7 +29,7 @@ class SyncUserLookupService(SyncBaseService):
             List of companies where a matching user was found. Empty list if no matches.
         """
         response = self._get(Endpoints.USERS_LOOKUP, params={"email": email})
-        return [UserLookupResult.model_validate(item) for item in response.json()]
+        return self._validate_list(response, UserLookupResult)
 
     def by_discord_id(self, discord_id: str) -> list[UserLookupResult]:
         """Look up a user by Discord profile ID.
@@ -41,7 +41,7 @@ class SyncUserLookupService(SyncBaseService):
             List of companies where a matching user was found. Empty list if no matches.
         """
         response = self._get(Endpoints.USERS_LOOKUP, params={"discord_id": discord_id})
-        return [UserLookupResult.model_validate(item) for item in response.json()]
+        return self._validate_list(response, UserLookupResult)
 
     def by_google_id(self, google_id: str) -> list[UserLookupResult]:
         """Look up a user by Google profile ID.
@@ -53,7 +53,7 @@ class SyncUserLookupService(SyncBaseService):
             List of companies where a matching user was found. Empty list if no matches.
         """
         response = self._get(Endpoints.USERS_LOOKUP, params={"google_id": google_id})
-        return [UserLookupResult.model_validate(item) for item in response.json()]
+        return self._validate_list(response, UserLookupResult)
 
     def by_github_id(self, github_id: str) -> list[UserLookupResult]:
         """Look up a user by GitHub profile ID.
@@ -65,7 +65,7 @@ class SyncUserLookupService(SyncBaseService):
             List of companies where a matching user was found. Empty list if no matches.
         """
         response = self._get(Endpoints.USERS_LOOKUP, params={"github_id": github_id})
-        return [UserLookupResult.model_validate(item) for item in response.json()]
+        return self._validate_list(response, UserLookupResult)
 
     def by_apple_id(self, apple_id: str) -> list[UserLookupResult]:
         """Look up a user by Apple profile ID.
@@ -77,4 +77,4 @@ class SyncUserLookupService(SyncBaseService):
             List of companies where a matching user was found. Empty list if no matches.
         """
         response = self._get(Endpoints.USERS_LOOKUP, params={"apple_id": apple_id})
-        return [UserLookupResult.model_validate(item) for item in response.json()]
+        return self._validate_list(response, UserLookupResult)
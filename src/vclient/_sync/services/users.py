@@ -2,11 +2,18 @@
 """Service for interacting with the Users API."""
 
 import mimetypes
-from collections.abc import Iterator, Sequence
-from typing import TYPE_CHECKING
+from collections.abc import Iterable, Iterator, Sequence
+from typing import TYPE_CHECKING, BinaryIO
 
+from vclient._concurrency import run_sequentially
 from vclient._sync.services.base import SyncBaseService
-from vclient.constants import DEFAULT_PAGE_LIMIT, IdentityProvider, UserInclude, UserRole
+from vclient.constants import (
+    BULK_REQUEST_CONCURRENCY,
+    DEFAULT_PAGE_LIMIT,
+    IdentityProvider,
+    UserInclude,
+    UserRole,
+)
 from vclient.endpoints import Endpoints
 from vclient.models import (
     Asset,
@@ -92,7 +99,7 @@ class SyncUsersService(SyncBaseService):
         Returns:
             A list of all unapproved User objects.
         """
-        return [user for user in self.iter_all_unapproved()]
+        return self._get_all_as(self._format_endpoint(Endpoints.USERS_UNAPPROVED_LIST), User)
 
     def iter_all_unapproved(self, *, limit: int = 100) -> Iterator[User]:
         """Iterate through all unapproved users within a company.
@@ -106,10 +113,10 @@ class SyncUsersService(SyncBaseService):
         Yields:
             Individual User objects.
         """
-        for item in self._iter_all_pages(
-            self._format_endpoint(Endpoints.USERS_UNAPPROVED_LIST), limit=limit
+        for user in self._iter_all_pages_as(
+            self._format_endpoint(Endpoints.USERS_UNAPPROVED_LIST), User, limit=limit
         ):
-            yield User.model_validate(item)
+            yield user
 
     def approve_user(self, user_id: str, role: UserRole) -> User:
         """Approve an unapproved user and assign them a role.
@@ -133,9 +140,9 @@ class SyncUsersService(SyncBaseService):
         body = UserApproveDTO(role=role)
         response = self._post(
             self._format_endpoint(Endpoints.USER_APPROVE, user_id=user_id),
-            json=body.model_dump(mode="json"),
+            content=self._serialize_body(body),
         )
-        return User.model_validate(response.json())
+        return User.model_validate_json(response.content)
 
     def deny_user(self, user_id: str) -> None:
         """Deny an unapproved user.
@@ -168,10 +175,9 @@ class SyncUsersService(SyncBaseService):
         """
         body = UserMergeDTO(primary_user_id=primary_user_id, secondary_user_id=secondary_user_id)
         response = self._post(
-            self._format_endpoint(Endpoints.USER_MERGE),
-            json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
+            self._format_endpoint(Endpoints.USER_MERGE), content=self._serialize_body(body)
         )
-        return User.model_validate(response.json())
+        return User.model_validate_json(response.content)
 
     def link_identity(self, user_id: str, *, provider: IdentityProvider, token: str) -> User:
         """Attach an additional verified provider identity to a user.
@@ -204,9 +210,9 @@ class SyncUsersService(SyncBaseService):
         body = self._validate_request(UserIdentityLinkDTO, provider=provider, token=token)
         response = self._post(
             self._format_endpoint(Endpoints.USER_IDENTITIES, user_id=user_id),
-            json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
+            content=self._serialize_body(body),
         )
-        return User.model_validate(response.json())
+        return User.model_validate_json(response.content)
 
     def unlink_identity(self, user_id: str, *, provider: IdentityProvider) -> User:
         """Disconnect a verified provider identity from a user.
@@ -237,7 +243,7 @@ class SyncUsersService(SyncBaseService):
         response = self._delete(
             self._format_endpoint(Endpoints.USER_IDENTITY, user_id=user_id, provider=provider)
         )
-        return User.model_validate(response.json())
+        return User.model_validate_json(response.content)
 
     def get_page(
         self,
@@ -284,7 +290,11 @@ class SyncUsersService(SyncBaseService):
         Returns:
             A list of all User objects.
         """
-        return [user for user in self.iter_all(user_role=user_role, email=email)]
+        return self._get_all_as(
+            self._format_endpoint(Endpoints.USERS),
+            User,
+            params=self._build_params(user_role=user_role, email=email),
+        )
 
     def iter_all(
         self, *, user_role: UserRole | None = None, email: str | None = None, limit: int = 100
@@ -306,12 +316,13 @@ class SyncUsersService(SyncBaseService):
             >>> async for user in users.iter_all():
             ...     print(user.name)
         """
-        for item in self._iter_all_pages(
+        for user in self._iter_all_pages_as(
             self._format_endpoint(Endpoints.USERS),
+            User,
             limit=limit,
             params=self._build_params(user_role=user_role, email=email),
         ):
-            yield User.model_validate(item)
+            yield user
 
     def get(self, user_id: str, *, include: Sequence[UserInclude] | None = None) -> UserDetail:
         """Retrieve detailed information about a specific user.
@@ -337,7 +348,31 @@ class SyncUsersService(SyncBaseService):
             self._format_endpoint(Endpoints.USER, user_id=user_id),
             params=self._build_params(include=list(include) if include else None),
         )
-        return UserDetail.model_validate(response.json())
+        return UserDetail.model_validate_json(response.content)
+
+    def get_many(
+        self, user_ids: Iterable[str], *, include: Sequence[UserInclude] | None = None
+    ) -> list[UserDetail]:
+        """Retrieve several users concurrently.
+
+        At most ``BULK_REQUEST_CONCURRENCY`` requests are in flight at once. The first
+        failure cancels the requests still pending and is re-raised. The sync client
+        sends them one after another and stops at the first failure.
+
+        Args:
+            user_ids: The IDs of the users to retrieve.
+            include: Child resources to embed in each response, as for ``get``.
+
+        Returns:
+            The UserDetail objects, in the same order as ``user_ids``.
+
+        Raises:
+            NotFoundError: If any user does not exist.
+            AuthorizationError: If you don't have access to the company.
+        """
+        return run_sequentially(
+            (self.get(user_id, include=include) for user_id in user_ids), BULK_REQUEST_CONCURRENCY
+        )
 
     def create(self, request: UserCreate | None = None, **kwargs) -> User:
         """Create a new user within a company.
@@ -369,10 +404,9 @@ class SyncUsersService(SyncBaseService):
         """
         body = request if request is not None else self._validate_request(UserCreate, **kwargs)
         response = self._post(
-            self._format_endpoint(Endpoints.USERS),
-            json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
+            self._format_endpoint(Endpoints.USERS), content=self._serialize_body(body)
         )
-        return User.model_validate(response.json())
+        return User.model_validate_json(response.content)
 
     def update(self, user_id: str, request: UserUpdate | None = None, **kwargs) -> User:
         """Modify a user's properties.
@@ -414,9 +448,9 @@ class SyncUsersService(SyncBaseService):
         body = request if request is not None else self._validate_request(UserUpdate, **kwargs)
         response = self._patch(
             self._format_endpoint(Endpoints.USER, user_id=user_id),
-            json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
+            content=self._serialize_body(body),
         )
-        return User.model_validate(response.json())
+        return User.model_validate_json(response.content)
 
     def delete(self, user_id: str) -> None:
         """Remove a user from the company.
@@ -452,7 +486,7 @@ class SyncUsersService(SyncBaseService):
             self._format_endpoint(Endpoints.USER_STATISTICS, user_id=user_id),
             params={"num_top_traits": num_top_traits},
         )
-        return RollStatistics.model_validate(response.json())
+        return RollStatistics.model_validate_json(response.content)
 
     def get_assets_page(
         self, user_id: str, *, limit: int = DEFAULT_PAGE_LIMIT, offset: int = 0
@@ -494,7 +528,9 @@ class SyncUsersService(SyncBaseService):
             NotFoundError: If the user does not exist.
             AuthorizationError: If you don't have access to the company.
         """
-        return [asset for asset in self.iter_all_assets(user_id)]
+        return self._get_all_as(
+            self._format_endpoint(Endpoints.USER_ASSETS, user_id=user_id), Asset
+        )
 
     def iter_all_assets(self, user_id: str, *, limit: int = 100) -> Iterator[Asset]:
         """Iterate through all assets for a user.
@@ -513,10 +549,10 @@ class SyncUsersService(SyncBaseService):
             >>> async for asset in users.iter_all_assets("user_id"):
             ...     print(asset.original_filename)
         """
-        for item in self._iter_all_pages(
-            self._format_endpoint(Endpoints.USER_ASSETS, user_id=user_id), limit=limit
+        for asset in self._iter_all_pages_as(
+            self._format_endpoint(Endpoints.USER_ASSETS, user_id=user_id), Asset, limit=limit
         ):
-            yield Asset.model_validate(item)
+            yield asset
 
     def get_asset(self, user_id: str, asset_id: str) -> Asset:
         """Retrieve details of a specific asset including its URL and metadata.
@@ -535,7 +571,7 @@ class SyncUsersService(SyncBaseService):
         response = self._get(
             self._format_endpoint(Endpoints.USER_ASSET, user_id=user_id, asset_id=asset_id)
         )
-        return Asset.model_validate(response.json())
+        return Asset.model_validate_json(response.content)
 
     def delete_asset(self, user_id: str, asset_id: str) -> None:
         """Delete an asset from a user.
@@ -555,7 +591,11 @@ class SyncUsersService(SyncBaseService):
         )
 
     def upload_asset(
-        self, user_id: str, filename: str, content: bytes, content_type: str | None = None
+        self,
+        user_id: str,
+        filename: str,
+        content: bytes | BinaryIO,
+        content_type: str | None = None,
     ) -> Asset:
         """Upload a new image asset for a user.
 
@@ -572,7 +612,8 @@ class SyncUsersService(SyncBaseService):
         Args:
             user_id: The ID of the user to upload the asset for.
             filename: The original filename of the asset.
-            content: The raw bytes of the file to upload.
+            content: The raw bytes of the file to upload, or a binary file object,
+                which is streamed in chunks rather than read into memory.
             content_type: The MIME type of the file. If not provided, inferred from filename.
 
         Returns:
@@ -589,10 +630,14 @@ class SyncUsersService(SyncBaseService):
             self._format_endpoint(Endpoints.USER_ASSET_UPLOAD, user_id=user_id),
             file=(filename, content, content_type),
         )
-        return Asset.model_validate(response.json())
+        return Asset.model_validate_json(response.content)
 
     def upload_avatar(
-        self, user_id: str, filename: str, content: bytes, content_type: str | None = None
+        self,
+        user_id: str,
+        filename: str,
+        content: bytes | BinaryIO,
+        content_type: str | None = None,
     ) -> User:
         """Upload a custom avatar for a user, replacing any existing one.
 
@@ -604,7 +649,8 @@ class SyncUsersService(SyncBaseService):
         Args:
             user_id: The ID of the user to set the avatar for.
             filename: The original filename of the image.
-            content: The raw bytes of the image to upload.
+            content: The raw bytes of the image to upload, or a binary file object,
+                which is streamed in chunks rather than read into memory.
             content_type: The MIME type. If not provided, inferred from filename.
 
         Returns:
@@ -616,7 +662,7 @@ class SyncUsersService(SyncBaseService):
             self._format_endpoint(Endpoints.USER_AVATAR, user_id=user_id),
             file=(filename, content, content_type),
         )
-        return User.model_validate(response.json())
+        return User.model_validate_json(response.content)
 
     def delete_avatar(self, user_id: str) -> User:
         """Remove a user's custom avatar.
@@ -633,7 +679,7 @@ class SyncUsersService(SyncBaseService):
             The updated User object with the resolved ``avatar_url``.
         """
         response = self._delete(self._format_endpoint(Endpoints.USER_AVATAR, user_id=user_id))
-        return User.model_validate(response.json())
+        return User.model_validate_json(response.content)
 
     def get_experience(self, user_id: str, campaign_id: str) -> CampaignExperience:
         """Retrieve a user's experience points and cool points for a specific campaign.
@@ -656,7 +702,32 @@ class SyncUsersService(SyncBaseService):
                 Endpoints.USER_EXPERIENCE_CAMPAIGN, user_id=user_id, campaign_id=campaign_id
             )
         )
-        return CampaignExperience.model_validate(response.json())
+        return CampaignExperience.model_validate_json(response.content)
+
+    def get_experiences(
+        self, user_ids: Iterable[str], campaign_id: str
+    ) -> list[CampaignExperience]:
+        """Retrieve several users' experience for a campaign concurrently.
+
+        At most ``BULK_REQUEST_CONCURRENCY`` requests are in flight at once. The first
+        failure cancels the requests still pending and is re-raised. The sync client
+        sends them one after another and stops at the first failure.
+
+        Args:
+            user_ids: The IDs of the users to get experience for.
+            campaign_id: The ID of the campaign to get experience for.
+
+        Returns:
+            CampaignExperience objects, in the same order as ``user_ids``.
+
+        Raises:
+            NotFoundError: If any user does not exist.
+            AuthorizationError: If you don't have access to the company.
+        """
+        return run_sequentially(
+            (self.get_experience(user_id, campaign_id) for user_id in user_ids),
+            BULK_REQUEST_CONCURRENCY,
+        )
 
     def add_xp(self, user_id: str, campaign_id: str, amount: int) -> CampaignExperience:
         """Award experience points to a user for a specific campaign.
@@ -680,9 +751,9 @@ class SyncUsersService(SyncBaseService):
         body = self._validate_request(_ExperienceAddRemove, amount=amount, campaign_id=campaign_id)
         response = self._post(
             self._format_endpoint(Endpoints.USER_EXPERIENCE_XP_ADD, user_id=user_id),
-            json=body.model_dump(mode="json"),
+            content=self._serialize_body(body),
         )
-        return CampaignExperience.model_validate(response.json())
+        return CampaignExperience.model_validate_json(response.content)
 
     def remove_xp(self, user_id: str, campaign_id: str, amount: int) -> CampaignExperience:
         """Deduct experience points from a user's current XP pool.
@@ -706,9 +777,9 @@ class SyncUsersService(SyncBaseService):
         body = self._validate_request(_ExperienceAddRemove, amount=amount, campaign_id=campaign_id)
         response = self._post(
             self._format_endpoint(Endpoints.USER_EXPERIENCE_XP_REMOVE, user_id=user_id),
-            json=body.model_dump(mode="json"),
+            content=self._serialize_body(body),
         )
-        return CampaignExperience.model_validate(response.json())
+        return CampaignExperience.model_validate_json(response.content)
 
     def add_cool_points(self, user_id: str, campaign_id: str, amount: int) -> CampaignExperience:
         """Award cool points to a user for a specific campaign.
@@ -732,9 +803,9 @@ class SyncUsersService(SyncBaseService):
         body = self._validate_request(_ExperienceAddRemove, amount=amount, campaign_id=campaign_id)
         response = self._post(
             self._format_endpoint(Endpoints.USER_EXPERIENCE_CP_ADD, user_id=user_id),
-            json=body.model_dump(mode="json"),
+            content=self._serialize_body(body),
         )
-        return CampaignExperience.model_validate(response.json())
+        return CampaignExperience.model_validate_json(response.content)
 
     def get_notes_page(
         self, user_id: str, *, limit: int = DEFAULT_PAGE_LIMIT, offset: int = 0
@@ -776,7 +847,7 @@ class SyncUsersService(SyncBaseService):
             NotFoundError: If the user does not exist.
             AuthorizationError: If you don't have access to the company.
         """
-        return [note for note in self.iter_all_notes(user_id)]
+        return self._get_all_as(self._format_endpoint(Endpoints.USER_NOTES, user_id=user_id), Note)
 
     def iter_all_notes(self, user_id: str, *, limit: int = 100) -> Iterator[Note]:
         """Iterate through all notes for a user.
@@ -795,10 +866,10 @@ class SyncUsersService(SyncBaseService):
             >>> async for note in users.iter_all_notes("user_id"):
             ...     print(note.title)
         """
-        for item in self._iter_all_pages(
-            self._format_endpoint(Endpoints.USER_NOTES, user_id=user_id), limit=limit
+        for note in self._iter_all_pages_as(
+            self._format_endpoint(Endpoints.USER_NOTES, user_id=user_id), Note, limit=limit
         ):
-            yield Note.model_validate(item)
+            yield note
 
     def get_note(self, user_id: str, note_id: str) -> Note:
         """Retrieve a specific note including its content and metadata.
@@ -817,7 +888,7 @@ class SyncUsersService(SyncBaseService):
         response = self._get(
             self._format_endpoint(Endpoints.USER_NOTE, user_id=user_id, note_id=note_id)
         )
-        return Note.model_validate(response.json())
+        return Note.model_validate_json(response.content)
 
     def create_note(self, user_id: str, request: NoteCreate | None = None, **kwargs) -> Note:
         """Create a new note for a user.
@@ -842,9 +913,9 @@ class SyncUsersService(SyncBaseService):
         body = request if request is not None else self._validate_request(NoteCreate, **kwargs)
         response = self._post(
             self._format_endpoint(Endpoints.USER_NOTES, user_id=user_id),
-            json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
+            content=self._serialize_body(body),
         )
-        return Note.model_validate(response.json())
+        return Note.model_validate_json(response.content)
 
     def update_note(
         self, user_id: str, note_id: str, request: NoteUpdate | None = None, **kwargs
@@ -872,9 +943,9 @@ class SyncUsersService(SyncBaseService):
         body = request if request is not None else self._validate_request(NoteUpdate, **kwargs)
         response = self._patch(
             self._format_endpoint(Endpoints.USER_NOTE, user_id=user_id, note_id=note_id),
-            json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
+            content=self._serialize_body(body),
         )
-        return Note.model_validate(response.json())
+        return Note.model_validate_json(response.content)
 
     def delete_note(self, user_id: str, note_id: str) -> None:
         """Remove a note from a user.
@@ -934,7 +1005,9 @@ class SyncUsersService(SyncBaseService):
             NotFoundError: If the user does not exist.
             AuthorizationError: If you don't have access to the company.
         """
-        return [qr for qr in self.iter_all_quickrolls(user_id)]
+        return self._get_all_as(
+            self._format_endpoint(Endpoints.USER_QUICKROLLS, user_id=user_id), Quickroll
+        )
 
     def iter_all_quickrolls(self, user_id: str, *, limit: int = 100) -> Iterator[Quickroll]:
         """Iterate through all quickrolls for a user.
@@ -953,10 +1026,12 @@ class SyncUsersService(SyncBaseService):
             >>> async for qr in users.iter_all_quickrolls("user_id"):
             ...     print(qr.name)
         """
-        for item in self._iter_all_pages(
-            self._format_endpoint(Endpoints.USER_QUICKROLLS, user_id=user_id), limit=limit
+        for quickroll in self._iter_all_pages_as(
+            self._format_endpoint(Endpoints.USER_QUICKROLLS, user_id=user_id),
+            Quickroll,
+            limit=limit,
         ):
-            yield Quickroll.model_validate(item)
+            yield quickroll
 
     def get_quickroll(self, user_id: str, quickroll_id: str) -> Quickroll:
         """Retrieve a specific quickroll including its name and trait configuration.
@@ -977,7 +1052,7 @@ class SyncUsersService(SyncBaseService):
                 Endpoints.USER_QUICKROLL, user_id=user_id, quickroll_id=quickroll_id
             )
         )
-        return Quickroll.model_validate(response.json())
+        return Quickroll.model_validate_json(response.content)
 
     def create_quickroll(
         self, user_id: str, request: QuickrollCreate | None = None, **kwargs
@@ -1006,9 +1081,9 @@ class SyncUsersService(SyncBaseService):
         body = request if request is not None else self._validate_request(QuickrollCreate, **kwargs)
         response = self._post(
             self._format_endpoint(Endpoints.USER_QUICKROLLS, user_id=user_id),
-            json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
+            content=self._serialize_body(body),
         )
-        return Quickroll.model_validate(response.json())
+        return Quickroll.model_validate_json(response.content)
 
     def update_quickroll(
         self, user_id: str, quickroll_id: str, request: QuickrollUpdate | None = None, **kwargs
@@ -1039,9 +1114,9 @@ class SyncUsersService(SyncBaseService):
             self._format_endpoint(
                 Endpoints.USER_QUICKROLL, user_id=user_id, quickroll_id=quickroll_id
             ),
-            json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
+            content=self._serialize_body(body),
         )
-        return Quickroll.model_validate(response.json())
+        return Quickroll.model_validate_json(response.content)
 
     def delete_quickroll(self, user_id: str, quickroll_id: str) -> None:
         """Remove a quickroll from a user.
@@ -1061,3 +1136,24 @@ class SyncUsersService(SyncBaseService):
                 Endpoints.USER_QUICKROLL, user_id=user_id, quickroll_id=quickroll_id
             )
         )
+
+    def delete_quickrolls(self, user_id: str, quickroll_ids: Iterable[str]) -> None:
+        """Remove several quickrolls from a user concurrently.
+
+        At most ``BULK_REQUEST_CONCURRENCY`` requests are in flight at once. The first
+        failure cancels the requests still pending and is re-raised. The sync client
+        sends them one after another and stops at the first failure.
+        This action cannot be undone.
+
+        Args:
+            user_id: The ID of the user who owns the quickrolls.
+            quickroll_ids: The IDs of the quickrolls to delete.
+
+        Raises:
+            NotFoundError: If any quickroll does not exist. Quickrolls already deleted stay deleted.
+            AuthorizationError: If you don't have appropriate access.
+        """
+        run_sequentially(
+            (self.delete_quickroll(user_id, quickroll_id) for quickroll_id in quickroll_ids),
+            BULK_REQUEST_CONCURRENCY,
+        )
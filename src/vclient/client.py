@@ -2,6 +2,8 @@
 
 import os
 import platform
+import threading
+from collections import OrderedDict
 from types import TracebackType
 from typing import TYPE_CHECKING, Self
 
@@ -11,6 +13,9 @@ from loguru import logger
 from vclient.config import _APIConfig
 from vclient.constants import (
     API_KEY_HEADER,
+    DEFAULT_ETAG_CACHE_SIZE,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
     DEFAULT_MAX_RETRIES,
     DEFAULT_RETRY_DELAY,
     DEFAULT_RETRY_STATUSES,
@@ -18,6 +23,7 @@ from vclient.constants import (
     ENV_API_KEY,
     ENV_BASE_URL,
     ENV_DEFAULT_COMPANY_ID,
+    PAGE_FETCH_CONCURRENCY,
 )
 
 if TYPE_CHECKING:
@@ -84,6 +90,11 @@ class VClient:
         retry_statuses: set[int] | frozenset[int] | None = None,
         default_company_id: str | None = None,
         headers: dict[str, str] | None = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        etag_cache_size: int = DEFAULT_ETAG_CACHE_SIZE,
+        page_fetch_concurrency: int = PAGE_FETCH_CONCURRENCY,
+        http2: bool = False,
         set_as_default: bool = True,
     ) -> None:
         """Initialize the API client.
@@ -112,6 +123,21 @@ class VClient:
                 to service factory methods. Falls back to
                 VALENTINA_CLIENT_DEFAULT_COMPANY_ID.
             headers: Additional headers to include with all requests.
+            max_connections: Maximum number of concurrent connections in the HTTP pool.
+            max_keepalive_connections: Maximum number of idle connections kept alive
+                for reuse between requests.
+            etag_cache_size: Number of GET responses to keep for conditional revalidation.
+                When above 0, repeated GETs send ``If-None-Match`` with the cached ETag and
+                reuse the cached body on a 304 Not Modified. Responses the server marks
+                fresh with ``Cache-Control: max-age`` are reused without a request until
+                they expire. Defaults to 0 (disabled).
+            page_fetch_concurrency: Maximum number of pages ``list_all`` requests at once
+                after the first page reports the total. Set to 1 to fetch pages one after
+                another, e.g. to stay well under a rate limit. Defaults to 8. The sync
+                client always fetches pages sequentially.
+            http2: Negotiate HTTP/2 so concurrent requests (bulk helpers, several
+                iterators sharing the client) multiplex over one connection. Requires
+                the ``http2`` extra.
             set_as_default: If True, register this client as the default for factory
                 functions. Set to False when creating multiple clients or when using
                 the context manager pattern exclusively.
@@ -119,6 +145,7 @@ class VClient:
         Raises:
             ValueError: If base_url or api_key is not provided and the corresponding
                 environment variable is not set.
+            ImportError: If http2 is True and the ``http2`` extra is not installed.
         """
         resolved_base_url = base_url or os.environ.get(ENV_BASE_URL)
         if resolved_base_url is None:
@@ -145,9 +172,22 @@ class VClient:
             else DEFAULT_RETRY_STATUSES,
             default_company_id=resolved_company_id,
             headers=headers or {},
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            etag_cache_size=etag_cache_size,
+            page_fetch_concurrency=page_fetch_concurrency,
+            http2=http2,
         )
 
         self._http: httpx2.AsyncClient = self._create_http_client()
+        # LRU of GET responses and their monotonic fresh-until time, keyed by
+        # (path, query, on-behalf-of); shared by all services
+        self._etag_cache: (
+            OrderedDict[tuple[str, str, str | None], tuple[httpx2.Response, float]] | None
+        ) = OrderedDict() if self._config.etag_cache_size > 0 else None
+        # Guards every read and write of _etag_cache so a sync client shared between
+        # threads cannot corrupt the LRU order or mutate it during invalidation
+        self._etag_cache_lock = threading.Lock()
         self._companies: CompaniesService | None = None
         self._developer: DeveloperService | None = None
         self._global_admin: GlobalAdminService | None = None
@@ -184,6 +224,11 @@ class VClient:
             base_url=self._config.base_url,
             headers=headers,
             timeout=httpx2.Timeout(self._config.timeout),
+            limits=httpx2.Limits(
+                max_connections=self._config.max_connections,
+                max_keepalive_connections=self._config.max_keepalive_connections,
+            ),
+            http2=self._config.http2,
         )
 
     async def __aenter__(self) -> Self:
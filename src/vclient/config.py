@@ -3,10 +3,14 @@
 from dataclasses import dataclass, field
 
 from vclient.constants import (
+    DEFAULT_ETAG_CACHE_SIZE,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
     DEFAULT_MAX_RETRIES,
     DEFAULT_RETRY_DELAY,
     DEFAULT_RETRY_STATUSES,
     DEFAULT_TIMEOUT,
+    PAGE_FETCH_CONCURRENCY,
 )
 
 
@@ -26,6 +30,13 @@ class _APIConfig:
         auto_idempotency_keys: Automatically generate idempotency keys for POST/PUT/PATCH.
         retry_statuses: HTTP status codes that trigger automatic retries.
         default_company_id: Default company ID to use when not explicitly provided.
+        max_connections: Maximum number of concurrent connections in the HTTP pool.
+        max_keepalive_connections: Maximum number of idle connections kept alive for reuse.
+        etag_cache_size: Maximum number of GET responses kept for ETag revalidation and
+            Cache-Control max-age reuse (0 disables).
+        page_fetch_concurrency: Maximum number of pages ``list_all`` requests at once after
+            the first (1 fetches them one after another).
+        http2: Negotiate HTTP/2 so concurrent requests share one multiplexed connection.
     """
 
     base_url: str
@@ -38,6 +49,11 @@ class _APIConfig:
     retry_statuses: frozenset[int] = DEFAULT_RETRY_STATUSES
     default_company_id: str | None = None
     headers: dict[str, str] = field(default_factory=dict)
+    max_connections: int = DEFAULT_MAX_CONNECTIONS
+    max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+    etag_cache_size: int = DEFAULT_ETAG_CACHE_SIZE
+    page_fetch_concurrency: int = PAGE_FETCH_CONCURRENCY
+    http2: bool = False
 
     def __post_init__(self) -> None:
         """Validate and normalize configuration."""
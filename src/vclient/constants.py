@@ -17,12 +17,25 @@ DEFAULT_RETRY_DELAY = 1.0
 DEFAULT_RETRY_STATUSES: frozenset[int] = frozenset({429, 500, 502, 503, 504})
 IDEMPOTENT_HTTP_METHODS: frozenset[str] = frozenset({"GET", "PUT", "DELETE"})
 
+# Connection pool defaults. Sized so paginated iterators and concurrent callers sharing
+# one client do not queue behind a small pool.
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+
+# ETag cache for conditional GETs; 0 disables it
+DEFAULT_ETAG_CACHE_SIZE = 0
+
 # Pagination defaults
 DEFAULT_PAGE_LIMIT = 10
 MAX_PAGE_LIMIT = 100
 # Reference/catalog list endpoints serve bounded seed data and allow fetching a
 # full catalog in one request, so they accept a higher per-request limit.
 MAX_REFERENCE_PAGE_LIMIT = 1000
+# list_all fetches the pages after the first in concurrent batches of this size
+PAGE_FETCH_CONCURRENCY = 8
+# Bulk helpers (create_many, delete_inventory_items, ...) keep at most this many
+# requests in flight at once
+BULK_REQUEST_CONCURRENCY = 8
 
 # Server log tail defaults
 DEFAULT_LOG_TAIL_LIMIT = 100
@@ -32,6 +45,7 @@ MAX_LOG_TAIL_LIMIT = 500
 # HTTP Status Code Ranges (5xx Server Errors)
 HTTP_500_INTERNAL_SERVER_ERROR = 500
 HTTP_600_UPPER_BOUND = 600
+HTTP_304_NOT_MODIFIED = 304
 
 # Idempotency
 IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
@@ -42,6 +56,11 @@ ON_BEHALF_OF_HEADER = "On-Behalf-Of"
 RATE_LIMIT_HEADER = "RateLimit"
 RATE_LIMIT_POLICY_HEADER = "RateLimit-Policy"
 
+# Conditional Request Headers
+CACHE_CONTROL_HEADER = "Cache-Control"
+ETAG_HEADER = "ETag"
+IF_NONE_MATCH_HEADER = "If-None-Match"
+
 # Valentina API Constants
 AbilityFocus = Literal["JACK_OF_ALL_TRADES", "BALANCED", "SPECIALIST"]
 AuditEntityType = Literal[
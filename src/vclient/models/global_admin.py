@@ -91,7 +91,7 @@ class ServerLogEntry(BaseModel):
     raw: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ServerLogArchive:
     """A downloaded server-log zip archive.
 
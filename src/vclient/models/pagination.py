@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Any, Self
 
 
-@dataclass
+@dataclass(slots=True)
 class PaginatedResponse[T]:
     """Response structure for paginated endpoints.
 
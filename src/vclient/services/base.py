@@ -1,21 +1,29 @@
 """Base service class for API services."""
 
 import asyncio
+import functools
 import random
+import time
 import uuid
 from collections.abc import AsyncIterator
-from typing import TYPE_CHECKING, Any, TypeVar
+from typing import TYPE_CHECKING, Any, BinaryIO, TypedDict, TypeVar
 
 import httpx2
 from loguru import logger
-from pydantic import BaseModel, ValidationError as PydanticValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError as PydanticValidationError
+from pydantic_core import from_json
 
+from vclient._concurrency import gather_bounded
 from vclient.constants import (
+    CACHE_CONTROL_HEADER,
     DEFAULT_PAGE_LIMIT,
+    ETAG_HEADER,
+    HTTP_304_NOT_MODIFIED,
     HTTP_500_INTERNAL_SERVER_ERROR,
     HTTP_600_UPPER_BOUND,
     IDEMPOTENCY_KEY_HEADER,
     IDEMPOTENT_HTTP_METHODS,
+    IF_NONE_MATCH_HEADER,
     MAX_PAGE_LIMIT,
     ON_BEHALF_OF_HEADER,
     RATE_LIMIT_HEADER,
@@ -37,7 +45,101 @@ from vclient.models.pagination import PaginatedResponse
 
 T = TypeVar("T", bound=BaseModel)
 
+
+class _Page[M](TypedDict, total=False):
+    """Wire shape of a paginated response body."""
+
+    items: list[M]
+    limit: int
+    offset: int
+    total: int
+
+
+@functools.cache
+def _page_adapter[M: BaseModel](model_class: type[M]) -> TypeAdapter[_Page[M]]:
+    """Return a cached adapter that decodes and validates a page body in one call.
+
+    Validating the raw JSON bytes as ``_Page[model_class]`` lets pydantic-core parse the
+    body and build the item models in a single pass, without materializing the items as
+    dicts first. Adapters are built on first use and reused.
+
+    Args:
+        model_class: Pydantic model class of the page items.
+
+    Returns:
+        A TypeAdapter for a page of ``model_class`` items.
+    """
+    # Parametrized through an Any-typed alias: type checkers reject a runtime
+    # variable such as model_class inside a subscripted generic
+    page_type: Any = _Page
+    return TypeAdapter(page_type[model_class])
+
+
+@functools.cache
+def _list_adapter[M: BaseModel](model_class: type[M]) -> TypeAdapter[list[M]]:
+    """Return a cached adapter that decodes and validates a bare JSON array in one call.
+
+    Args:
+        model_class: Pydantic model class of the array items.
+
+    Returns:
+        A TypeAdapter for a list of ``model_class`` items.
+    """
+    # Same Any-typed alias as _page_adapter, for the same type-checker limitation
+    list_type: Any = list
+    return TypeAdapter(list_type[model_class])
+
+
+def _freshness_lifetime(response: httpx2.Response) -> float | None:
+    """Return how long a response may be reused without revalidation.
+
+    Reads the ``max-age`` directive of the Cache-Control header. ``no-cache`` (or no
+    max-age) means the response must be revalidated before every reuse.
+
+    Args:
+        response: The response to inspect.
+
+    Returns:
+        The freshness lifetime in seconds, or None when ``no-store`` forbids caching.
+    """
+    directives = {}
+    for directive in response.headers.get(CACHE_CONTROL_HEADER, "").split(","):
+        name, _, value = directive.strip().partition("=")
+        directives[name.lower()] = value.strip('"')
+
+    if "no-store" in directives:
+        return None
+    if "no-cache" in directives:
+        return 0.0
+    try:
+        return max(float(directives.get("max-age", 0)), 0.0)
+    except ValueError:
+        return 0.0
+
+
+def _owning_resource(path: str) -> str:
+    """Return the resource whose cached reads a write to ``path`` may have changed.
+
+    Company-scoped paths belong to the ``/companies/{id}/{collection}/{id}`` resource
+    they sit under, so adding XP to a user covers that user's experience reads and a
+    trait change covers the character's full sheet. Other paths belong to their
+    parent (``/developers/me/new-key`` belongs to ``/developers/me``).
+
+    Args:
+        path: The path a write request succeeded against.
+
+    Returns:
+        The owning resource's path, the written path itself when nothing is above it.
+    """
+    segments = path.rstrip("/").split("/")
+    if "companies" in segments:
+        return "/".join(segments[: segments.index("companies") + 4])
+    return "/".join(segments[:-1]) or path
+
+
 if TYPE_CHECKING:
+    from collections import OrderedDict
+
     from vclient.client import VClient
 
 
@@ -141,9 +243,11 @@ class BaseService:
         *,
         params: dict[str, Any] | None = None,
         json: dict[str, Any] | list[Any] | None = None,
+        content: bytes | None = None,
         data: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
         files: Any | None = None,
+        allow_not_modified: bool = False,
     ) -> httpx2.Response:
         """Make an HTTP request with automatic retry on transient errors.
 
@@ -158,9 +262,12 @@ class BaseService:
             path: API endpoint path (will be appended to base_url).
             params: Query parameters.
             json: JSON body data.
+            content: Pre-serialized JSON body bytes, sent as ``application/json``.
             data: Form data.
             headers: Additional headers to include in the request.
             files: Files to upload (passed through to httpx2).
+            allow_not_modified: Return a 304 Not Modified response instead of raising.
+                Only ``_get`` sets this, for a conditional request it holds a cached body for.
 
         Returns:
             The HTTP response.
@@ -172,7 +279,7 @@ class BaseService:
             httpx2.TimeoutException: When request times out and max retries are exhausted.
             APIError: For other API error responses.
         """
-        headers = self._merge_on_behalf_of_header(headers)
+        headers = self._merge_json_content_type(self._merge_on_behalf_of_header(headers), content)
 
         config = self._client._config  # noqa: SLF001
         max_attempts = config.max_retries + 1 if config.auto_retry_rate_limit else 1
@@ -194,6 +301,7 @@ class BaseService:
                     url=path,
                     params=params,
                     json=json,
+                    content=content,
                     data=data,
                     headers=headers,
                     files=files,
@@ -214,8 +322,11 @@ class BaseService:
                 continue
 
             try:
-                self._raise_for_status(response, method, path, params=params)
+                self._raise_for_status(
+                    response, method, path, params=params, allow_not_modified=allow_not_modified
+                )
                 self._log_success_response(response, request_logger)
+                self._invalidate_cached(method, path)
                 return response  # noqa: TRY300
             except RateLimitError as e:
                 last_error = e
@@ -296,6 +407,8 @@ class BaseService:
         method: str,
         url: str,
         params: dict[str, Any] | None = None,
+        *,
+        allow_not_modified: bool = False,
     ) -> None:
         """Raise appropriate exception for error responses.
 
@@ -305,6 +418,8 @@ class BaseService:
             url: The URL path of the request.
             params: The query parameters of the request, logged to disambiguate
                 paginated calls that share the same path.
+            allow_not_modified: Accept a 304 Not Modified as success, for a conditional
+                request whose cached body the caller will return.
 
         Raises:
             AuthenticationError: For 401 responses.
@@ -317,7 +432,9 @@ class BaseService:
             ServerError: For 5xx responses.
             APIError: For other error responses.
         """
-        if response.is_success:
+        if response.is_success or (
+            allow_not_modified and response.status_code == HTTP_304_NOT_MODIFIED
+        ):
             return
 
         status_code = response.status_code
@@ -467,9 +584,95 @@ class BaseService:
             headers: Additional headers (e.g. an Accept override for binary downloads).
 
         Returns:
-            The HTTP response.
+            The HTTP response. When the client's ETag cache is enabled, a response still
+            fresh per its Cache-Control max-age is returned without a request, and a
+            304 Not Modified answer returns the previously cached response.
         """
-        return await self._request("GET", path, params=params, headers=headers)
+        cache = self._client._etag_cache  # noqa: SLF001
+        # Requests with caller headers (e.g. binary downloads) bypass the cache so an
+        # Accept override can never be answered with a differently negotiated body
+        if cache is None or headers is not None:
+            return await self._request("GET", path, params=params, headers=headers)
+
+        key = (path, str(httpx2.QueryParams(params or {})), self._on_behalf_of)
+        with self._client._etag_cache_lock:  # noqa: SLF001
+            cached = cache.get(key)
+            if cached is not None and time.monotonic() < cached[1]:
+                cache.move_to_end(key)
+                return cached[0]
+        if cached is not None and ETAG_HEADER in cached[0].headers:
+            headers = {IF_NONE_MATCH_HEADER: cached[0].headers[ETAG_HEADER]}
+
+        # A 304 is only a valid answer to the If-None-Match sent above; any other 304
+        # still raises like every non-2xx status
+        response = await self._request(
+            "GET", path, params=params, headers=headers, allow_not_modified=headers is not None
+        )
+
+        if response.status_code == HTTP_304_NOT_MODIFIED and cached is not None:
+            # The 304 carries the current Cache-Control for the stored body
+            self._cache_response(cache, key, cached[0], _freshness_lifetime(response))
+            return cached[0]
+
+        self._cache_response(cache, key, response, _freshness_lifetime(response))
+        return response
+
+    def _cache_response(
+        self,
+        cache: "OrderedDict[tuple[str, str, str | None], tuple[httpx2.Response, float]]",
+        key: tuple[str, str, str | None],
+        response: httpx2.Response,
+        lifetime: float | None,
+    ) -> None:
+        """Store a GET response in the client's cache, or drop it if it is not reusable.
+
+        A response is kept when it can be revalidated (it has an ETag) or reused as-is
+        for a while (a positive max-age). The least recently used entry is evicted once
+        the cache exceeds ``etag_cache_size``.
+
+        Args:
+            cache: The client's ETag cache, already checked to be enabled.
+            key: The (path, query, on-behalf-of) cache key.
+            response: The response whose body is stored.
+            lifetime: Freshness lifetime in seconds, or None if caching is forbidden.
+        """
+        with self._client._etag_cache_lock:  # noqa: SLF001
+            if lifetime is None or (lifetime <= 0 and ETAG_HEADER not in response.headers):
+                cache.pop(key, None)
+                return
+
+            cache[key] = (response, time.monotonic() + lifetime)
+            cache.move_to_end(key)
+            if len(cache) > self._client._config.etag_cache_size:  # noqa: SLF001
+                cache.popitem(last=False)
+
+    def _invalidate_cached(self, method: str, path: str) -> None:
+        """Drop cached GET responses a successful write to ``path`` may have made stale.
+
+        Entries for every path under the owning resource (see ``_owning_resource``) and
+        for the collections above it are removed, whatever their query or On-Behalf-Of
+        user. Writes made by other clients, or that change resources outside that
+        subtree, are only picked up once the cached entry expires or is revalidated.
+
+        Args:
+            method: The HTTP method that succeeded; GET requests invalidate nothing.
+            path: The path the request succeeded against.
+        """
+        cache = self._client._etag_cache  # noqa: SLF001
+        if method == "GET" or not cache:
+            return
+
+        owner = _owning_resource(path)
+        with self._client._etag_cache_lock:  # noqa: SLF001
+            stale = [
+                key
+                for key in cache
+                if key[0] == owner
+                or key[0].startswith(f"{owner}/")
+                or path.startswith(f"{key[0].rstrip('/')}/")
+            ]
+            for key in stale:
+                del cache[key]
 
     def _merge_on_behalf_of_header(
         self,
@@ -491,6 +694,28 @@ class BaseService:
             return headers
         return {ON_BEHALF_OF_HEADER: self._on_behalf_of, **(headers or {})}
 
+    @staticmethod
+    def _merge_json_content_type(
+        headers: dict[str, str] | None,
+        content: bytes | None,
+    ) -> dict[str, str] | None:
+        """Add a JSON Content-Type header when sending a pre-serialized body.
+
+        httpx2 only sets Content-Type itself for ``json=`` bodies; raw ``content=``
+        bytes would otherwise go out untyped.
+
+        Args:
+            headers: Existing request headers, or None.
+            content: The pre-serialized request body, or None.
+
+        Returns:
+            A new headers dict with Content-Type included, or the original value
+            unchanged when there is no pre-serialized body.
+        """
+        if content is None:
+            return headers
+        return {"Content-Type": "application/json", **(headers or {})}
+
     def _build_idempotency_headers(
         self,
         idempotency_key: str | None,
@@ -520,11 +745,43 @@ class BaseService:
         params = {k: v for k, v in kwargs.items() if v is not None}
         return params or None
 
+    @staticmethod
+    def _validate_list(response: httpx2.Response, model_class: type[T]) -> list[T]:
+        """Validate a response whose body is a bare JSON array of ``model_class`` items.
+
+        Args:
+            response: The HTTP response to parse.
+            model_class: Pydantic model class to validate each item into.
+
+        Returns:
+            The validated model instances, in response order.
+        """
+        return _list_adapter(model_class).validate_json(response.content)
+
+    @staticmethod
+    def _serialize_body(body: BaseModel) -> bytes:
+        """Serialize a request model to JSON bytes for the ``content`` argument.
+
+        Produces the same payload as ``model_dump(exclude_none=True, exclude_unset=True,
+        mode="json")`` but in a single pass through pydantic-core, instead of building a
+        dict that httpx2 then encodes again with the stdlib json module. The core
+        serializer is called directly because ``model_dump_json`` decodes its bytes to
+        ``str``, which would only be encoded again here.
+
+        Args:
+            body: The validated request model.
+
+        Returns:
+            The JSON-encoded request body.
+        """
+        return body.__pydantic_serializer__.to_json(body, exclude_none=True, exclude_unset=True)
+
     async def _post(
         self,
         path: str,
         *,
         json: dict[str, Any] | list[Any] | None = None,
+        content: bytes | None = None,
         data: dict[str, Any] | None = None,
         params: dict[str, Any] | None = None,
         idempotency_key: str | None = None,
@@ -534,6 +791,7 @@ class BaseService:
         Args:
             path: API endpoint path.
             json: JSON body data.
+            content: Pre-serialized JSON body bytes (see ``_serialize_body``).
             data: Form data.
             params: Query parameters.
             idempotency_key: Optional idempotency key for safe retries.
@@ -548,6 +806,7 @@ class BaseService:
             "POST",
             path,
             json=json,
+            content=content,
             data=data,
             params=params,
             headers=self._build_idempotency_headers(idempotency_key),
@@ -558,6 +817,7 @@ class BaseService:
         path: str,
         *,
         json: dict[str, Any] | list[Any] | None = None,
+        content: bytes | None = None,
         data: dict[str, Any] | None = None,
         params: dict[str, Any] | None = None,
         idempotency_key: str | None = None,
@@ -567,6 +827,7 @@ class BaseService:
         Args:
             path: API endpoint path.
             json: JSON body data.
+            content: Pre-serialized JSON body bytes (see ``_serialize_body``).
             data: Form data.
             params: Query parameters.
             idempotency_key: Optional idempotency key for safe retries.
@@ -581,6 +842,7 @@ class BaseService:
             "PUT",
             path,
             json=json,
+            content=content,
             data=data,
             params=params,
             headers=self._build_idempotency_headers(idempotency_key),
@@ -591,6 +853,7 @@ class BaseService:
         path: str,
         *,
         json: dict[str, Any] | list[Any] | None = None,
+        content: bytes | None = None,
         data: dict[str, Any] | None = None,
         params: dict[str, Any] | None = None,
         idempotency_key: str | None = None,
@@ -600,6 +863,7 @@ class BaseService:
         Args:
             path: API endpoint path.
             json: JSON body data.
+            content: Pre-serialized JSON body bytes (see ``_serialize_body``).
             data: Form data.
             params: Query parameters.
             idempotency_key: Optional idempotency key for safe retries.
@@ -614,6 +878,7 @@ class BaseService:
             "PATCH",
             path,
             json=json,
+            content=content,
             data=data,
             params=params,
             headers=self._build_idempotency_headers(idempotency_key),
@@ -640,14 +905,15 @@ class BaseService:
         self,
         path: str,
         *,
-        file: tuple[str, bytes, str],
+        file: tuple[str, bytes | BinaryIO, str],
         idempotency_key: str | None = None,
     ) -> httpx2.Response:
         """Make a POST request with a file upload (multipart/form-data).
 
         Args:
             path: API endpoint path.
-            file: Tuple of (filename, content, content_type) for the file to upload.
+            file: Tuple of (filename, content, content_type) for the file to upload. A file
+                object is streamed by httpx2 and rewound before each retry.
             idempotency_key: Optional idempotency key for safe retries.
 
         Returns:
@@ -671,7 +937,7 @@ class BaseService:
         self,
         path: str,
         *,
-        file: tuple[str, bytes, str],
+        file: tuple[str, bytes | BinaryIO, str],
         idempotency_key: str | None = None,
     ) -> httpx2.Response:
         """Make a PUT request with a file upload (multipart/form-data).
@@ -680,7 +946,8 @@ class BaseService:
 
         Args:
             path: API endpoint path.
-            file: Tuple of (filename, content, content_type) for the file to upload.
+            file: Tuple of (filename, content, content_type) for the file to upload. A file
+                object is streamed by httpx2 and rewound before each retry.
             idempotency_key: Optional idempotency key for safe retries.
 
         Returns:
@@ -704,6 +971,27 @@ class BaseService:
     # Pagination Methods
     # -------------------------------------------------------------------------
 
+    @staticmethod
+    def _build_page_params(
+        limit: int, offset: int, params: dict[str, Any] | None, max_limit: int
+    ) -> dict[str, Any]:
+        """Build the query params for a single page request.
+
+        Args:
+            limit: Requested page size, clamped to ``0..max_limit``.
+            offset: Number of items to skip, clamped to be non-negative.
+            params: Additional query parameters.
+            max_limit: Upper bound the limit is clamped to.
+
+        Returns:
+            The merged query params.
+        """
+        return {
+            "limit": min(max(limit, 0), max_limit),  # Clamp to valid range
+            "offset": max(offset, 0),
+            **(params or {}),
+        }
+
     async def _get_paginated(
         self,
         path: str,
@@ -726,14 +1014,12 @@ class BaseService:
         Returns:
             A PaginatedResponse containing the items and pagination metadata.
         """
-        request_params = {
-            "limit": min(max(limit, 0), max_limit),  # Clamp to valid range
-            "offset": max(offset, 0),
-            **(params or {}),
-        }
-
-        response = await self._get(path, params=request_params)
-        return PaginatedResponse.from_dict(response.json())
+        response = await self._get(
+            path, params=self._build_page_params(limit, offset, params, max_limit)
+        )
+        # Decode with pydantic-core's Rust parser (jiter), which caches repeated keys
+        # across items and is faster than the stdlib json decoder behind response.json().
+        return PaginatedResponse.from_dict(from_json(response.content))
 
     async def _get_paginated_as(
         self,
@@ -759,14 +1045,11 @@ class BaseService:
         Returns:
             A PaginatedResponse containing validated model instances.
         """
-        response = await self._get_paginated(
-            path, limit=limit, offset=offset, params=params, max_limit=max_limit
+        response = await self._get(
+            path, params=self._build_page_params(limit, offset, params, max_limit)
         )
-        return PaginatedResponse(
-            items=[model_class.model_validate(item) for item in response.items],
-            limit=response.limit,
-            offset=response.offset,
-            total=response.total,
+        return PaginatedResponse.from_dict(
+            _page_adapter(model_class).validate_json(response.content)
         )
 
     async def _iter_all_pages(
@@ -847,3 +1130,136 @@ class BaseService:
                 path, limit=limit, params=params, max_limit=max_limit
             )
         ]
+
+    async def _iter_all_pages_as(
+        self,
+        path: str,
+        model_class: type[T],
+        *,
+        limit: int = MAX_PAGE_LIMIT,
+        params: dict[str, Any] | None = None,
+        max_limit: int = MAX_PAGE_LIMIT,
+    ) -> AsyncIterator[T]:
+        """Iterate through all pages of a paginated endpoint, parsing items into a model.
+
+        Shared implementation behind the services' ``iter_all*`` methods so every
+        paginated listing validates items through a single code path.
+
+        Args:
+            path: API endpoint path.
+            model_class: Pydantic model class to validate each item into.
+            limit: Items per page (default 100 for efficiency).
+            params: Additional query parameters.
+            max_limit: Upper bound the per-page limit is clamped to (default 100).
+                Reference/catalog endpoints pass a higher bound (MAX_REFERENCE_PAGE_LIMIT).
+
+        Yields:
+            Validated model instances from each page.
+        """
+        async for page in self._iter_pages_as(
+            path, model_class, limit=limit, params=params, max_limit=max_limit
+        ):
+            for item in page:
+                yield item
+
+    async def _iter_pages_as(
+        self,
+        path: str,
+        model_class: type[T],
+        *,
+        limit: int = MAX_PAGE_LIMIT,
+        params: dict[str, Any] | None = None,
+        max_limit: int = MAX_PAGE_LIMIT,
+    ) -> AsyncIterator[list[T]]:
+        """Iterate through a paginated endpoint one validated page at a time.
+
+        Args:
+            path: API endpoint path.
+            model_class: Pydantic model class to validate each item into.
+            limit: Items per page (default 100 for efficiency).
+            params: Additional query parameters.
+            max_limit: Upper bound the per-page limit is clamped to (default 100).
+                Reference/catalog endpoints pass a higher bound (MAX_REFERENCE_PAGE_LIMIT).
+
+        Yields:
+            The validated items of each page, in order.
+        """
+        offset = 0
+
+        while True:
+            # Validate page-at-a-time rather than per item (see _page_adapter)
+            page = await self._get_paginated_as(
+                path,
+                model_class,
+                limit=limit,
+                offset=offset,
+                params=params,
+                max_limit=max_limit,
+            )
+
+            yield page.items
+
+            if not page.has_more:
+                break
+
+            offset = page.next_offset
+
+    async def _get_all_as(
+        self,
+        path: str,
+        model_class: type[T],
+        *,
+        limit: int = MAX_PAGE_LIMIT,
+        params: dict[str, Any] | None = None,
+        max_limit: int = MAX_PAGE_LIMIT,
+    ) -> list[T]:
+        """Fetch all items from a paginated endpoint, parsing them into a model.
+
+        Shared implementation behind the services' ``list_all*`` methods. The first page
+        reports the total, so the remaining pages are requested concurrently in batches
+        of the client's ``page_fetch_concurrency`` (1 fetches them one at a time) and
+        reassembled in offset order. Each request keeps its own 429 retry and backoff,
+        so a smaller batch only lowers the burst sent at once. A failed page fetch
+        cancels the rest of its batch and is re-raised. The sync client requests them one
+        after another.
+
+        Args:
+            path: API endpoint path.
+            model_class: Pydantic model class to validate each item into.
+            limit: Items per page (default 100 for efficiency).
+            params: Additional query parameters.
+            max_limit: Upper bound the per-page limit is clamped to (default 100).
+                Reference/catalog endpoints pass a higher bound (MAX_REFERENCE_PAGE_LIMIT).
+
+        Returns:
+            A list of validated model instances from all pages.
+        """
+        page = await self._get_paginated_as(
+            path, model_class, limit=limit, params=params, max_limit=max_limit
+        )
+        items = page.items
+        concurrency = max(self._client._config.page_fetch_concurrency, 1)  # noqa: SLF001
+
+        while page.has_more and page.limit > 0:
+            # Offsets up to the reported total are known, so request the next batch together.
+            # The last page of each batch decides whether more remain, as in _iter_pages_as.
+            offsets = range(page.next_offset, max(page.total, page.next_offset + 1), page.limit)
+            pages = await gather_bounded(
+                (
+                    self._get_paginated_as(
+                        path,
+                        model_class,
+                        limit=limit,
+                        offset=offset,
+                        params=params,
+                        max_limit=max_limit,
+                    )
+                    for offset in offsets[:concurrency]
+                ),
+                concurrency,
+            )
+            for fetched in pages:
+                items.extend(fetched.items)
+            page = pages[-1]
+
+        return items
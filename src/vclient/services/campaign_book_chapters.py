@@ -2,7 +2,7 @@
 
 import mimetypes
 from collections.abc import AsyncIterator, Sequence
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, BinaryIO
 
 from vclient.constants import DEFAULT_PAGE_LIMIT, ChapterInclude
 from vclient.endpoints import Endpoints
@@ -120,7 +120,7 @@ class ChaptersService(BaseService):
             self._format_endpoint(Endpoints.BOOK_CHAPTER, chapter_id=chapter_id),
             params=self._build_params(include=list(include) if include else None),
         )
-        return CampaignChapterDetail.model_validate(response.json())
+        return CampaignChapterDetail.model_validate_json(response.content)
 
     async def create(
         self,
@@ -139,7 +139,7 @@ class ChaptersService(BaseService):
             self._format_endpoint(Endpoints.BOOK_CHAPTERS),
             json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
         )
-        return CampaignChapter.model_validate(response.json())
+        return CampaignChapter.model_validate_json(response.content)
 
     async def update(
         self,
@@ -160,7 +160,7 @@ class ChaptersService(BaseService):
             self._format_endpoint(Endpoints.BOOK_CHAPTER, chapter_id=chapter_id),
             json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
         )
-        return CampaignChapter.model_validate(response.json())
+        return CampaignChapter.model_validate_json(response.content)
 
     async def delete(self, chapter_id: str) -> None:
         """Delete a campaign book chapter."""
@@ -174,7 +174,7 @@ class ChaptersService(BaseService):
                 exclude_none=True, exclude_unset=True, mode="json"
             ),
         )
-        return CampaignChapter.model_validate(response.json())
+        return CampaignChapter.model_validate_json(response.content)
 
     # -------------------------------------------------------------------------
     # Notes Methods
@@ -280,7 +280,7 @@ class ChaptersService(BaseService):
                 Endpoints.BOOK_CHAPTER_NOTE, chapter_id=chapter_id, note_id=note_id
             )
         )
-        return Note.model_validate(response.json())
+        return Note.model_validate_json(response.content)
 
     async def create_note(
         self,
@@ -312,7 +312,7 @@ class ChaptersService(BaseService):
             self._format_endpoint(Endpoints.BOOK_CHAPTER_NOTES, chapter_id=chapter_id),
             json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
         )
-        return Note.model_validate(response.json())
+        return Note.model_validate_json(response.content)
 
     async def update_note(
         self,
@@ -348,7 +348,7 @@ class ChaptersService(BaseService):
             ),
             json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
         )
-        return Note.model_validate(response.json())
+        return Note.model_validate_json(response.content)
 
     async def delete_note(
         self,
@@ -477,13 +477,13 @@ class ChaptersService(BaseService):
                 Endpoints.BOOK_CHAPTER_ASSET, chapter_id=chapter_id, asset_id=asset_id
             )
         )
-        return Asset.model_validate(response.json())
+        return Asset.model_validate_json(response.content)
 
     async def upload_asset(
         self,
         chapter_id: str,
         filename: str,
-        content: bytes,
+        content: bytes | BinaryIO,
         content_type: str | None = None,
     ) -> Asset:
         """Upload a new image asset for a chapter.
@@ -501,7 +501,8 @@ class ChaptersService(BaseService):
         Args:
             chapter_id: The ID of the chapter to upload the asset for.
             filename: The original filename of the asset.
-            content: The raw bytes of the file to upload.
+            content: The raw bytes of the file to upload, or a binary file object,
+                which is streamed in chunks rather than read into memory.
             content_type: The MIME type of the file. If not provided, inferred from filename.
 
         Returns:
@@ -519,7 +520,7 @@ class ChaptersService(BaseService):
             self._format_endpoint(Endpoints.BOOK_CHAPTER_ASSET_UPLOAD, chapter_id=chapter_id),
             file=(filename, content, content_type),
         )
-        return Asset.model_validate(response.json())
+        return Asset.model_validate_json(response.content)
 
     async def delete_asset(
         self,
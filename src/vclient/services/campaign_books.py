@@ -2,7 +2,7 @@
 
 import mimetypes
 from collections.abc import AsyncIterator, Sequence
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, BinaryIO
 
 from vclient.constants import DEFAULT_PAGE_LIMIT, BookInclude
 from vclient.endpoints import Endpoints
@@ -158,7 +158,7 @@ class BooksService(BaseService):
             self._format_endpoint(Endpoints.CAMPAIGN_BOOK, book_id=book_id),
             params=self._build_params(include=list(include) if include else None),
         )
-        return CampaignBookDetail.model_validate(response.json())
+        return CampaignBookDetail.model_validate_json(response.content)
 
     async def create(
         self,
@@ -185,7 +185,7 @@ class BooksService(BaseService):
             self._format_endpoint(Endpoints.CAMPAIGN_BOOKS),
             json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
         )
-        return CampaignBook.model_validate(response.json())
+        return CampaignBook.model_validate_json(response.content)
 
     async def update(
         self,
@@ -217,7 +217,7 @@ class BooksService(BaseService):
             self._format_endpoint(Endpoints.CAMPAIGN_BOOK, book_id=book_id),
             json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
         )
-        return CampaignBook.model_validate(response.json())
+        return CampaignBook.model_validate_json(response.content)
 
     async def delete(self, book_id: str) -> None:
         """Remove a campaign book from the system.
@@ -258,7 +258,7 @@ class BooksService(BaseService):
             self._format_endpoint(Endpoints.CAMPAIGN_BOOK_NUMBER, book_id=book_id),
             json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
         )
-        return CampaignBook.model_validate(response.json())
+        return CampaignBook.model_validate_json(response.content)
 
     # -------------------------------------------------------------------------
     # Notes Methods
@@ -362,7 +362,7 @@ class BooksService(BaseService):
         response = await self._get(
             self._format_endpoint(Endpoints.BOOK_NOTE, book_id=book_id, note_id=note_id)
         )
-        return Note.model_validate(response.json())
+        return Note.model_validate_json(response.content)
 
     async def create_note(
         self,
@@ -394,7 +394,7 @@ class BooksService(BaseService):
             self._format_endpoint(Endpoints.BOOK_NOTES, book_id=book_id),
             json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
         )
-        return Note.model_validate(response.json())
+        return Note.model_validate_json(response.content)
 
     async def update_note(
         self,
@@ -428,7 +428,7 @@ class BooksService(BaseService):
             self._format_endpoint(Endpoints.BOOK_NOTE, book_id=book_id, note_id=note_id),
             json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
         )
-        return Note.model_validate(response.json())
+        return Note.model_validate_json(response.content)
 
     async def delete_note(
         self,
@@ -553,13 +553,13 @@ class BooksService(BaseService):
         response = await self._get(
             self._format_endpoint(Endpoints.BOOK_ASSET, book_id=book_id, asset_id=asset_id)
         )
-        return Asset.model_validate(response.json())
+        return Asset.model_validate_json(response.content)
 
     async def upload_asset(
         self,
         book_id: str,
         filename: str,
-        content: bytes,
+        content: bytes | BinaryIO,
         content_type: str | None = None,
     ) -> Asset:
         """Upload a new image asset for a book.
@@ -577,7 +577,8 @@ class BooksService(BaseService):
         Args:
             book_id: The ID of the book to upload the asset for.
             filename: The original filename of the asset.
-            content: The raw bytes of the file to upload.
+            content: The raw bytes of the file to upload, or a binary file object,
+                which is streamed in chunks rather than read into memory.
             content_type: The MIME type of the file. If not provided, inferred from filename.
 
         Returns:
@@ -595,7 +596,7 @@ class BooksService(BaseService):
             self._format_endpoint(Endpoints.BOOK_ASSET_UPLOAD, book_id=book_id),
             file=(filename, content, content_type),
         )
-        return Asset.model_validate(response.json())
+        return Asset.model_validate_json(response.content)
 
     async def delete_asset(
         self,
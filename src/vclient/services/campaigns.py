@@ -2,7 +2,7 @@
 
 import mimetypes
 from collections.abc import AsyncIterator
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, BinaryIO
 
 from vclient.constants import DEFAULT_PAGE_LIMIT
 from vclient.endpoints import Endpoints
@@ -139,7 +139,7 @@ class CampaignsService(BaseService):
         response = await self._get(
             self._format_endpoint(Endpoints.CAMPAIGN, campaign_id=campaign_id)
         )
-        return Campaign.model_validate(response.json())
+        return Campaign.model_validate_json(response.content)
 
     async def create(
         self,
@@ -168,7 +168,7 @@ class CampaignsService(BaseService):
             self._format_endpoint(Endpoints.CAMPAIGNS),
             json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
         )
-        return Campaign.model_validate(response.json())
+        return Campaign.model_validate_json(response.content)
 
     async def update(
         self,
@@ -207,7 +207,7 @@ class CampaignsService(BaseService):
             self._format_endpoint(Endpoints.CAMPAIGN, campaign_id=campaign_id),
             json=payload,
         )
-        return Campaign.model_validate(response.json())
+        return Campaign.model_validate_json(response.content)
 
     async def delete(self, campaign_id: str) -> None:
         """Remove a campaign from the system.
@@ -249,7 +249,7 @@ class CampaignsService(BaseService):
             self._format_endpoint(Endpoints.CAMPAIGN_STATISTICS, campaign_id=campaign_id),
             params={"num_top_traits": num_top_traits},
         )
-        return RollStatistics.model_validate(response.json())
+        return RollStatistics.model_validate_json(response.content)
 
     # -------------------------------------------------------------------------
     # Asset Methods
@@ -355,7 +355,7 @@ class CampaignsService(BaseService):
                 Endpoints.CAMPAIGN_ASSET, campaign_id=campaign_id, asset_id=asset_id
             )
         )
-        return Asset.model_validate(response.json())
+        return Asset.model_validate_json(response.content)
 
     async def delete_asset(
         self,
@@ -384,7 +384,7 @@ class CampaignsService(BaseService):
         self,
         campaign_id: str,
         filename: str,
-        content: bytes,
+        content: bytes | BinaryIO,
         content_type: str | None = None,
     ) -> Asset:
         """Upload a new image asset for a campaign.
@@ -402,7 +402,8 @@ class CampaignsService(BaseService):
         Args:
             campaign_id: The ID of the campaign to upload the asset for.
             filename: The original filename of the asset.
-            content: The raw bytes of the file to upload.
+            content: The raw bytes of the file to upload, or a binary file object,
+                which is streamed in chunks rather than read into memory.
             content_type: The MIME type of the file. If not provided, inferred from filename.
 
         Returns:
@@ -420,7 +421,7 @@ class CampaignsService(BaseService):
             self._format_endpoint(Endpoints.CAMPAIGN_ASSET_UPLOAD, campaign_id=campaign_id),
             file=(filename, content, content_type),
         )
-        return Asset.model_validate(response.json())
+        return Asset.model_validate_json(response.content)
 
     # -------------------------------------------------------------------------
     # Notes Methods
@@ -524,7 +525,7 @@ class CampaignsService(BaseService):
         response = await self._get(
             self._format_endpoint(Endpoints.CAMPAIGN_NOTE, campaign_id=campaign_id, note_id=note_id)
         )
-        return Note.model_validate(response.json())
+        return Note.model_validate_json(response.content)
 
     async def create_note(
         self,
@@ -556,7 +557,7 @@ class CampaignsService(BaseService):
             self._format_endpoint(Endpoints.CAMPAIGN_NOTES, campaign_id=campaign_id),
             json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
         )
-        return Note.model_validate(response.json())
+        return Note.model_validate_json(response.content)
 
     async def update_note(
         self,
@@ -592,7 +593,7 @@ class CampaignsService(BaseService):
             ),
             json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
         )
-        return Note.model_validate(response.json())
+        return Note.model_validate_json(response.content)
 
     async def delete_note(
         self,
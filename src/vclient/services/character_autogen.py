@@ -92,7 +92,7 @@ class CharacterAutogenService(BaseService):
             json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
             params={"campaign_id": campaign_id},
         )
-        return Character.model_validate(response.json())
+        return Character.model_validate_json(response.content)
 
     async def start_chargen_session(self, *, campaign_id: str) -> ChargenSessionResponse:
         """Start a chargen session.
@@ -107,7 +107,7 @@ class CharacterAutogenService(BaseService):
             self._format_endpoint(Endpoints.CHARGEN_START),
             params={"campaign_id": campaign_id},
         )
-        return ChargenSessionResponse.model_validate(response.json())
+        return ChargenSessionResponse.model_validate_json(response.content)
 
     async def finalize_chargen_session(
         self, session_id: str, selected_character_id: str
@@ -122,7 +122,7 @@ class CharacterAutogenService(BaseService):
             self._format_endpoint(Endpoints.CHARGEN_FINALIZE),
             json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
         )
-        return Character.model_validate(response.json())
+        return Character.model_validate_json(response.content)
 
     async def list_all(self) -> list[ChargenSessionResponse]:
         """List all chargen sessions for the current campaign.
@@ -131,7 +131,7 @@ class CharacterAutogenService(BaseService):
             All chargen sessions associated with the current campaign.
         """
         response = await self._get(self._format_endpoint(Endpoints.CHARGEN_SESSIONS))
-        return [ChargenSessionResponse.model_validate(item) for item in response.json()]
+        return self._validate_list(response, ChargenSessionResponse)
 
     async def get(self, session_id: str) -> ChargenSessionResponse:
         """Retrieve a single chargen session by ID.
@@ -145,4 +145,4 @@ class CharacterAutogenService(BaseService):
         response = await self._get(
             self._format_endpoint(Endpoints.CHARGEN_SESSION, session_id=session_id)
         )
-        return ChargenSessionResponse.model_validate(response.json())
+        return ChargenSessionResponse.model_validate_json(response.content)
@@ -107,7 +107,7 @@ class CharacterBlueprintService(BaseService):
                 section_id=section_id,
             ),
         )
-        return SheetSection.model_validate(response.json())
+        return SheetSection.model_validate_json(response.content)
 
     # Character Sheet Categories
 
@@ -179,7 +179,7 @@ class CharacterBlueprintService(BaseService):
                 category_id=category_id,
             ),
         )
-        return TraitCategory.model_validate(response.json())
+        return TraitCategory.model_validate_json(response.content)
 
     # Character Sheet Subcategories
 
@@ -251,7 +251,7 @@ class CharacterBlueprintService(BaseService):
                 subcategory_id=subcategory_id,
             ),
         )
-        return TraitSubcategory.model_validate(response.json())
+        return TraitSubcategory.model_validate_json(response.content)
 
     # Character Traits
 
@@ -344,7 +344,7 @@ class CharacterBlueprintService(BaseService):
         response = await self._get(
             self._format_endpoint(Endpoints.BLUEPRINT_TRAIT_DETAIL, trait_id=trait_id),
         )
-        return Trait.model_validate(response.json())
+        return Trait.model_validate_json(response.content)
 
     # Character Concepts
 
@@ -381,7 +381,7 @@ class CharacterBlueprintService(BaseService):
         response = await self._get(
             self._format_endpoint(Endpoints.CONCEPT_DETAIL, concept_id=concept_id),
         )
-        return CharacterConcept.model_validate(response.json())
+        return CharacterConcept.model_validate_json(response.content)
 
     # -----------------------------------------------------------------------------
     # Vampire Clans
@@ -426,7 +426,7 @@ class CharacterBlueprintService(BaseService):
         response = await self._get(
             self._format_endpoint(Endpoints.VAMPIRE_CLAN_DETAIL, vampire_clan_id=vampire_clan_id),
         )
-        return VampireClan.model_validate(response.json())
+        return VampireClan.model_validate_json(response.content)
 
     # -----------------------------------------------------------------------------
     # Werewolf Auspices
@@ -475,7 +475,7 @@ class CharacterBlueprintService(BaseService):
                 Endpoints.WEREWOLF_AUSPICE_DETAIL, werewolf_auspice_id=werewolf_auspice_id
             ),
         )
-        return WerewolfAuspice.model_validate(response.json())
+        return WerewolfAuspice.model_validate_json(response.content)
 
     # -----------------------------------------------------------------------------
     # Werewolf Tribes
@@ -522,4 +522,4 @@ class CharacterBlueprintService(BaseService):
                 Endpoints.WEREWOLF_TRIBE_DETAIL, werewolf_tribe_id=werewolf_tribe_id
             ),
         )
-        return WerewolfTribe.model_validate(response.json())
+        return WerewolfTribe.model_validate_json(response.content)
@@ -155,7 +155,7 @@ class CharacterTraitsService(BaseService):
         response = await self._get(
             self._format_endpoint(Endpoints.CHARACTER_TRAIT, character_trait_id=character_trait_id)
         )
-        return CharacterTrait.model_validate(response.json())
+        return CharacterTrait.model_validate_json(response.content)
 
     async def delete(
         self, character_trait_id: str, currency: TraitModifyCurrency | None = None
@@ -213,7 +213,7 @@ class CharacterTraitsService(BaseService):
             self._format_endpoint(Endpoints.CHARACTER_TRAIT_ASSIGN),
             json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
         )
-        return CharacterTrait.model_validate(response.json())
+        return CharacterTrait.model_validate_json(response.content)
 
     async def bulk_assign(self, items: list[CharacterTraitAdd]) -> BulkAssignTraitResponse:
         """Assign multiple traits to a character in a single request.
@@ -236,7 +236,7 @@ class CharacterTraitsService(BaseService):
                 for item in items
             ],
         )
-        return BulkAssignTraitResponse.model_validate(response.json())
+        return BulkAssignTraitResponse.model_validate_json(response.content)
 
     async def create(
         self,
@@ -263,7 +263,7 @@ class CharacterTraitsService(BaseService):
             self._format_endpoint(Endpoints.CHARACTER_TRAIT_CREATE),
             json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
         )
-        return CharacterTrait.model_validate(response.json())
+        return CharacterTrait.model_validate_json(response.content)
 
     # Trait Value Modification Methods
     async def get_value_options(
@@ -288,7 +288,7 @@ class CharacterTraitsService(BaseService):
                 Endpoints.CHARACTER_TRAIT_VALUE_OPTIONS, character_trait_id=character_trait_id
             ),
         )
-        return CharacterTraitValueOptionsResponse.model_validate(response.json())
+        return CharacterTraitValueOptionsResponse.model_validate_json(response.content)
 
     async def change_value(
         self,
@@ -314,4 +314,4 @@ class CharacterTraitsService(BaseService):
             ),
             json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
         )
-        return CharacterTrait.model_validate(response.json())
+        return CharacterTrait.model_validate_json(response.content)
@@ -1,10 +1,12 @@
 """Service for interacting with the Characters API."""
 
 import mimetypes
-from collections.abc import AsyncIterator, Sequence
-from typing import TYPE_CHECKING
+from collections.abc import AsyncIterator, Iterable, Sequence
+from typing import TYPE_CHECKING, BinaryIO
 
+from vclient._concurrency import gather_bounded
 from vclient.constants import (
+    BULK_REQUEST_CONCURRENCY,
     DEFAULT_PAGE_LIMIT,
     CharacterClass,
     CharacterInclude,
@@ -144,9 +146,10 @@ class CharactersService(BaseService):
         Returns:
             A list of all Character objects.
         """
-        return [
-            character
-            async for character in self.iter_all(
+        return await self._get_all_as(
+            self._format_endpoint(Endpoints.CHARACTERS),
+            Character,
+            params=self._build_params(
                 campaign_id=campaign_id,
                 user_player_id=user_player_id,
                 user_creator_id=user_creator_id,
@@ -154,8 +157,8 @@ class CharactersService(BaseService):
                 character_type=character_type,
                 status=status,
                 is_temporary=is_temporary,
-            )
-        ]
+            ),
+        )
 
     async def iter_all(
         self,
@@ -191,8 +194,9 @@ class CharactersService(BaseService):
             >>> async for character in characters.iter_all():
             ...     print(character.name)
         """
-        async for item in self._iter_all_pages(
+        async for character in self._iter_all_pages_as(
             self._format_endpoint(Endpoints.CHARACTERS),
+            Character,
             limit=limit,
             params=self._build_params(
                 campaign_id=campaign_id,
@@ -204,7 +208,7 @@ class CharactersService(BaseService):
                 is_temporary=is_temporary,
             ),
         ):
-            yield Character.model_validate(item)
+            yield character
 
     async def get(
         self,
@@ -233,7 +237,7 @@ class CharactersService(BaseService):
             self._format_endpoint(Endpoints.CHARACTER, character_id=character_id),
             params=self._build_params(include=list(include) if include else None),
         )
-        return CharacterDetail.model_validate(response.json())
+        return CharacterDetail.model_validate_json(response.content)
 
     async def create(
         self,
@@ -267,9 +271,9 @@ class CharactersService(BaseService):
         body = request if request is not None else self._validate_request(CharacterCreate, **kwargs)
         response = await self._post(
             self._format_endpoint(Endpoints.CHARACTERS),
-            json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
+            content=self._serialize_body(body),
         )
-        return Character.model_validate(response.json())
+        return Character.model_validate_json(response.content)
 
     async def update(
         self,
@@ -312,7 +316,7 @@ class CharactersService(BaseService):
             self._format_endpoint(Endpoints.CHARACTER, character_id=character_id),
             json=payload,
         )
-        return Character.model_validate(response.json())
+        return Character.model_validate_json(response.content)
 
     async def delete(self, character_id: str) -> None:
         """Remove a character from the campaign.
@@ -355,7 +359,7 @@ class CharactersService(BaseService):
             self._format_endpoint(Endpoints.CHARACTER_STATISTICS, character_id=character_id),
             params={"num_top_traits": num_top_traits},
         )
-        return RollStatistics.model_validate(response.json())
+        return RollStatistics.model_validate_json(response.content)
 
     async def get_full_sheet(
         self,
@@ -388,7 +392,7 @@ class CharactersService(BaseService):
             self._format_endpoint(Endpoints.CHARACTER_FULL_SHEET, character_id=character_id),
             params=params,
         )
-        return CharacterFullSheet.model_validate(response.json())
+        return CharacterFullSheet.model_validate_json(response.content)
 
     async def get_full_sheet_category(
         self,
@@ -426,7 +430,7 @@ class CharactersService(BaseService):
             ),
             params=params,
         )
-        return FullSheetTraitCategory.model_validate(response.json())
+        return FullSheetTraitCategory.model_validate_json(response.content)
 
     # Asset Methods
 
@@ -477,7 +481,10 @@ class CharactersService(BaseService):
             NotFoundError: If the character does not exist.
             AuthorizationError: If you don't have access.
         """
-        return [asset async for asset in self.iter_all_assets(character_id)]
+        return await self._get_all_as(
+            self._format_endpoint(Endpoints.CHARACTER_ASSETS, character_id=character_id),
+            Asset,
+        )
 
     async def iter_all_assets(
         self,
@@ -501,11 +508,12 @@ class CharactersService(BaseService):
             >>> async for asset in characters.iter_all_assets("character_id"):
             ...     print(asset.original_filename)
         """
-        async for item in self._iter_all_pages(
+        async for asset in self._iter_all_pages_as(
             self._format_endpoint(Endpoints.CHARACTER_ASSETS, character_id=character_id),
+            Asset,
             limit=limit,
         ):
-            yield Asset.model_validate(item)
+            yield asset
 
     async def get_asset(
         self,
@@ -530,7 +538,7 @@ class CharactersService(BaseService):
                 Endpoints.CHARACTER_ASSET, character_id=character_id, asset_id=asset_id
             )
         )
-        return Asset.model_validate(response.json())
+        return Asset.model_validate_json(response.content)
 
     async def delete_asset(
         self,
@@ -559,7 +567,7 @@ class CharactersService(BaseService):
         self,
         character_id: str,
         filename: str,
-        content: bytes,
+        content: bytes | BinaryIO,
         content_type: str | None = None,
     ) -> Asset:
         """Upload a new image asset for a character.
@@ -577,7 +585,8 @@ class CharactersService(BaseService):
         Args:
             character_id: The ID of the character to upload the asset for.
             filename: The original filename of the asset.
-            content: The raw bytes of the file to upload.
+            content: The raw bytes of the file to upload, or a binary file object,
+                which is streamed in chunks rather than read into memory.
             content_type: The MIME type of the file. If not provided, inferred from filename.
 
         Returns:
@@ -595,7 +604,7 @@ class CharactersService(BaseService):
             self._format_endpoint(Endpoints.CHARACTER_ASSET_UPLOAD, character_id=character_id),
             file=(filename, content, content_type),
         )
-        return Asset.model_validate(response.json())
+        return Asset.model_validate_json(response.content)
 
     # Notes Methods
 
@@ -646,7 +655,10 @@ class CharactersService(BaseService):
             NotFoundError: If the character does not exist.
             AuthorizationError: If you don't have access.
         """
-        return [note async for note in self.iter_all_notes(character_id)]
+        return await self._get_all_as(
+            self._format_endpoint(Endpoints.CHARACTER_NOTES, character_id=character_id),
+            Note,
+        )
 
     async def iter_all_notes(
         self,
@@ -670,11 +682,12 @@ class CharactersService(BaseService):
             >>> async for note in characters.iter_all_notes("character_id"):
             ...     print(note.title)
         """
-        async for item in self._iter_all_pages(
+        async for note in self._iter_all_pages_as(
             self._format_endpoint(Endpoints.CHARACTER_NOTES, character_id=character_id),
+            Note,
             limit=limit,
         ):
-            yield Note.model_validate(item)
+            yield note
 
     async def get_note(
         self,
@@ -699,7 +712,7 @@ class CharactersService(BaseService):
                 Endpoints.CHARACTER_NOTE, character_id=character_id, note_id=note_id
             )
         )
-        return Note.model_validate(response.json())
+        return Note.model_validate_json(response.content)
 
     async def create_note(
         self,
@@ -729,9 +742,9 @@ class CharactersService(BaseService):
         body = request if request is not None else self._validate_request(NoteCreate, **kwargs)
         response = await self._post(
             self._format_endpoint(Endpoints.CHARACTER_NOTES, character_id=character_id),
-            json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
+            content=self._serialize_body(body),
         )
-        return Note.model_validate(response.json())
+        return Note.model_validate_json(response.content)
 
     async def update_note(
         self,
@@ -765,9 +778,9 @@ class CharactersService(BaseService):
             self._format_endpoint(
                 Endpoints.CHARACTER_NOTE, character_id=character_id, note_id=note_id
             ),
-            json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
+            content=self._serialize_body(body),
         )
-        return Note.model_validate(response.json())
+        return Note.model_validate_json(response.content)
 
     async def delete_note(
         self,
@@ -841,7 +854,10 @@ class CharactersService(BaseService):
             NotFoundError: If the character does not exist.
             AuthorizationError: If you don't have access.
         """
-        return [item async for item in self.iter_all_inventory(character_id)]
+        return await self._get_all_as(
+            self._format_endpoint(Endpoints.CHARACTER_INVENTORY, character_id=character_id),
+            InventoryItem,
+        )
 
     async def iter_all_inventory(
         self,
@@ -865,11 +881,12 @@ class CharactersService(BaseService):
             >>> async for item in characters.iter_all_inventory("character_id"):
             ...     print(item.name)
         """
-        async for item in self._iter_all_pages(
+        async for item in self._iter_all_pages_as(
             self._format_endpoint(Endpoints.CHARACTER_INVENTORY, character_id=character_id),
+            InventoryItem,
             limit=limit,
         ):
-            yield InventoryItem.model_validate(item)
+            yield item
 
     async def get_inventory_item(
         self,
@@ -894,7 +911,7 @@ class CharactersService(BaseService):
                 Endpoints.CHARACTER_INVENTORY_ITEM, character_id=character_id, item_id=item_id
             )
         )
-        return InventoryItem.model_validate(response.json())
+        return InventoryItem.model_validate_json(response.content)
 
     async def create_inventory_item(
         self,
@@ -927,9 +944,9 @@ class CharactersService(BaseService):
         )
         response = await self._post(
             self._format_endpoint(Endpoints.CHARACTER_INVENTORY, character_id=character_id),
-            json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
+            content=self._serialize_body(body),
         )
-        return InventoryItem.model_validate(response.json())
+        return InventoryItem.model_validate_json(response.content)
 
     async def update_inventory_item(
         self,
@@ -968,9 +985,9 @@ class CharactersService(BaseService):
             self._format_endpoint(
                 Endpoints.CHARACTER_INVENTORY_ITEM, character_id=character_id, item_id=item_id
             ),
-            json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
+            content=self._serialize_body(body),
         )
-        return InventoryItem.model_validate(response.json())
+        return InventoryItem.model_validate_json(response.content)
 
     async def delete_inventory_item(
         self,
@@ -994,3 +1011,56 @@ class CharactersService(BaseService):
                 Endpoints.CHARACTER_INVENTORY_ITEM, character_id=character_id, item_id=item_id
             )
         )
+
+    async def create_inventory_items(
+        self,
+        character_id: str,
+        items: Iterable[InventoryItemCreate],
+    ) -> list[InventoryItem]:
+        """Create several inventory items for a character concurrently.
+
+        At most ``BULK_REQUEST_CONCURRENCY`` requests are in flight at once. The first
+        failure cancels the requests still pending and is re-raised. The sync client
+        sends them one after another and stops at the first failure.
+
+        Args:
+            character_id: The ID of the character to create the inventory items for.
+            items: InventoryItemCreate models, one per item to create.
+
+        Returns:
+            The newly created InventoryItem objects, in the same order as ``items``.
+
+        Raises:
+            NotFoundError: If the character does not exist.
+            AuthorizationError: If you don't have appropriate access.
+            ValidationError: If any item is invalid. Items created before the failure are kept.
+        """
+        return await gather_bounded(
+            (self.create_inventory_item(character_id, item) for item in items),
+            BULK_REQUEST_CONCURRENCY,
+        )
+
+    async def delete_inventory_items(
+        self,
+        character_id: str,
+        item_ids: Iterable[str],
+    ) -> None:
+        """Remove several inventory items from a character concurrently.
+
+        At most ``BULK_REQUEST_CONCURRENCY`` requests are in flight at once. The first
+        failure cancels the requests still pending and is re-raised. The sync client
+        sends them one after another and stops at the first failure.
+        This action cannot be undone.
+
+        Args:
+            character_id: The ID of the character that owns the inventory items.
+            item_ids: The IDs of the inventory items to delete.
+
+        Raises:
+            NotFoundError: If any inventory item does not exist. Items already deleted stay deleted.
+            AuthorizationError: If you don't have appropriate access.
+        """
+        await gather_bounded(
+            (self.delete_inventory_item(character_id, item_id) for item_id in item_ids),
+            BULK_REQUEST_CONCURRENCY,
+        )
@@ -72,7 +72,7 @@ class CompaniesService(BaseService):
         Returns:
             A list of all Company objects.
         """
-        return [company async for company in self.iter_all()]
+        return await self._get_all_as(Endpoints.COMPANIES, Company)
 
     async def iter_all(self, *, limit: int = 100) -> AsyncIterator[Company]:
         """Iterate through all companies you have access to.
@@ -90,8 +90,8 @@ class CompaniesService(BaseService):
             >>> async for company in client.companies.iter_all():
             ...     print(company.name)
         """
-        async for item in self._iter_all_pages(Endpoints.COMPANIES, limit=limit):
-            yield Company.model_validate(item)
+        async for company in self._iter_all_pages_as(Endpoints.COMPANIES, Company, limit=limit):
+            yield company
 
     async def get(self, company_id: str) -> Company:
         """Retrieve detailed information about a specific company.
@@ -109,7 +109,7 @@ class CompaniesService(BaseService):
             AuthorizationError: If you don't have access to the company.
         """
         response = await self._get(Endpoints.COMPANY.format(company_id=company_id))
-        return Company.model_validate(response.json())
+        return Company.model_validate_json(response.content)
 
     async def create(
         self,
@@ -138,9 +138,9 @@ class CompaniesService(BaseService):
         body = request if request is not None else self._validate_request(CompanyCreate, **kwargs)
         response = await self._post(
             Endpoints.COMPANIES,
-            json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
+            content=self._serialize_body(body),
         )
-        return NewCompanyResponse.model_validate(response.json())
+        return NewCompanyResponse.model_validate_json(response.content)
 
     async def update(
         self,
@@ -171,9 +171,9 @@ class CompaniesService(BaseService):
         body = request if request is not None else self._validate_request(CompanyUpdate, **kwargs)
         response = await self._patch(
             Endpoints.COMPANY.format(company_id=company_id),
-            json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
+            content=self._serialize_body(body),
         )
-        return Company.model_validate(response.json())
+        return Company.model_validate_json(response.content)
 
     async def delete(self, company_id: str) -> None:
         """Delete a company from the system.
@@ -221,9 +221,9 @@ class CompaniesService(BaseService):
         )
         response = await self._post(
             Endpoints.COMPANY_ACCESS.format(company_id=company_id),
-            json=body.model_dump(mode="json"),
+            content=self._serialize_body(body),
         )
-        return CompanyPermissions.model_validate(response.json())
+        return CompanyPermissions.model_validate_json(response.content)
 
     async def get_statistics(
         self,
@@ -251,7 +251,7 @@ class CompaniesService(BaseService):
             Endpoints.COMPANY_STATISTICS.format(company_id=company_id),
             params={"num_top_traits": num_top_traits},
         )
-        return RollStatistics.model_validate(response.json())
+        return RollStatistics.model_validate_json(response.content)
 
     async def get_audit_log_page(
         self,
@@ -364,10 +364,11 @@ class CompaniesService(BaseService):
             NotFoundError: If the company does not exist.
             AuthorizationError: If you don't have access to the company.
         """
-        return [
-            log
-            async for log in self.iter_all_audit_logs(
-                company_id,
+        model = AuditLogDetail if include and "request_details" in include else AuditLog
+        return await self._get_all_as(
+            Endpoints.COMPANY_AUDIT_LOGS.format(company_id=company_id),
+            model,
+            params=_build_audit_params(
                 acting_user_id=acting_user_id,
                 user_id=user_id,
                 campaign_id=campaign_id,
@@ -379,8 +380,8 @@ class CompaniesService(BaseService):
                 date_from=date_from,
                 date_to=date_to,
                 include=include,
-            )
-        ]
+            ),
+        )
 
     async def iter_all_audit_logs(
         self,
@@ -440,9 +441,10 @@ class CompaniesService(BaseService):
             date_to=date_to,
             include=include,
         )
-        async for item in self._iter_all_pages(
+        async for log in self._iter_all_pages_as(
             Endpoints.COMPANY_AUDIT_LOGS.format(company_id=company_id),
+            model,
             limit=limit,
             params=params,
         ):
-            yield model.model_validate(item)
+            yield log
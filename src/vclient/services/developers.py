@@ -34,7 +34,7 @@ class DeveloperService(BaseService):
             AuthenticationError: If the API key is invalid or missing.
         """
         response = await self._get(Endpoints.DEVELOPER_ME)
-        return MeDeveloper.model_validate(response.json())
+        return MeDeveloper.model_validate_json(response.content)
 
     async def update_me(
         self,
@@ -64,9 +64,9 @@ class DeveloperService(BaseService):
         )
         response = await self._patch(
             Endpoints.DEVELOPER_ME,
-            json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
+            content=self._serialize_body(body),
         )
-        return MeDeveloper.model_validate(response.json())
+        return MeDeveloper.model_validate_json(response.content)
 
     async def regenerate_api_key(self) -> MeDeveloperWithApiKey:
         """Generate a new API key for the current developer.
@@ -83,4 +83,4 @@ class DeveloperService(BaseService):
             AuthenticationError: If the current API key is invalid.
         """
         response = await self._post(Endpoints.DEVELOPER_ME_NEW_KEY)
-        return MeDeveloperWithApiKey.model_validate(response.json())
+        return MeDeveloperWithApiKey.model_validate_json(response.content)
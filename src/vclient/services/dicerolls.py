@@ -97,15 +97,16 @@ class DicerollService(BaseService):
         Returns:
             A list of all Diceroll objects.
         """
-        return [
-            diceroll
-            async for diceroll in self.iter_all(
+        return await self._get_all_as(
+            self._format_endpoint(Endpoints.DICEROLLS),
+            Diceroll,
+            params=self._build_params(
                 userid=userid,
                 characterid=characterid,
                 campaignid=campaignid,
                 character_type=character_type,
-            )
-        ]
+            ),
+        )
 
     async def iter_all(
         self,
@@ -129,8 +130,9 @@ class DicerollService(BaseService):
         Yields:
             Individual Diceroll objects.
         """
-        async for item in self._iter_all_pages(
+        async for diceroll in self._iter_all_pages_as(
             self._format_endpoint(Endpoints.DICEROLLS),
+            Diceroll,
             limit=limit,
             params=self._build_params(
                 userid=userid,
@@ -139,14 +141,14 @@ class DicerollService(BaseService):
                 character_type=character_type,
             ),
         ):
-            yield Diceroll.model_validate(item)
+            yield diceroll
 
     async def get(self, diceroll_id: str) -> Diceroll:
         """Retrieve a specific dice roll."""
         response = await self._get(
             self._format_endpoint(Endpoints.DICEROLL, diceroll_id=diceroll_id)
         )
-        return Diceroll.model_validate(response.json())
+        return Diceroll.model_validate_json(response.content)
 
     async def create(
         self,
@@ -166,9 +168,9 @@ class DicerollService(BaseService):
         body = request if request is not None else DicerollCreate(**kwargs)
         response = await self._post(
             self._format_endpoint(Endpoints.DICEROLLS),
-            json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
+            content=self._serialize_body(body),
         )
-        return Diceroll.model_validate(response.json())
+        return Diceroll.model_validate_json(response.content)
 
     async def create_from_quickroll(
         self,
@@ -182,12 +184,14 @@ class DicerollService(BaseService):
         """Create a new dice roll using a quickroll template."""
         response = await self._post(
             self._format_endpoint(Endpoints.DICEROLL_QUICKROLL),
-            json=_DicerollQuickrollCreate(
-                quickroll_id=quickroll_id,
-                character_id=character_id,
-                comment=comment,
-                difficulty=difficulty,
-                num_desperation_dice=num_desperation_dice,
-            ).model_dump(exclude_none=True, exclude_unset=True, mode="json"),
+            content=self._serialize_body(
+                _DicerollQuickrollCreate(
+                    quickroll_id=quickroll_id,
+                    character_id=character_id,
+                    comment=comment,
+                    difficulty=difficulty,
+                    num_desperation_dice=num_desperation_dice,
+                )
+            ),
         )
-        return Diceroll.model_validate(response.json())
+        return Diceroll.model_validate_json(response.content)
@@ -1,9 +1,14 @@
 """Service for interacting with the Dictionary API."""
 
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Iterable
 from typing import TYPE_CHECKING
 
-from vclient.constants import DEFAULT_PAGE_LIMIT, MAX_REFERENCE_PAGE_LIMIT
+from vclient._concurrency import gather_bounded
+from vclient.constants import (
+    BULK_REQUEST_CONCURRENCY,
+    DEFAULT_PAGE_LIMIT,
+    MAX_REFERENCE_PAGE_LIMIT,
+)
 from vclient.endpoints import Endpoints
 from vclient.models import (
     DictionaryTerm,
@@ -59,26 +64,33 @@ class DictionaryService(BaseService):
 
     async def list_all(self, *, term: str | None = None) -> list[DictionaryTerm]:
         """Retrieve all dictionary terms."""
-        return [term async for term in self.iter_all(term=term)]
+        return await self._get_all_as(
+            self._format_endpoint(Endpoints.DICTIONARY_TERMS),
+            DictionaryTerm,
+            limit=MAX_REFERENCE_PAGE_LIMIT,
+            max_limit=MAX_REFERENCE_PAGE_LIMIT,
+            params=self._build_params(term=term),
+        )
 
     async def iter_all(
         self, *, term: str | None = None, limit: int = MAX_REFERENCE_PAGE_LIMIT
     ) -> AsyncIterator[DictionaryTerm]:
         """Iterate through all dictionary terms."""
-        async for item in self._iter_all_pages(
+        async for dictionary_term in self._iter_all_pages_as(
             self._format_endpoint(Endpoints.DICTIONARY_TERMS),
+            DictionaryTerm,
             limit=limit,
             max_limit=MAX_REFERENCE_PAGE_LIMIT,
             params=self._build_params(term=term),
         ):
-            yield DictionaryTerm.model_validate(item)
+            yield dictionary_term
 
     async def get(self, term_id: str) -> DictionaryTerm:
         """Retrieve a specific dictionary term."""
         response = await self._get(
             self._format_endpoint(Endpoints.DICTIONARY_TERM, term_id=term_id)
         )
-        return DictionaryTerm.model_validate(response.json())
+        return DictionaryTerm.model_validate_json(response.content)
 
     async def create(
         self,
@@ -96,9 +108,27 @@ class DictionaryService(BaseService):
         body = request if request is not None else DictionaryTermCreate(**kwargs)
         response = await self._post(
             self._format_endpoint(Endpoints.DICTIONARY_TERMS),
-            json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
+            content=self._serialize_body(body),
+        )
+        return DictionaryTerm.model_validate_json(response.content)
+
+    async def create_many(self, requests: Iterable[DictionaryTermCreate]) -> list[DictionaryTerm]:
+        """Create several dictionary terms concurrently.
+
+        At most ``BULK_REQUEST_CONCURRENCY`` requests are in flight at once. The first
+        failure cancels the requests still pending and is re-raised; terms created before
+        it are kept. The sync client sends them one after another and stops at the first
+        failure.
+
+        Args:
+            requests: DictionaryTermCreate models, one per term to create.
+
+        Returns:
+            The newly created DictionaryTerm objects, in the same order as ``requests``.
+        """
+        return await gather_bounded(
+            (self.create(request) for request in requests), BULK_REQUEST_CONCURRENCY
         )
-        return DictionaryTerm.model_validate(response.json())
 
     async def update(
         self,
@@ -118,9 +148,9 @@ class DictionaryService(BaseService):
         body = request if request is not None else DictionaryTermUpdate(**kwargs)
         response = await self._patch(
             self._format_endpoint(Endpoints.DICTIONARY_TERM, term_id=term_id),
-            json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
+            content=self._serialize_body(body),
         )
-        return DictionaryTerm.model_validate(response.json())
+        return DictionaryTerm.model_validate_json(response.content)
 
     async def delete(self, term_id: str) -> None:
         """Delete a specific dictionary term."""
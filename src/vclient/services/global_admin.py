@@ -1,10 +1,12 @@
 """Service for interacting with the Global Admin API."""
 
 import re
-from collections.abc import AsyncIterator, Sequence
+from collections.abc import AsyncIterator, Iterable, Sequence
 from datetime import datetime
 
+from vclient._concurrency import gather_bounded
 from vclient.constants import (
+    BULK_REQUEST_CONCURRENCY,
     DEFAULT_LOG_TAIL_LIMIT,
     DEFAULT_PAGE_LIMIT,
     MAX_LOG_TAIL_LIMIT,
@@ -109,10 +111,11 @@ class GlobalAdminService(BaseService):
         Returns:
             A list of all Developer objects.
         """
-        return [
-            developer
-            async for developer in self.iter_all_developers(is_global_admin=is_global_admin)
-        ]
+        return await self._get_all_as(
+            Endpoints.ADMIN_DEVELOPERS,
+            Developer,
+            params=self._build_params(is_global_admin=is_global_admin),
+        )
 
     async def iter_all_developers(
         self,
@@ -138,12 +141,13 @@ class GlobalAdminService(BaseService):
         """
         params = self._build_params(is_global_admin=is_global_admin)
 
-        async for item in self._iter_all_pages(
+        async for developer in self._iter_all_pages_as(
             Endpoints.ADMIN_DEVELOPERS,
+            Developer,
             limit=limit,
             params=params,
         ):
-            yield Developer.model_validate(item)
+            yield developer
 
     async def get_developer(self, developer_id: str) -> Developer:
         """Retrieve detailed information about a specific developer.
@@ -159,7 +163,7 @@ class GlobalAdminService(BaseService):
             AuthorizationError: If you don't have global admin privileges.
         """
         response = await self._get(Endpoints.ADMIN_DEVELOPER.format(developer_id=developer_id))
-        return Developer.model_validate(response.json())
+        return Developer.model_validate_json(response.content)
 
     async def create_developer(
         self,
@@ -188,9 +192,9 @@ class GlobalAdminService(BaseService):
         body = request if request is not None else self._validate_request(DeveloperCreate, **kwargs)
         response = await self._post(
             Endpoints.ADMIN_DEVELOPERS,
-            json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
+            content=self._serialize_body(body),
         )
-        return Developer.model_validate(response.json())
+        return Developer.model_validate_json(response.content)
 
     async def update_developer(
         self,
@@ -223,9 +227,9 @@ class GlobalAdminService(BaseService):
         body = request if request is not None else self._validate_request(DeveloperUpdate, **kwargs)
         response = await self._patch(
             Endpoints.ADMIN_DEVELOPER.format(developer_id=developer_id),
-            json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
+            content=self._serialize_body(body),
         )
-        return Developer.model_validate(response.json())
+        return Developer.model_validate_json(response.content)
 
     async def delete_developer(self, developer_id: str) -> None:
         """Remove a developer account from the system.
@@ -241,6 +245,26 @@ class GlobalAdminService(BaseService):
         """
         await self._delete(Endpoints.ADMIN_DEVELOPER.format(developer_id=developer_id))
 
+    async def delete_developers(self, developer_ids: Iterable[str]) -> None:
+        """Remove several developer accounts concurrently.
+
+        At most ``BULK_REQUEST_CONCURRENCY`` requests are in flight at once. The first
+        failure cancels the requests still pending and is re-raised. The sync client
+        sends them one after another and stops at the first failure.
+        Each developer's API key is invalidated immediately.
+
+        Args:
+            developer_ids: The IDs of the developers to delete.
+
+        Raises:
+            NotFoundError: If any developer does not exist. Developers already deleted stay deleted.
+            AuthorizationError: If you don't have global admin privileges.
+        """
+        await gather_bounded(
+            (self.delete_developer(developer_id) for developer_id in developer_ids),
+            BULK_REQUEST_CONCURRENCY,
+        )
+
     async def get_user_page(
         self,
         *,
@@ -301,12 +325,13 @@ class GlobalAdminService(BaseService):
         Returns:
             A list of all matching AdminUser objects.
         """
-        return [
-            user
-            async for user in self.iter_all_users(
+        return await self._get_all_as(
+            Endpoints.ADMIN_USERS,
+            AdminUser,
+            params=self._build_params(
                 company_id=company_id, role=role, email=email, is_archived=is_archived
-            )
-        ]
+            ),
+        )
 
     async def iter_all_users(
         self,
@@ -335,12 +360,13 @@ class GlobalAdminService(BaseService):
         params = self._build_params(
             company_id=company_id, role=role, email=email, is_archived=is_archived
         )
-        async for item in self._iter_all_pages(
+        async for user in self._iter_all_pages_as(
             Endpoints.ADMIN_USERS,
+            AdminUser,
             limit=limit,
             params=params,
         ):
-            yield AdminUser.model_validate(item)
+            yield user
 
     async def get_user(self, user_id: str) -> AdminUser:
         """Retrieve a single user by ID, including archived users.
@@ -352,7 +378,7 @@ class GlobalAdminService(BaseService):
             The AdminUser object, with ``is_archived`` reflecting soft-delete state.
         """
         response = await self._get(Endpoints.ADMIN_USER.format(user_id=user_id))
-        return AdminUser.model_validate(response.json())
+        return AdminUser.model_validate_json(response.content)
 
     async def create_user(
         self,
@@ -376,9 +402,9 @@ class GlobalAdminService(BaseService):
         body = request if request is not None else self._validate_request(AdminUserCreate, **kwargs)
         response = await self._post(
             Endpoints.ADMIN_USERS,
-            json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
+            content=self._serialize_body(body),
         )
-        return AdminUser.model_validate(response.json())
+        return AdminUser.model_validate_json(response.content)
 
     async def update_user(
         self,
@@ -401,9 +427,9 @@ class GlobalAdminService(BaseService):
         body = request if request is not None else self._validate_request(AdminUserUpdate, **kwargs)
         response = await self._patch(
             Endpoints.ADMIN_USER.format(user_id=user_id),
-            json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
+            content=self._serialize_body(body),
         )
-        return AdminUser.model_validate(response.json())
+        return AdminUser.model_validate_json(response.content)
 
     async def delete_user(self, user_id: str) -> None:
         """Soft-delete a user by ID.
@@ -434,7 +460,31 @@ class GlobalAdminService(BaseService):
         response = await self._post(
             Endpoints.ADMIN_DEVELOPER_NEW_KEY.format(developer_id=developer_id)
         )
-        return DeveloperWithApiKey.model_validate(response.json())
+        return DeveloperWithApiKey.model_validate_json(response.content)
+
+    async def create_api_keys(self, developer_ids: Iterable[str]) -> list[DeveloperWithApiKey]:
+        """Generate new API keys for several developers concurrently.
+
+        At most ``BULK_REQUEST_CONCURRENCY`` requests are in flight at once. The first
+        failure cancels the requests still pending and is re-raised. The sync client
+        sends them one after another and stops at the first failure.
+        Each developer's current key is invalidated immediately.
+
+        Args:
+            developer_ids: The IDs of the developers to generate keys for.
+
+        Returns:
+            The Developer objects with their new API keys, in the same order as
+            ``developer_ids``.
+
+        Raises:
+            NotFoundError: If any developer does not exist. Keys already regenerated are kept.
+            AuthorizationError: If you don't have global admin privileges.
+        """
+        return await gather_bounded(
+            (self.create_api_key(developer_id) for developer_id in developer_ids),
+            BULK_REQUEST_CONCURRENCY,
+        )
 
     async def get_audit_log_page(
         self,
@@ -552,10 +602,11 @@ class GlobalAdminService(BaseService):
             NotFoundError: If the developer does not exist.
             AuthorizationError: If you don't have global admin privileges.
         """
-        return [
-            log
-            async for log in self.iter_all_audit_logs(
-                developer_id,
+        model = AuditLogDetail if include and "request_details" in include else AuditLog
+        return await self._get_all_as(
+            Endpoints.ADMIN_DEVELOPER_AUDIT_LOGS.format(developer_id=developer_id),
+            model,
+            params=_build_audit_params(
                 company_id=company_id,
                 acting_user_id=acting_user_id,
                 user_id=user_id,
@@ -568,8 +619,8 @@ class GlobalAdminService(BaseService):
                 date_from=date_from,
                 date_to=date_to,
                 include=include,
-            )
-        ]
+            ),
+        )
 
     async def iter_all_audit_logs(
         self,
@@ -632,12 +683,13 @@ class GlobalAdminService(BaseService):
             date_to=date_to,
             include=include,
         )
-        async for item in self._iter_all_pages(
+        async for log in self._iter_all_pages_as(
             Endpoints.ADMIN_DEVELOPER_AUDIT_LOGS.format(developer_id=developer_id),
+            model,
             limit=limit,
             params=params,
         ):
-            yield model.model_validate(item)
+            yield log
 
     async def tail_logs(
         self,
@@ -665,7 +717,7 @@ class GlobalAdminService(BaseService):
         clamped_limit = min(max(limit, MIN_LOG_TAIL_LIMIT), MAX_LOG_TAIL_LIMIT)
         params = self._build_params(level=level, limit=clamped_limit)
         response = await self._get(Endpoints.ADMIN_LOGS, params=params)
-        return [ServerLogEntry.model_validate(item) for item in response.json()]
+        return self._validate_list(response, ServerLogEntry)
 
     async def download_logs(self) -> ServerLogArchive:
         """Download a zip archive of the server log files.
@@ -78,4 +78,4 @@ class IdentityService(BaseService):
             self._format_endpoint(Endpoints.AUTH_IDENTIFY),
             json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
         )
-        return IdentityResolution.model_validate(response.json())
+        return IdentityResolution.model_validate_json(response.content)
@@ -1,8 +1,9 @@
 """Options and enumerations service."""
 
-import json
 from typing import TYPE_CHECKING
 
+from pydantic_core import from_json
+
 from vclient.endpoints import Endpoints
 from vclient.services.base import BaseService
 
@@ -40,4 +41,4 @@ class OptionsService(BaseService):
             A dictionary of options and enumerations for the api.
         """
         response = await self._get(self._format_endpoint(Endpoints.OPTIONS))
-        return json.loads(response.content)
+        return from_json(response.content)
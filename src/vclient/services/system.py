@@ -33,4 +33,4 @@ class SystemService(BaseService):
             ...     print("Database is healthy")
         """
         response = await self._get(Endpoints.HEALTH)
-        return SystemHealth.model_validate(response.json())
+        return SystemHealth.model_validate_json(response.content)
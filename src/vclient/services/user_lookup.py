@@ -28,7 +28,7 @@ class UserLookupService(BaseService):
             List of companies where a matching user was found. Empty list if no matches.
         """
         response = await self._get(Endpoints.USERS_LOOKUP, params={"email": email})
-        return [UserLookupResult.model_validate(item) for item in response.json()]
+        return self._validate_list(response, UserLookupResult)
 
     async def by_discord_id(self, discord_id: str) -> list[UserLookupResult]:
         """Look up a user by Discord profile ID.
@@ -40,7 +40,7 @@ class UserLookupService(BaseService):
             List of companies where a matching user was found. Empty list if no matches.
         """
         response = await self._get(Endpoints.USERS_LOOKUP, params={"discord_id": discord_id})
-        return [UserLookupResult.model_validate(item) for item in response.json()]
+        return self._validate_list(response, UserLookupResult)
 
     async def by_google_id(self, google_id: str) -> list[UserLookupResult]:
         """Look up a user by Google profile ID.
@@ -52,7 +52,7 @@ class UserLookupService(BaseService):
             List of companies where a matching user was found. Empty list if no matches.
         """
         response = await self._get(Endpoints.USERS_LOOKUP, params={"google_id": google_id})
-        return [UserLookupResult.model_validate(item) for item in response.json()]
+        return self._validate_list(response, UserLookupResult)
 
     async def by_github_id(self, github_id: str) -> list[UserLookupResult]:
         """Look up a user by GitHub profile ID.
@@ -64,7 +64,7 @@ class UserLookupService(BaseService):
             List of companies where a matching user was found. Empty list if no matches.
         """
         response = await self._get(Endpoints.USERS_LOOKUP, params={"github_id": github_id})
-        return [UserLookupResult.model_validate(item) for item in response.json()]
+        return self._validate_list(response, UserLookupResult)
 
     async def by_apple_id(self, apple_id: str) -> list[UserLookupResult]:
         """Look up a user by Apple profile ID.
@@ -76,4 +76,4 @@ class UserLookupService(BaseService):
             List of companies where a matching user was found. Empty list if no matches.
         """
         response = await self._get(Endpoints.USERS_LOOKUP, params={"apple_id": apple_id})
-        return [UserLookupResult.model_validate(item) for item in response.json()]
+        return self._validate_list(response, UserLookupResult)
@@ -1,10 +1,17 @@
 """Service for interacting with the Users API."""
 
 import mimetypes
-from collections.abc import AsyncIterator, Sequence
-from typing import TYPE_CHECKING
-
-from vclient.constants import DEFAULT_PAGE_LIMIT, IdentityProvider, UserInclude, UserRole
+from collections.abc import AsyncIterator, Iterable, Sequence
+from typing import TYPE_CHECKING, BinaryIO
+
+from vclient._concurrency import gather_bounded
+from vclient.constants import (
+    BULK_REQUEST_CONCURRENCY,
+    DEFAULT_PAGE_LIMIT,
+    IdentityProvider,
+    UserInclude,
+    UserRole,
+)
 from vclient.endpoints import Endpoints
 from vclient.models import (
     Asset,
@@ -99,7 +106,7 @@ class UsersService(BaseService):
         Returns:
             A list of all unapproved User objects.
         """
-        return [user async for user in self.iter_all_unapproved()]
+        return await self._get_all_as(self._format_endpoint(Endpoints.USERS_UNAPPROVED_LIST), User)
 
     async def iter_all_unapproved(
         self,
@@ -117,11 +124,12 @@ class UsersService(BaseService):
         Yields:
             Individual User objects.
         """
-        async for item in self._iter_all_pages(
+        async for user in self._iter_all_pages_as(
             self._format_endpoint(Endpoints.USERS_UNAPPROVED_LIST),
+            User,
             limit=limit,
         ):
-            yield User.model_validate(item)
+            yield user
 
     async def approve_user(
         self,
@@ -149,9 +157,9 @@ class UsersService(BaseService):
         body = UserApproveDTO(role=role)
         response = await self._post(
             self._format_endpoint(Endpoints.USER_APPROVE, user_id=user_id),
-            json=body.model_dump(mode="json"),
+            content=self._serialize_body(body),
         )
-        return User.model_validate(response.json())
+        return User.model_validate_json(response.content)
 
     async def deny_user(
         self,
@@ -197,9 +205,9 @@ class UsersService(BaseService):
         )
         response = await self._post(
             self._format_endpoint(Endpoints.USER_MERGE),
-            json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
+            content=self._serialize_body(body),
         )
-        return User.model_validate(response.json())
+        return User.model_validate_json(response.content)
 
     async def link_identity(
         self,
@@ -238,9 +246,9 @@ class UsersService(BaseService):
         body = self._validate_request(UserIdentityLinkDTO, provider=provider, token=token)
         response = await self._post(
             self._format_endpoint(Endpoints.USER_IDENTITIES, user_id=user_id),
-            json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
+            content=self._serialize_body(body),
         )
-        return User.model_validate(response.json())
+        return User.model_validate_json(response.content)
 
     async def unlink_identity(
         self,
@@ -276,7 +284,7 @@ class UsersService(BaseService):
         response = await self._delete(
             self._format_endpoint(Endpoints.USER_IDENTITY, user_id=user_id, provider=provider),
         )
-        return User.model_validate(response.json())
+        return User.model_validate_json(response.content)
 
     # User CRUD Methods
 
@@ -328,7 +336,11 @@ class UsersService(BaseService):
         Returns:
             A list of all User objects.
         """
-        return [user async for user in self.iter_all(user_role=user_role, email=email)]
+        return await self._get_all_as(
+            self._format_endpoint(Endpoints.USERS),
+            User,
+            params=self._build_params(user_role=user_role, email=email),
+        )
 
     async def iter_all(
         self,
@@ -354,12 +366,13 @@ class UsersService(BaseService):
             >>> async for user in users.iter_all():
             ...     print(user.name)
         """
-        async for item in self._iter_all_pages(
+        async for user in self._iter_all_pages_as(
             self._format_endpoint(Endpoints.USERS),
+            User,
             limit=limit,
             params=self._build_params(user_role=user_role, email=email),
         ):
-            yield User.model_validate(item)
+            yield user
 
     async def get(
         self,
@@ -390,7 +403,35 @@ class UsersService(BaseService):
             self._format_endpoint(Endpoints.USER, user_id=user_id),
             params=self._build_params(include=list(include) if include else None),
         )
-        return UserDetail.model_validate(response.json())
+        return UserDetail.model_validate_json(response.content)
+
+    async def get_many(
+        self,
+        user_ids: Iterable[str],
+        *,
+        include: Sequence[UserInclude] | None = None,
+    ) -> list[UserDetail]:
+        """Retrieve several users concurrently.
+
+        At most ``BULK_REQUEST_CONCURRENCY`` requests are in flight at once. The first
+        failure cancels the requests still pending and is re-raised. The sync client
+        sends them one after another and stops at the first failure.
+
+        Args:
+            user_ids: The IDs of the users to retrieve.
+            include: Child resources to embed in each response, as for ``get``.
+
+        Returns:
+            The UserDetail objects, in the same order as ``user_ids``.
+
+        Raises:
+            NotFoundError: If any user does not exist.
+            AuthorizationError: If you don't have access to the company.
+        """
+        return await gather_bounded(
+            (self.get(user_id, include=include) for user_id in user_ids),
+            BULK_REQUEST_CONCURRENCY,
+        )
 
     async def create(
         self,
@@ -427,9 +468,9 @@ class UsersService(BaseService):
         body = request if request is not None else self._validate_request(UserCreate, **kwargs)
         response = await self._post(
             self._format_endpoint(Endpoints.USERS),
-            json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
+            content=self._serialize_body(body),
         )
-        return User.model_validate(response.json())
+        return User.model_validate_json(response.content)
 
     async def update(
         self,
@@ -476,9 +517,9 @@ class UsersService(BaseService):
         body = request if request is not None else self._validate_request(UserUpdate, **kwargs)
         response = await self._patch(
             self._format_endpoint(Endpoints.USER, user_id=user_id),
-            json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
+            content=self._serialize_body(body),
         )
-        return User.model_validate(response.json())
+        return User.model_validate_json(response.content)
 
     async def delete(
         self,
@@ -524,7 +565,7 @@ class UsersService(BaseService):
             self._format_endpoint(Endpoints.USER_STATISTICS, user_id=user_id),
             params={"num_top_traits": num_top_traits},
         )
-        return RollStatistics.model_validate(response.json())
+        return RollStatistics.model_validate_json(response.content)
 
     # Asset Methods
 
@@ -575,7 +616,9 @@ class UsersService(BaseService):
             NotFoundError: If the user does not exist.
             AuthorizationError: If you don't have access to the company.
         """
-        return [asset async for asset in self.iter_all_assets(user_id)]
+        return await self._get_all_as(
+            self._format_endpoint(Endpoints.USER_ASSETS, user_id=user_id), Asset
+        )
 
     async def iter_all_assets(
         self,
@@ -599,11 +642,12 @@ class UsersService(BaseService):
             >>> async for asset in users.iter_all_assets("user_id"):
             ...     print(asset.original_filename)
         """
-        async for item in self._iter_all_pages(
+        async for asset in self._iter_all_pages_as(
             self._format_endpoint(Endpoints.USER_ASSETS, user_id=user_id),
+            Asset,
             limit=limit,
         ):
-            yield Asset.model_validate(item)
+            yield asset
 
     async def get_asset(
         self,
@@ -626,7 +670,7 @@ class UsersService(BaseService):
         response = await self._get(
             self._format_endpoint(Endpoints.USER_ASSET, user_id=user_id, asset_id=asset_id)
         )
-        return Asset.model_validate(response.json())
+        return Asset.model_validate_json(response.content)
 
     async def delete_asset(
         self,
@@ -653,7 +697,7 @@ class UsersService(BaseService):
         self,
         user_id: str,
         filename: str,
-        content: bytes,
+        content: bytes | BinaryIO,
         content_type: str | None = None,
     ) -> Asset:
         """Upload a new image asset for a user.
@@ -671,7 +715,8 @@ class UsersService(BaseService):
         Args:
             user_id: The ID of the user to upload the asset for.
             filename: The original filename of the asset.
-            content: The raw bytes of the file to upload.
+            content: The raw bytes of the file to upload, or a binary file object,
+                which is streamed in chunks rather than read into memory.
             content_type: The MIME type of the file. If not provided, inferred from filename.
 
         Returns:
@@ -689,7 +734,7 @@ class UsersService(BaseService):
             self._format_endpoint(Endpoints.USER_ASSET_UPLOAD, user_id=user_id),
             file=(filename, content, content_type),
         )
-        return Asset.model_validate(response.json())
+        return Asset.model_validate_json(response.content)
 
     # Avatar Methods
 
@@ -697,7 +742,7 @@ class UsersService(BaseService):
         self,
         user_id: str,
         filename: str,
-        content: bytes,
+        content: bytes | BinaryIO,
         content_type: str | None = None,
     ) -> User:
         """Upload a custom avatar for a user, replacing any existing one.
@@ -710,7 +755,8 @@ class UsersService(BaseService):
         Args:
             user_id: The ID of the user to set the avatar for.
             filename: The original filename of the image.
-            content: The raw bytes of the image to upload.
+            content: The raw bytes of the image to upload, or a binary file object,
+                which is streamed in chunks rather than read into memory.
             content_type: The MIME type. If not provided, inferred from filename.
 
         Returns:
@@ -723,7 +769,7 @@ class UsersService(BaseService):
             self._format_endpoint(Endpoints.USER_AVATAR, user_id=user_id),
             file=(filename, content, content_type),
         )
-        return User.model_validate(response.json())
+        return User.model_validate_json(response.content)
 
     async def delete_avatar(self, user_id: str) -> User:
         """Remove a user's custom avatar.
@@ -742,7 +788,7 @@ class UsersService(BaseService):
         response = await self._delete(
             self._format_endpoint(Endpoints.USER_AVATAR, user_id=user_id),
         )
-        return User.model_validate(response.json())
+        return User.model_validate_json(response.content)
 
     # Experience Methods
 
@@ -771,7 +817,34 @@ class UsersService(BaseService):
                 Endpoints.USER_EXPERIENCE_CAMPAIGN, user_id=user_id, campaign_id=campaign_id
             )
         )
-        return CampaignExperience.model_validate(response.json())
+        return CampaignExperience.model_validate_json(response.content)
+
+    async def get_experiences(
+        self,
+        user_ids: Iterable[str],
+        campaign_id: str,
+    ) -> list[CampaignExperience]:
+        """Retrieve several users' experience for a campaign concurrently.
+
+        At most ``BULK_REQUEST_CONCURRENCY`` requests are in flight at once. The first
+        failure cancels the requests still pending and is re-raised. The sync client
+        sends them one after another and stops at the first failure.
+
+        Args:
+            user_ids: The IDs of the users to get experience for.
+            campaign_id: The ID of the campaign to get experience for.
+
+        Returns:
+            CampaignExperience objects, in the same order as ``user_ids``.
+
+        Raises:
+            NotFoundError: If any user does not exist.
+            AuthorizationError: If you don't have access to the company.
+        """
+        return await gather_bounded(
+            (self.get_experience(user_id, campaign_id) for user_id in user_ids),
+            BULK_REQUEST_CONCURRENCY,
+        )
 
     async def add_xp(
         self,
@@ -804,9 +877,9 @@ class UsersService(BaseService):
         )
         response = await self._post(
             self._format_endpoint(Endpoints.USER_EXPERIENCE_XP_ADD, user_id=user_id),
-            json=body.model_dump(mode="json"),
+            content=self._serialize_body(body),
         )
-        return CampaignExperience.model_validate(response.json())
+        return CampaignExperience.model_validate_json(response.content)
 
     async def remove_xp(
         self,
@@ -839,9 +912,9 @@ class UsersService(BaseService):
         )
         response = await self._post(
             self._format_endpoint(Endpoints.USER_EXPERIENCE_XP_REMOVE, user_id=user_id),
-            json=body.model_dump(mode="json"),
+            content=self._serialize_body(body),
         )
-        return CampaignExperience.model_validate(response.json())
+        return CampaignExperience.model_validate_json(response.content)
 
     async def add_cool_points(
         self,
@@ -874,9 +947,9 @@ class UsersService(BaseService):
         )
         response = await self._post(
             self._format_endpoint(Endpoints.USER_EXPERIENCE_CP_ADD, user_id=user_id),
-            json=body.model_dump(mode="json"),
+            content=self._serialize_body(body),
         )
-        return CampaignExperience.model_validate(response.json())
+        return CampaignExperience.model_validate_json(response.content)
 
     # Notes Methods
 
@@ -927,7 +1000,9 @@ class UsersService(BaseService):
             NotFoundError: If the user does not exist.
             AuthorizationError: If you don't have access to the company.
         """
-        return [note async for note in self.iter_all_notes(user_id)]
+        return await self._get_all_as(
+            self._format_endpoint(Endpoints.USER_NOTES, user_id=user_id), Note
+        )
 
     async def iter_all_notes(
         self,
@@ -951,11 +1026,12 @@ class UsersService(BaseService):
             >>> async for note in users.iter_all_notes("user_id"):
             ...     print(note.title)
         """
-        async for item in self._iter_all_pages(
+        async for note in self._iter_all_pages_as(
             self._format_endpoint(Endpoints.USER_NOTES, user_id=user_id),
+            Note,
             limit=limit,
         ):
-            yield Note.model_validate(item)
+            yield note
 
     async def get_note(
         self,
@@ -978,7 +1054,7 @@ class UsersService(BaseService):
         response = await self._get(
             self._format_endpoint(Endpoints.USER_NOTE, user_id=user_id, note_id=note_id)
         )
-        return Note.model_validate(response.json())
+        return Note.model_validate_json(response.content)
 
     async def create_note(
         self,
@@ -1008,9 +1084,9 @@ class UsersService(BaseService):
         body = request if request is not None else self._validate_request(NoteCreate, **kwargs)
         response = await self._post(
             self._format_endpoint(Endpoints.USER_NOTES, user_id=user_id),
-            json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
+            content=self._serialize_body(body),
         )
-        return Note.model_validate(response.json())
+        return Note.model_validate_json(response.content)
 
     async def update_note(
         self,
@@ -1042,9 +1118,9 @@ class UsersService(BaseService):
         body = request if request is not None else self._validate_request(NoteUpdate, **kwargs)
         response = await self._patch(
             self._format_endpoint(Endpoints.USER_NOTE, user_id=user_id, note_id=note_id),
-            json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
+            content=self._serialize_body(body),
         )
-        return Note.model_validate(response.json())
+        return Note.model_validate_json(response.content)
 
     async def delete_note(
         self,
@@ -1119,7 +1195,9 @@ class UsersService(BaseService):
             NotFoundError: If the user does not exist.
             AuthorizationError: If you don't have access to the company.
         """
-        return [qr async for qr in self.iter_all_quickrolls(user_id)]
+        return await self._get_all_as(
+            self._format_endpoint(Endpoints.USER_QUICKROLLS, user_id=user_id), Quickroll
+        )
 
     async def iter_all_quickrolls(
         self,
@@ -1143,11 +1221,12 @@ class UsersService(BaseService):
             >>> async for qr in users.iter_all_quickrolls("user_id"):
             ...     print(qr.name)
         """
-        async for item in self._iter_all_pages(
+        async for quickroll in self._iter_all_pages_as(
             self._format_endpoint(Endpoints.USER_QUICKROLLS, user_id=user_id),
+            Quickroll,
             limit=limit,
         ):
-            yield Quickroll.model_validate(item)
+            yield quickroll
 
     async def get_quickroll(
         self,
@@ -1172,7 +1251,7 @@ class UsersService(BaseService):
                 Endpoints.USER_QUICKROLL, user_id=user_id, quickroll_id=quickroll_id
             )
         )
-        return Quickroll.model_validate(response.json())
+        return Quickroll.model_validate_json(response.content)
 
     async def create_quickroll(
         self,
@@ -1204,9 +1283,9 @@ class UsersService(BaseService):
         body = request if request is not None else self._validate_request(QuickrollCreate, **kwargs)
         response = await self._post(
             self._format_endpoint(Endpoints.USER_QUICKROLLS, user_id=user_id),
-            json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
+            content=self._serialize_body(body),
         )
-        return Quickroll.model_validate(response.json())
+        return Quickroll.model_validate_json(response.content)
 
     async def update_quickroll(
         self,
@@ -1241,9 +1320,9 @@ class UsersService(BaseService):
             self._format_endpoint(
                 Endpoints.USER_QUICKROLL, user_id=user_id, quickroll_id=quickroll_id
             ),
-            json=body.model_dump(exclude_none=True, exclude_unset=True, mode="json"),
+            content=self._serialize_body(body),
         )
-        return Quickroll.model_validate(response.json())
+        return Quickroll.model_validate_json(response.content)
 
     async def delete_quickroll(
         self,
@@ -1267,3 +1346,28 @@ class UsersService(BaseService):
                 Endpoints.USER_QUICKROLL, user_id=user_id, quickroll_id=quickroll_id
             )
         )
+
+    async def delete_quickrolls(
+        self,
+        user_id: str,
+        quickroll_ids: Iterable[str],
+    ) -> None:
+        """Remove several quickrolls from a user concurrently.
+
+        At most ``BULK_REQUEST_CONCURRENCY`` requests are in flight at once. The first
+        failure cancels the requests still pending and is re-raised. The sync client
+        sends them one after another and stops at the first failure.
+        This action cannot be undone.
+
+        Args:
+            user_id: The ID of the user who owns the quickrolls.
+            quickroll_ids: The IDs of the quickrolls to delete.
+
+        Raises:
+            NotFoundError: If any quickroll does not exist. Quickrolls already deleted stay deleted.
+            AuthorizationError: If you don't have appropriate access.
+        """
+        await gather_bounded(
+            (self.delete_quickroll(user_id, quickroll_id) for quickroll_id in quickroll_ids),
+            BULK_REQUEST_CONCURRENCY,
+        )
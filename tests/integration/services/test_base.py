@@ -1,12 +1,16 @@
 """Tests for vclient.services.base."""
 
+import asyncio
+
 import httpx
 import httpx2
 import pytest
 import respx
+from pydantic import BaseModel
 
 from vclient import VClient
 from vclient.constants import API_KEY_HEADER, IDEMPOTENCY_KEY_HEADER, ON_BEHALF_OF_HEADER
+from vclient.endpoints import Endpoints
 from vclient.exceptions import (
     APIError,
     AuthenticationError,
@@ -19,11 +23,17 @@ from vclient.exceptions import (
     ValidationError,
 )
 from vclient.models.pagination import PaginatedResponse
-from vclient.services.base import BaseService
+from vclient.services.base import BaseService, _list_adapter, _page_adapter
 
 pytestmark = pytest.mark.anyio
 
 
+class _Item(BaseModel):
+    """Minimal model for typed pagination tests."""
+
+    id: int
+
+
 class TestBaseServiceRequest:
     """Tests for BaseService._request method."""
 
@@ -275,6 +285,26 @@ class TestBaseServiceHTTPMethods:
         assert route.called
         assert route.calls.last.request.method == method
 
+    @respx.mock
+    @pytest.mark.parametrize("method", ["POST", "PUT", "PATCH"])
+    async def test_serialized_body_sent_as_json(self, base_service, base_url, method):
+        """Verify pre-serialized model bodies are sent as typed JSON content."""
+        # Given: A mocked endpoint and a model with an unset optional field
+        route = getattr(respx, method.lower())(f"{base_url}/path").respond(200, json={})
+
+        class _Body(BaseModel):
+            name: str
+            note: str | None = None
+
+        # When: Sending the serialized model
+        service_method = getattr(base_service, f"_{method.lower()}")
+        await service_method("/path", content=base_service._serialize_body(_Body(name="x")))
+
+        # Then: The body matches model_dump(exclude_none, exclude_unset) and is typed JSON
+        request = route.calls.last.request
+        assert request.content == b'{"name":"x"}'
+        assert request.headers["content-type"] == "application/json"
+
 
 class TestBaseServiceIdempotency:
     """Tests for BaseService idempotency key support."""
@@ -514,6 +544,166 @@ class TestBaseServicePagination:
         assert len(items) == 3
         assert isinstance(items, list)
 
+    @respx.mock
+    async def test_iter_all_pages_as(self, base_service, base_url):
+        """Verify _iter_all_pages_as validates items from every page into the model."""
+        # Given: Mocked endpoints for 2 pages of data
+        respx.get(f"{base_url}/items", params={"limit": "2", "offset": "0"}).respond(
+            200,
+            json={"items": [{"id": 1}, {"id": 2}], "limit": 2, "offset": 0, "total": 3},
+        )
+        respx.get(f"{base_url}/items", params={"limit": "2", "offset": "2"}).respond(
+            200,
+            json={"items": [{"id": 3}], "limit": 2, "offset": 2, "total": 3},
+        )
+
+        # When: Iterating through all pages as models
+        items = [item async for item in base_service._iter_all_pages_as("/items", _Item, limit=2)]
+
+        # Then: All items are returned as validated model instances
+        assert items == [_Item(id=1), _Item(id=2), _Item(id=3)]
+
+    @respx.mock
+    async def test_iter_pages_as(self, base_service, base_url):
+        """Verify _iter_pages_as yields one validated list per page."""
+        # Given: Mocked endpoints for 2 pages of data
+        respx.get(f"{base_url}/items", params={"limit": "2", "offset": "0"}).respond(
+            200,
+            json={"items": [{"id": 1}, {"id": 2}], "limit": 2, "offset": 0, "total": 3},
+        )
+        respx.get(f"{base_url}/items", params={"limit": "2", "offset": "2"}).respond(
+            200,
+            json={"items": [{"id": 3}], "limit": 2, "offset": 2, "total": 3},
+        )
+
+        # When: Iterating page by page
+        pages = [page async for page in base_service._iter_pages_as("/items", _Item, limit=2)]
+
+        # Then: Each page's items arrive together
+        assert pages == [[_Item(id=1), _Item(id=2)], [_Item(id=3)]]
+
+    @respx.mock
+    async def test_get_all_as(self, base_service, base_url):
+        """Verify _get_all_as returns all items as validated model instances."""
+        # Given: A mocked paginated endpoint with all items in one page
+        respx.get(f"{base_url}/items").respond(
+            200,
+            json={"items": [{"id": 1}, {"id": 2}], "limit": 100, "offset": 0, "total": 2},
+        )
+
+        # When: Calling _get_all_as
+        items = await base_service._get_all_as("/items", _Item)
+
+        # Then: All items are returned as a list of models
+        assert items == [_Item(id=1), _Item(id=2)]
+
+    @respx.mock
+    async def test_get_all_as_fetches_remaining_pages_in_order(self, base_service, base_url):
+        """Verify _get_all_as requests every remaining page and keeps offset order."""
+        # Given: Mocked endpoints for 4 pages of data, the first reporting the total
+        routes = [
+            respx.get(f"{base_url}/items", params={"limit": "2", "offset": str(offset)}).respond(
+                200,
+                json={
+                    "items": [{"id": offset + 1}, {"id": offset + 2}][: 7 - offset],
+                    "limit": 2,
+                    "offset": offset,
+                    "total": 7,
+                },
+            )
+            for offset in (0, 2, 4, 6)
+        ]
+
+        # When: Calling _get_all_as
+        items = await base_service._get_all_as("/items", _Item, limit=2)
+
+        # Then: Each page was requested once and items come back in offset order
+        assert all(route.call_count == 1 for route in routes)
+        assert items == [_Item(id=i) for i in range(1, 8)]
+
+    @respx.mock
+    async def test_get_all_as_sequential_when_page_concurrency_is_one(self, base_url, api_key):
+        """Verify page_fetch_concurrency=1 never has two page requests in flight."""
+        # Given: A client limited to one page at a time and 4 pages that answer slowly
+        in_flight = 0
+        peak = 0
+
+        async def slow_page(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            offset = int(request.url.params["offset"])
+            return httpx.Response(
+                200,
+                json={"items": [{"id": offset + 1}], "limit": 1, "offset": offset, "total": 4},
+            )
+
+        respx.get(f"{base_url}/items").mock(side_effect=slow_page)
+        client = VClient(base_url=base_url, api_key=api_key, page_fetch_concurrency=1)
+
+        # When: Calling _get_all_as
+        items = await BaseService(client)._get_all_as("/items", _Item, limit=1)
+        await client.close()
+
+        # Then: Every page was fetched, one request at a time
+        assert items == [_Item(id=i) for i in range(1, 5)]
+        assert peak == 1
+
+    @respx.mock
+    async def test_get_all_as_cancels_pages_after_failure(self, base_service, base_url):
+        """Verify a failed page fetch is raised and cancels the other pages in flight."""
+        # Given: A first page reporting 3 pages, a slow second page and a missing third page
+        cancelled: list[str] = []
+
+        async def slow_page(request: httpx.Request) -> httpx.Response:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(request.url.params["offset"])
+                raise
+            return httpx.Response(200, json={"items": [], "limit": 2, "offset": 2, "total": 6})
+
+        respx.get(f"{base_url}/items", params={"limit": "2", "offset": "0"}).respond(
+            200, json={"items": [{"id": 1}, {"id": 2}], "limit": 2, "offset": 0, "total": 6}
+        )
+        respx.get(f"{base_url}/items", params={"limit": "2", "offset": "2"}).mock(
+            side_effect=slow_page
+        )
+        respx.get(f"{base_url}/items", params={"limit": "2", "offset": "4"}).respond(
+            404, json={"detail": "Not found"}
+        )
+
+        # When/Then: The failed page's error propagates as-is
+        with pytest.raises(NotFoundError):
+            await base_service._get_all_as("/items", _Item, limit=2)
+
+        # Then: The slow page still in flight was cancelled
+        assert cancelled == ["2"]
+
+    async def test_page_adapter_is_cached_per_model(self):
+        """Verify page adapters are built once per model class and validate raw page bodies."""
+        # When: Requesting the adapter twice
+        adapter = _page_adapter(_Item)
+
+        # Then: The same adapter is reused and validates a page body into models
+        assert _page_adapter(_Item) is adapter
+        page = adapter.validate_json(b'{"items": [{"id": 1}, {"id": 2}], "limit": 2, "total": 2}')
+        assert page == {"items": [_Item(id=1), _Item(id=2)], "limit": 2, "total": 2}
+
+    async def test_validate_list_parses_bare_array(self):
+        """Verify a bare JSON array body is validated into models with a cached adapter."""
+        # Given: A response whose body is a JSON array
+        response = httpx2.Response(200, content=b'[{"id": 1}, {"id": 2}]')
+
+        # When: Validating the body as a list of items
+        items = BaseService._validate_list(response, _Item)
+
+        # Then: Items are returned in order and the adapter is reused
+        assert items == [_Item(id=1), _Item(id=2)]
+        assert _list_adapter(_Item) is _list_adapter(_Item)
+
 
 class TestBaseServiceRateLimitHeaderParsing:
     """Tests for BaseService rate limit header parsing."""
@@ -1371,3 +1561,196 @@ class TestGetCustomHeaders:
         # Then: The request carried the custom Accept header
         assert route.called
         assert route.calls.last.request.headers["accept"] == "application/zip"
+
+
+class TestGetETagCache:
+    """Tests for BaseService._get ETag revalidation."""
+
+    @pytest.fixture
+    async def cached_service(self, base_url, api_key):
+        """Return a service on a client with the ETag cache enabled."""
+        client = VClient(base_url=base_url, api_key=api_key, etag_cache_size=2)
+        yield BaseService(client)
+        await client.close()
+
+    async def test_cache_disabled_by_default(self, vclient):
+        """Verify the ETag cache is off unless a size is configured."""
+        # Then: The default client has no cache
+        assert vclient._etag_cache is None
+
+    @respx.mock
+    async def test_not_modified_returns_cached_response(self, cached_service, base_url):
+        """Verify a 304 answer reuses the cached body."""
+        # Given: A first response carrying an ETag, then a 304
+        route = respx.get(f"{base_url}/items").mock(
+            side_effect=[
+                httpx.Response(200, json={"id": 1}, headers={"ETag": '"v1"'}),
+                httpx.Response(304),
+            ]
+        )
+
+        # When: Fetching the same resource twice
+        first = await cached_service._get("/items")
+        second = await cached_service._get("/items")
+
+        # Then: The second request revalidated and returned the cached body
+        assert "if-none-match" not in route.calls[0].request.headers
+        assert route.calls[1].request.headers["if-none-match"] == '"v1"'
+        assert second is first
+        assert second.json() == {"id": 1}
+
+    @respx.mock
+    async def test_unsolicited_not_modified_raises(self, cached_service, base_url):
+        """Verify a 304 to a request without If-None-Match is an error, not an empty body."""
+        # Given: An endpoint answering 304 to an unconditional GET and to a POST
+        respx.get(f"{base_url}/items").respond(304)
+        respx.post(f"{base_url}/items").respond(304)
+
+        # When/Then: Both requests raise an API error
+        with pytest.raises(APIError) as get_error:
+            await cached_service._get("/items")
+        with pytest.raises(APIError) as post_error:
+            await cached_service._post("/items", json={})
+
+        # Then: The errors carry the 304 status and nothing was cached
+        assert get_error.value.status_code == 304
+        assert post_error.value.status_code == 304
+        assert len(cached_service._client._etag_cache) == 0
+
+    @respx.mock
+    async def test_changed_resource_replaces_cached_response(self, cached_service, base_url):
+        """Verify a fresh 200 replaces the cached entry."""
+        # Given: Two successive responses with different ETags
+        respx.get(f"{base_url}/items").mock(
+            side_effect=[
+                httpx.Response(200, json={"id": 1}, headers={"ETag": '"v1"'}),
+                httpx.Response(200, json={"id": 2}, headers={"ETag": '"v2"'}),
+            ]
+        )
+
+        # When: Fetching the resource twice
+        await cached_service._get("/items")
+        second = await cached_service._get("/items")
+
+        # Then: The new body is returned and cached under the new ETag
+        assert second.json() == {"id": 2}
+        assert cached_service._client._etag_cache[("/items", "", None)][0] is second
+
+    @respx.mock
+    async def test_fresh_response_reused_without_request(self, cached_service, base_url):
+        """Verify a response within its Cache-Control max-age is served from the cache."""
+        # Given: A response the server marks fresh for a minute
+        route = respx.get(f"{base_url}/items").respond(
+            200, json={"id": 1}, headers={"Cache-Control": "max-age=60"}
+        )
+
+        # When: Fetching the same resource twice
+        first = await cached_service._get("/items")
+        second = await cached_service._get("/items")
+
+        # Then: Only one request was made and the cached response was reused
+        assert route.call_count == 1
+        assert second is first
+
+    @respx.mock
+    async def test_write_invalidates_related_cached_responses(self, cached_service, base_url):
+        """Verify a successful write drops cached GETs for the resource and its collection."""
+        # Given: Fresh cached responses for an item, its collection, and an unrelated path
+        for path in ("/items", "/items/1", "/other"):
+            respx.get(f"{base_url}{path}").respond(
+                200, json={}, headers={"Cache-Control": "max-age=60"}
+            )
+            await cached_service._get(path)
+        respx.patch(f"{base_url}/items/1").respond(200, json={})
+
+        # When: Updating the item
+        await cached_service._patch("/items/1", json={"name": "new"})
+
+        # Then: Only the unrelated entry is still cached
+        assert [key[0] for key in cached_service._client._etag_cache] == ["/other"]
+
+    @respx.mock
+    async def test_write_invalidates_sibling_reads_of_the_owning_resource(
+        self, cached_service, base_url
+    ):
+        """Verify adding XP drops the user's cached experience but not other users'."""
+        # Given: Fresh cached experience for two users of the same company
+        users = cached_service._client.users("on-behalf-of-user", company_id="company123")
+        experience = {"campaign_id": "campaign123", "xp_current": 50, "xp_total": 100}
+        routes = {}
+        for user_id in ("user123", "user456"):
+            path = Endpoints.USER_EXPERIENCE_CAMPAIGN.format(
+                company_id="company123", user_id=user_id, campaign_id="campaign123"
+            )
+            routes[user_id] = respx.get(f"{base_url}{path}").respond(
+                200, json=experience, headers={"Cache-Control": "max-age=60"}
+            )
+            await users.get_experience(user_id, "campaign123")
+        respx.post(
+            f"{base_url}{Endpoints.USER_EXPERIENCE_XP_ADD.format(company_id='company123', user_id='user123')}"
+        ).respond(201, json={**experience, "xp_current": 150})
+
+        # When: Adding XP to one user, then reading both users' experience again
+        await users.add_xp("user123", "campaign123", amount=100)
+        await users.get_experience("user123", "campaign123")
+        await users.get_experience("user456", "campaign123")
+
+        # Then: Only the user whose XP changed was fetched again
+        assert routes["user123"].call_count == 2
+        assert routes["user456"].call_count == 1
+
+    @respx.mock
+    async def test_no_store_response_is_not_cached(self, cached_service, base_url):
+        """Verify responses marked no-store are never kept, even with an ETag."""
+        # Given: A response carrying an ETag but forbidding storage
+        route = respx.get(f"{base_url}/items").respond(
+            200, json={}, headers={"ETag": '"v1"', "Cache-Control": "no-store"}
+        )
+
+        # When: Fetching the resource twice
+        await cached_service._get("/items")
+        await cached_service._get("/items")
+
+        # Then: Nothing was cached and the second request was unconditional
+        assert len(cached_service._client._etag_cache) == 0
+        assert "if-none-match" not in route.calls.last.request.headers
+
+    @respx.mock
+    async def test_cache_is_keyed_by_query_params(self, cached_service, base_url):
+        """Verify different query params are cached separately."""
+        # Given: An endpoint that always returns an ETag
+        route = respx.get(f"{base_url}/items").respond(200, json={}, headers={"ETag": '"v1"'})
+
+        # When: Fetching two different pages
+        await cached_service._get("/items", params={"offset": 0})
+        await cached_service._get("/items", params={"offset": 10})
+
+        # Then: Neither request was conditional
+        assert all("if-none-match" not in call.request.headers for call in route.calls)
+
+    @respx.mock
+    async def test_least_recently_used_entry_is_evicted(self, cached_service, base_url):
+        """Verify the cache never grows past its configured size."""
+        # Given: An endpoint that always returns an ETag
+        respx.get(url__regex=rf"{base_url}/items/\d").respond(
+            200, json={}, headers={"ETag": '"v1"'}
+        )
+
+        # When: Fetching more distinct resources than the cache holds
+        for item_id in range(3):
+            await cached_service._get(f"/items/{item_id}")
+
+        # Then: Only the most recent entries remain
+        assert [key[0] for key in cached_service._client._etag_cache] == ["/items/1", "/items/2"]
+
+    @respx.mock
+    async def test_custom_headers_bypass_cache(self, cached_service, base_url):
+        """Verify requests with caller headers are never cached."""
+        # Given: An endpoint that returns an ETag
+        respx.get(f"{base_url}/items").respond(200, json={}, headers={"ETag": '"v1"'})
+
+        # When: Fetching with a custom Accept header
+        await cached_service._get("/items", headers={"Accept": "application/zip"})
+
+        # Then: Nothing was cached
+        assert len(cached_service._client._etag_cache) == 0
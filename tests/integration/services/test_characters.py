@@ -1,14 +1,16 @@
 """Integration tests for CharactersService."""
 
 import copy
+import json
 from datetime import UTC, date, datetime
 
+import httpx
 import pytest
 import respx
 from httpx import Response
 
 from vclient.endpoints import Endpoints
-from vclient.exceptions import NotFoundError
+from vclient.exceptions import NotFoundError, RequestValidationError
 from vclient.models import (
     Asset,
     Character,
@@ -18,6 +20,7 @@ from vclient.models import (
     HunterAttributesCreate,
     HunterAttributesUpdate,
     InventoryItem,
+    InventoryItemCreate,
     NameDescriptionSubDocument,
     Note,
     PaginatedResponse,
@@ -684,6 +687,25 @@ class TestCharactersServiceCreate:
         assert body["traits"][1]["trait_id"] == "trait456"
         assert body["traits"][1]["value"] == 2
 
+    @respx.mock
+    async def test_create_character_validation_error_skips_request(self, vclient) -> None:
+        """Verify invalid create data raises before any request is sent."""
+        # Given: A catch-all route
+        route = respx.route().respond(201)
+
+        # When/Then: Creating with a too-short first name raises RequestValidationError
+        with pytest.raises(RequestValidationError):
+            await vclient.characters("on-behalf-of-user", company_id="company123").create(
+                campaign_id="campaign123",
+                character_class="VAMPIRE",
+                game_version="V5",
+                name_first="Jo",
+                name_last="Doe",
+            )
+
+        # Then: No request reached the network
+        assert not route.called
+
 
 class TestCharactersServiceUpdate:
     """Tests for CharactersService.update method."""
@@ -942,6 +964,21 @@ class TestCharactersServiceUpdate:
         assert "hunter_attributes" in body
         assert body["hunter_attributes"]["creed"] == "Defender"
 
+    @respx.mock
+    async def test_update_character_validation_error_skips_request(self, vclient) -> None:
+        """Verify invalid update data raises before any request is sent."""
+        # Given: A catch-all route
+        route = respx.route().respond(200)
+
+        # When/Then: Updating with an over-long nickname raises RequestValidationError
+        with pytest.raises(RequestValidationError):
+            await vclient.characters("on-behalf-of-user", company_id="company123").update(
+                "char123", name_nick="x" * 51
+            )
+
+        # Then: No request reached the network
+        assert not route.called
+
 
 class TestCharactersServiceDelete:
     """Tests for CharactersService.delete method."""
@@ -1321,6 +1358,22 @@ class TestCharactersServiceNotes:
         # Then: Request was made
         assert route.called
 
+    @respx.mock
+    async def test_note_validation_error_skips_request(self, vclient) -> None:
+        """Verify invalid note data raises before any request is sent."""
+        # Given: A catch-all route
+        route = respx.route().respond(201)
+        service = vclient.characters("on-behalf-of-user", company_id="company123")
+
+        # When/Then: Creating or updating a note with a too-short title raises
+        with pytest.raises(RequestValidationError):
+            await service.create_note("char123", title="AB", content="Valid content")
+        with pytest.raises(RequestValidationError):
+            await service.update_note("char123", "note123", title="AB")
+
+        # Then: No request reached the network
+        assert not route.called
+
 
 class TestCharactersServiceGetStatistics:
     """Tests for CharactersService.get_statistics method."""
@@ -1659,3 +1712,68 @@ class TestCharactersServiceInventory:
 
         # Then: Request was made
         assert route.called
+
+    @respx.mock
+    async def test_create_inventory_items(self, vclient, base_url, inventory_item_response_data):
+        """Verify creating several inventory items returns results in input order."""
+        # Given: A create endpoint that echoes the submitted name
+        company_id = "company123"
+        character_id = "char123"
+
+        def echo_name(request: httpx.Request) -> Response:
+            name = json.loads(request.content)["name"]
+            return Response(201, json={**inventory_item_response_data, "name": name})
+
+        route = respx.post(
+            f"{base_url}{Endpoints.CHARACTER_INVENTORY.format(company_id=company_id, character_id=character_id)}"
+        ).mock(side_effect=echo_name)
+        items = [InventoryItemCreate(name=name, type="BOOK") for name in ("First", "Second")]
+
+        # When: Creating the inventory items in bulk
+        result = await vclient.characters(
+            "on-behalf-of-user", company_id=company_id
+        ).create_inventory_items(character_id, items)
+
+        # Then: One request per item was made and results keep the input order
+        assert route.call_count == 2
+        assert [item.name for item in result] == ["First", "Second"]
+
+    @respx.mock
+    async def test_delete_inventory_items(self, vclient, base_url):
+        """Verify deleting several inventory items."""
+        # Given: Mocked delete endpoints for two items
+        company_id = "company123"
+        character_id = "char123"
+        routes = [
+            respx.delete(
+                f"{base_url}{Endpoints.CHARACTER_INVENTORY_ITEM.format(company_id=company_id, character_id=character_id, item_id=item_id)}"
+            ).respond(204)
+            for item_id in ("item1", "item2")
+        ]
+
+        # When: Deleting the inventory items in bulk
+        await vclient.characters("on-behalf-of-user", company_id=company_id).delete_inventory_items(
+            character_id, ["item1", "item2"]
+        )
+
+        # Then: Each item was deleted
+        assert all(route.called for route in routes)
+
+    @respx.mock
+    async def test_delete_inventory_items_raises_first_failure(self, vclient, base_url):
+        """Verify a failed delete surfaces as its own error, not an exception group."""
+        # Given: One missing item among the items to delete
+        company_id = "company123"
+        character_id = "char123"
+        respx.delete(
+            f"{base_url}{Endpoints.CHARACTER_INVENTORY_ITEM.format(company_id=company_id, character_id=character_id, item_id='item1')}"
+        ).respond(204)
+        respx.delete(
+            f"{base_url}{Endpoints.CHARACTER_INVENTORY_ITEM.format(company_id=company_id, character_id=character_id, item_id='missing')}"
+        ).respond(404, json={"detail": "Inventory item not found"})
+
+        # When/Then: Deleting in bulk raises NotFoundError
+        with pytest.raises(NotFoundError):
+            await vclient.characters(
+                "on-behalf-of-user", company_id=company_id
+            ).delete_inventory_items(character_id, ["item1", "missing"])
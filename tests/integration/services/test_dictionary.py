@@ -1,13 +1,17 @@
 """Integration tests for DictionaryService."""
 
+import asyncio
 import json
 
+import httpx
 import pytest
 import respx
+from httpx import Response
 
+from vclient.constants import BULK_REQUEST_CONCURRENCY
 from vclient.endpoints import Endpoints
 from vclient.exceptions import NotFoundError
-from vclient.models import DictionaryTerm, PaginatedResponse
+from vclient.models import DictionaryTerm, DictionaryTermCreate, PaginatedResponse
 
 pytestmark = pytest.mark.anyio
 
@@ -336,6 +340,61 @@ class TestDictionaryServiceCreate:
             "synonyms": ["Test Synonym", "Test Synonym 2"],
         }
 
+    @respx.mock
+    async def test_create_many(self, vclient, base_url, dictionary_term_response_data):
+        """Verify creating several dictionary terms returns results in input order."""
+        # Given: A create endpoint that echoes the submitted term
+        company_id = "company123"
+
+        def echo_term(request: httpx.Request) -> Response:
+            term = json.loads(request.content)["term"]
+            return Response(201, json={**dictionary_term_response_data, "term": term})
+
+        route = respx.post(
+            f"{base_url}{Endpoints.DICTIONARY_TERMS.format(company_id=company_id)}",
+        ).mock(side_effect=echo_term)
+        requests = [DictionaryTermCreate(term=term) for term in ("Embrace", "Frenzy")]
+
+        # When: Creating the terms in bulk
+        result = await vclient.dictionary("on-behalf-of-user", company_id=company_id).create_many(
+            requests
+        )
+
+        # Then: One request per term was made and results keep the input order
+        assert route.call_count == 2
+        assert [term.term for term in result] == ["Embrace", "Frenzy"]
+
+    @respx.mock
+    async def test_create_many_raises_first_failure(
+        self, vclient, base_url, dictionary_term_response_data
+    ):
+        """Verify the first failed create is raised and the remaining terms are never sent."""
+        # Given: A create endpoint that fails the first term and answers the others slowly
+        company_id = "company123"
+        calls = 0
+
+        async def fail_first(request: httpx.Request) -> Response:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                return Response(404, json={"detail": "Company not found"})
+            await asyncio.sleep(0.05)
+            return Response(201, json=dictionary_term_response_data)
+
+        route = respx.post(
+            f"{base_url}{Endpoints.DICTIONARY_TERMS.format(company_id=company_id)}",
+        ).mock(side_effect=fail_first)
+        requests = [DictionaryTermCreate(term=f"Term {i}") for i in range(20)]
+
+        # When/Then: Creating the terms raises the failed request's error
+        with pytest.raises(NotFoundError):
+            await vclient.dictionary("on-behalf-of-user", company_id=company_id).create_many(
+                requests
+            )
+
+        # Then: No request beyond the first in-flight batch was started
+        assert route.call_count <= BULK_REQUEST_CONCURRENCY
+
 
 class TestDictionaryServiceUpdate:
     """Tests for DictionaryService.update method."""
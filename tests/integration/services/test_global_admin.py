@@ -1,10 +1,13 @@
 """Tests for vclient.services.global_admin."""
 
+import asyncio
 import json
 
+import httpx
 import pytest
 import respx
 
+from vclient.constants import BULK_REQUEST_CONCURRENCY
 from vclient.endpoints import Endpoints
 from vclient.exceptions import AuthorizationError, NotFoundError
 from vclient.models import AdminUser, Developer, DeveloperWithApiKey, PaginatedResponse
@@ -465,6 +468,52 @@ class TestGlobalAdminServiceDelete:
         with pytest.raises(AuthorizationError):
             await vclient.global_admin.delete_developer(developer_id)
 
+    @respx.mock
+    async def test_delete_developers(self, vclient, base_url):
+        """Verify deleting several developers sends one request per developer."""
+        # Given: Mocked delete endpoints for two developers
+        routes = [
+            respx.delete(
+                f"{base_url}{Endpoints.ADMIN_DEVELOPER.format(developer_id=developer_id)}"
+            ).respond(204)
+            for developer_id in ("dev1", "dev2")
+        ]
+
+        # When: Deleting the developers in bulk
+        result = await vclient.global_admin.delete_developers(["dev1", "dev2"])
+
+        # Then: Each developer was deleted once
+        assert result is None
+        assert all(route.call_count == 1 for route in routes)
+
+    @respx.mock
+    async def test_delete_developers_cancels_pending_on_failure(self, vclient, base_url):
+        """Verify a failed delete is raised and cancels the deletes still in flight."""
+        # Given: A slow delete for the first developer and a missing second developer
+        cancelled: list[str] = []
+
+        async def slow_delete(request: httpx.Request) -> httpx.Response:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append("dev1")
+                raise
+            return httpx.Response(204)
+
+        respx.delete(f"{base_url}{Endpoints.ADMIN_DEVELOPER.format(developer_id='dev1')}").mock(
+            side_effect=slow_delete
+        )
+        respx.delete(f"{base_url}{Endpoints.ADMIN_DEVELOPER.format(developer_id='dev2')}").respond(
+            404, json={"detail": "Developer not found"}
+        )
+
+        # When/Then: The failed delete's error propagates as-is
+        with pytest.raises(NotFoundError):
+            await vclient.global_admin.delete_developers(["dev1", "dev2"])
+
+        # Then: The delete still in flight was cancelled
+        assert cancelled == ["dev1"]
+
 
 class TestGlobalAdminServiceCreateApiKey:
     """Tests for GlobalAdminService.create_api_key method."""
@@ -514,6 +563,59 @@ class TestGlobalAdminServiceCreateApiKey:
         with pytest.raises(AuthorizationError):
             await vclient.global_admin.create_api_key(developer_id)
 
+    @respx.mock
+    async def test_create_api_keys(self, vclient, base_url, developer_response_data):
+        """Verify creating several API keys returns results in input order."""
+        # Given: Mocked create key endpoints for two developers
+        for developer_id in ("dev1", "dev2"):
+            respx.post(
+                f"{base_url}{Endpoints.ADMIN_DEVELOPER_NEW_KEY.format(developer_id=developer_id)}"
+            ).respond(
+                201,
+                json={
+                    **developer_response_data,
+                    "id": developer_id,
+                    "api_key": f"key-{developer_id}",
+                },
+            )
+
+        # When: Creating the API keys in bulk
+        result = await vclient.global_admin.create_api_keys(["dev1", "dev2"])
+
+        # Then: Each developer gets its own key, in input order
+        assert all(isinstance(item, DeveloperWithApiKey) for item in result)
+        assert [item.api_key for item in result] == ["key-dev1", "key-dev2"]
+
+    @respx.mock
+    async def test_create_api_keys_stops_after_failure(
+        self, vclient, base_url, developer_response_data
+    ):
+        """Verify a failed key request is raised and later developers are never sent."""
+        # Given: More developers than the concurrency limit; the first is missing and the
+        # others answer slowly
+        developer_ids = [f"dev{index}" for index in range(BULK_REQUEST_CONCURRENCY * 2)]
+
+        async def slow_key(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.05)
+            return httpx.Response(201, json={**developer_response_data, "api_key": "vapi_new"})
+
+        respx.post(
+            f"{base_url}{Endpoints.ADMIN_DEVELOPER_NEW_KEY.format(developer_id='dev0')}"
+        ).respond(404, json={"detail": "Developer not found"})
+        routes = [
+            respx.post(
+                f"{base_url}{Endpoints.ADMIN_DEVELOPER_NEW_KEY.format(developer_id=developer_id)}"
+            ).mock(side_effect=slow_key)
+            for developer_id in developer_ids[1:]
+        ]
+
+        # When/Then: The failed request's error propagates as-is
+        with pytest.raises(NotFoundError):
+            await vclient.global_admin.create_api_keys(developer_ids)
+
+        # Then: Developers past the first in-flight batch never got a request
+        assert not any(route.called for route in routes[BULK_REQUEST_CONCURRENCY:])
+
 
 class TestGlobalAdminServiceClientIntegration:
     """Tests for VClient.global_admin property."""
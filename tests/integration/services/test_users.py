@@ -1,7 +1,10 @@
 """Tests for vclient.services.users."""
 
+import asyncio
+import io
 import json
 
+import httpx
 import pytest
 import respx
 
@@ -315,6 +318,57 @@ class TestUsersServiceGet:
         assert result.notes is None
         assert result.assets is None
 
+    @respx.mock
+    async def test_get_many(self, vclient, base_url, user_response_data):
+        """Verify getting several users returns them in input order."""
+        # Given: Mocked endpoints for two users
+        company_id = "company123"
+        user_ids = ["user1", "user2"]
+        routes = [
+            respx.get(
+                f"{base_url}{Endpoints.USER.format(company_id=company_id, user_id=user_id)}"
+            ).respond(200, json={**user_response_data, "id": user_id})
+            for user_id in user_ids
+        ]
+
+        # When: Getting both users
+        result = await vclient.users("on-behalf-of-user", company_id=company_id).get_many(user_ids)
+
+        # Then: Each user was fetched and results follow the input order
+        assert all(route.call_count == 1 for route in routes)
+        assert [user.id for user in result] == user_ids
+
+    @respx.mock
+    async def test_get_many_cancels_pending_on_failure(self, vclient, base_url, user_response_data):
+        """Verify a missing user is raised and cancels the lookups still in flight."""
+        # Given: A slow lookup for the first user and a missing second user
+        company_id = "company123"
+        cancelled: list[str] = []
+
+        async def slow_user(request: httpx.Request) -> httpx.Response:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append("user1")
+                raise
+            return httpx.Response(200, json=user_response_data)
+
+        respx.get(
+            f"{base_url}{Endpoints.USER.format(company_id=company_id, user_id='user1')}"
+        ).mock(side_effect=slow_user)
+        respx.get(
+            f"{base_url}{Endpoints.USER.format(company_id=company_id, user_id='user2')}"
+        ).respond(404, json={"detail": "User not found"})
+
+        # When/Then: The missing user's error propagates as-is
+        with pytest.raises(NotFoundError):
+            await vclient.users("on-behalf-of-user", company_id=company_id).get_many(
+                ["user1", "user2"]
+            )
+
+        # Then: The lookup still in flight was cancelled
+        assert cancelled == ["user1"]
+
 
 class TestUsersServiceCreate:
     """Tests for UsersService.create method."""
@@ -907,6 +961,27 @@ class TestUsersServiceAssets:
         assert isinstance(result, Asset)
         assert result.id == "asset123"
 
+    @respx.mock
+    async def test_upload_asset_from_file_object(self, vclient, base_url, asset_response_data):
+        """Verify an asset can be uploaded from an open binary file."""
+        # Given: A mocked upload endpoint and a file object
+        company_id = "company123"
+        user_id = "user123"
+        route = respx.post(
+            f"{base_url}{Endpoints.USER_ASSET_UPLOAD.format(company_id=company_id, user_id=user_id)}"
+        ).respond(201, json=asset_response_data)
+
+        # When: Uploading the file object
+        result = await vclient.users("on-behalf-of-user", company_id=company_id).upload_asset(
+            user_id,
+            filename="test.png",
+            content=io.BytesIO(b"fake image content"),
+        )
+
+        # Then: The file's bytes were sent and an Asset is returned
+        assert b"fake image content" in route.calls.last.request.content
+        assert isinstance(result, Asset)
+
 
 class TestUsersServiceExperience:
     """Tests for UsersService experience methods."""
@@ -932,6 +1007,29 @@ class TestUsersServiceExperience:
         assert isinstance(result, CampaignExperience)
         assert result.campaign_id == "campaign123"
 
+    @respx.mock
+    async def test_get_experiences(self, vclient, base_url, experience_response_data):
+        """Verify getting several users' experience returns results in input order."""
+        # Given: Mocked experience endpoints for two users
+        company_id = "company123"
+        campaign_id = "campaign123"
+        user_ids = ["user1", "user2"]
+        routes = [
+            respx.get(
+                f"{base_url}{Endpoints.USER_EXPERIENCE_CAMPAIGN.format(company_id=company_id, user_id=user_id, campaign_id=campaign_id)}"
+            ).respond(200, json={**experience_response_data, "xp_current": xp})
+            for user_id, xp in zip(user_ids, [10, 20], strict=True)
+        ]
+
+        # When: Getting experience for both users
+        result = await vclient.users("on-behalf-of-user", company_id=company_id).get_experiences(
+            user_ids, campaign_id
+        )
+
+        # Then: Each user was fetched and results follow the input order
+        assert all(route.call_count == 1 for route in routes)
+        assert [experience.xp_current for experience in result] == [10, 20]
+
     @respx.mock
     async def test_add_xp(self, vclient, base_url, experience_response_data):
         """Verify adding XP to a user."""
@@ -1239,6 +1337,60 @@ class TestUsersServiceQuickrolls:
         # Then: Request was made
         assert route.called
 
+    @respx.mock
+    async def test_delete_quickrolls(self, vclient, base_url):
+        """Verify deleting several quickrolls sends one request per quickroll."""
+        # Given: Mocked delete endpoints for two quickrolls
+        company_id = "company123"
+        user_id = "user123"
+        quickroll_ids = ["quickroll1", "quickroll2"]
+        routes = [
+            respx.delete(
+                f"{base_url}{Endpoints.USER_QUICKROLL.format(company_id=company_id, user_id=user_id, quickroll_id=quickroll_id)}"
+            ).respond(204)
+            for quickroll_id in quickroll_ids
+        ]
+
+        # When: Deleting both quickrolls
+        await vclient.users("on-behalf-of-user", company_id=company_id).delete_quickrolls(
+            user_id, quickroll_ids
+        )
+
+        # Then: Each quickroll was deleted once
+        assert all(route.call_count == 1 for route in routes)
+
+    @respx.mock
+    async def test_delete_quickrolls_cancels_pending_on_failure(self, vclient, base_url):
+        """Verify a failed delete is raised and cancels the deletes still in flight."""
+        # Given: A slow delete for the first quickroll and a missing second quickroll
+        company_id = "company123"
+        user_id = "user123"
+        cancelled: list[str] = []
+
+        async def slow_delete(request: httpx.Request) -> httpx.Response:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append("quickroll1")
+                raise
+            return httpx.Response(204)
+
+        respx.delete(
+            f"{base_url}{Endpoints.USER_QUICKROLL.format(company_id=company_id, user_id=user_id, quickroll_id='quickroll1')}"
+        ).mock(side_effect=slow_delete)
+        respx.delete(
+            f"{base_url}{Endpoints.USER_QUICKROLL.format(company_id=company_id, user_id=user_id, quickroll_id='quickroll2')}"
+        ).respond(404, json={"detail": "Quickroll not found"})
+
+        # When/Then: The failed delete's error propagates as-is
+        with pytest.raises(NotFoundError):
+            await vclient.users("on-behalf-of-user", company_id=company_id).delete_quickrolls(
+                user_id, ["quickroll1", "quickroll2"]
+            )
+
+        # Then: The delete still in flight was cancelled
+        assert cancelled == ["quickroll1"]
+
 
 class TestUsersServiceFactoryMethod:
     """Tests for VClient.users factory method."""
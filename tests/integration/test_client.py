@@ -5,12 +5,15 @@ import pytest
 from vclient import VClient
 from vclient.constants import (
     API_KEY_HEADER,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
     DEFAULT_MAX_RETRIES,
     DEFAULT_RETRY_DELAY,
     DEFAULT_TIMEOUT,
     ENV_API_KEY,
     ENV_BASE_URL,
     ENV_DEFAULT_COMPANY_ID,
+    PAGE_FETCH_CONCURRENCY,
 )
 
 pytestmark = pytest.mark.anyio
@@ -65,6 +68,10 @@ class TestVClientInit:
         assert client._config.auto_idempotency_keys is False
         assert client._config.default_company_id is None
         assert client._config.headers == {}
+        assert client._config.max_connections == DEFAULT_MAX_CONNECTIONS
+        assert client._config.max_keepalive_connections == DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+        assert client._config.page_fetch_concurrency == PAGE_FETCH_CONCURRENCY
+        assert client._config.http2 is False
 
     def test_auto_idempotency_keys_passed_to_config(self):
         """Verify auto_idempotency_keys parameter is passed to config."""
@@ -128,6 +135,32 @@ class TestVClientHTTPClient:
         assert client._http.headers.get("Accept") == "application/json"
         assert client._http.headers.get(API_KEY_HEADER) == "my-key"
 
+    def test_http_client_connection_limits(self):
+        """Verify connection pool limits are passed to the HTTP transport."""
+        # When: Creating a client with custom pool limits
+        client = VClient(
+            base_url="https://test.api.com",
+            api_key="my-key",
+            max_connections=50,
+            max_keepalive_connections=5,
+        )
+
+        # Then: The underlying connection pool uses those limits
+        pool = client._http._transport._pool
+        assert pool._max_connections == 50
+        assert pool._max_keepalive_connections == 5
+
+    def test_http_client_http2(self):
+        """Verify http2=True enables HTTP/2 on the connection pool."""
+        # Given: The optional h2 dependency is installed
+        pytest.importorskip("h2")
+
+        # When: Creating a client with HTTP/2 enabled
+        client = VClient(base_url="https://test.api.com", api_key="my-key", http2=True)
+
+        # Then: The connection pool negotiates HTTP/2
+        assert client._http._transport._pool._http2 is True
+
 
 class TestVClientContextManager:
     """Tests for VClient async context manager."""
@@ -1,10 +1,13 @@
 """Smoke tests for the synchronous SyncVClient."""
 
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 import respx
 from httpx import Response
 
 from vclient import SyncVClient, sync_system_service
+from vclient._sync.services.base import SyncBaseService
 from vclient.endpoints import Endpoints
 from vclient.exceptions import NotFoundError
 from vclient.models import CharacterFullSheet, FullSheetTraitCategory, SystemHealth
@@ -89,6 +92,35 @@ class TestSyncClientPagination:
         assert result.items[0].name == "Test Company"
 
 
+class TestSyncClientETagCache:
+    """Tests for the GET cache on a SyncVClient shared between threads."""
+
+    @respx.mock
+    def test_cache_shared_between_threads(self, base_url, api_key):
+        """Verify concurrent threads can fill, evict and invalidate one cache safely."""
+        # Given: A small cache and fresh responses for many paths
+        respx.get(url__startswith=f"{base_url}/items/").respond(
+            200, json={}, headers={"Cache-Control": "max-age=60"}
+        )
+        respx.patch(url__startswith=f"{base_url}/items/").respond(200, json={})
+        client = SyncVClient(base_url=base_url, api_key=api_key, etag_cache_size=4)
+        service = SyncBaseService(client)
+
+        def worker(offset: int) -> None:
+            for i in range(50):
+                service._get(f"/items/{(offset + i) % 10}")
+                if i % 5 == 0:
+                    service._patch(f"/items/{i % 10}", json={})
+
+        # When: Several threads read and write through the same client
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(worker, range(4)))
+        client.close()
+
+        # Then: No thread failed and the LRU bound still holds
+        assert len(client._etag_cache) <= 4
+
+
 class TestSyncClientRetry:
     """Tests for SyncVClient retry behavior."""
 
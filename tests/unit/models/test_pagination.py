@@ -100,3 +100,13 @@ class TestPaginatedResponse:
 
         # When/Then: current_page returns expected value
         assert response.current_page == expected
+
+    def test_slotted_instances(self):
+        """Verify instances are slotted and carry no per-instance __dict__."""
+        # Given: A paginated response
+        response = PaginatedResponse(items=[], limit=10, offset=0, total=0)
+
+        # When/Then: Unknown attributes cannot be added
+        assert not hasattr(response, "__dict__")
+        with pytest.raises(AttributeError):
+            response.extra = True
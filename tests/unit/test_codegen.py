@@ -117,6 +117,24 @@ class TestAsyncToSyncTransformer:
         assert "asyncio.sleep" not in result
         assert "time.sleep(1)" in result
 
+    def test_import_not_duplicated_when_time_already_imported(self) -> None:
+        """Verify the rewritten asyncio import does not duplicate an existing time import."""
+        # Given: A module importing both asyncio and time
+        source = """
+        import asyncio
+        import time
+
+        async def wait():
+            await asyncio.sleep(time.monotonic())
+        """
+
+        # When: The transformer processes the source
+        result = self._transform(source)
+
+        # Then: time is imported exactly once and both calls use it
+        assert result.count("import time") == 1
+        assert "time.sleep(time.monotonic())" in result
+
     def test_aclose_becomes_close(self) -> None:
         """Verify .aclose() method calls are replaced with .close()."""
         # Given: A function calling aclose
@@ -250,6 +268,23 @@ class TestAsyncToSyncTransformer:
         # Then: The function is renamed
         assert "def sync_companies_service():" in result
 
+    def test_bounded_gather_becomes_sequential_helper(self) -> None:
+        """Verify the bounded gather helper is swapped for its sequential counterpart."""
+        # Given: A bulk helper awaiting gather_bounded
+        source = """
+        from vclient._concurrency import gather_bounded
+
+        async def get_many(self, ids):
+            return await gather_bounded((self.get(i) for i in ids), 8)
+        """
+
+        # When: The transformer processes the source
+        result = self._transform(source)
+
+        # Then: The import and call use run_sequentially
+        assert "from vclient._concurrency import run_sequentially" in result
+        assert "return run_sequentially((self.get(i) for i in ids), 8)" in result
+
     def test_constant_string_annotation_rename(self) -> None:
         """Verify string annotations containing class names are renamed."""
         # Given: A function with a string type annotation
@@ -0,0 +1,101 @@
+"""Tests for vclient._concurrency bulk helpers."""
+
+import asyncio
+from collections.abc import Coroutine, Iterator
+from typing import Any
+
+import pytest
+
+from vclient._concurrency import gather_bounded, run_sequentially
+
+pytestmark = pytest.mark.anyio
+
+
+class TestGatherBounded:
+    """Tests for the gather_bounded async helper."""
+
+    async def test_results_keep_input_order(self) -> None:
+        """Verify results follow the input order even when calls finish out of order."""
+
+        # Given: Calls that finish in reverse order
+        async def call(value: int) -> int:
+            await asyncio.sleep((5 - value) / 1000)
+            return value
+
+        # When: Gathering them
+        result = await gather_bounded((call(value) for value in range(5)), 3)
+
+        # Then: Results are in input order
+        assert result == [0, 1, 2, 3, 4]
+
+    async def test_limit_caps_calls_in_flight(self) -> None:
+        """Verify no more than ``limit`` calls run at the same time."""
+        # Given: Calls that record how many are running
+        running = 0
+        peak = 0
+
+        async def call() -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+
+        # When: Gathering many calls with a limit of 3
+        await gather_bounded((call() for _ in range(20)), 3)
+
+        # Then: At most 3 ran at once
+        assert peak == 3
+
+    async def test_first_failure_cancels_the_rest(self) -> None:
+        """Verify a failure cancels in-flight calls, skips the rest and is re-raised as-is."""
+        # Given: One failing call, one slow call, and calls that should never start
+        started: list[str] = []
+        cancelled: list[str] = []
+
+        async def fail() -> None:
+            started.append("fail")
+            msg = "boom"
+            raise ValueError(msg)
+
+        async def slow(name: str) -> None:
+            started.append(name)
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(name)
+                raise
+
+        def calls() -> Iterator[Coroutine[Any, Any, None]]:
+            yield slow("slow")
+            yield fail()
+            yield slow("never")
+
+        # When/Then: The original exception propagates
+        with pytest.raises(ValueError, match="boom"):
+            await gather_bounded(calls(), 2)
+
+        # Then: The slow call was cancelled and the remaining call never started
+        assert cancelled == ["slow"]
+        assert "never" not in started
+
+
+class TestRunSequentially:
+    """Tests for the run_sequentially sync helper."""
+
+    def test_stops_at_first_failure(self) -> None:
+        """Verify calls run in order and none run after a failure."""
+        # Given: A generator of calls where the second fails
+        made: list[int] = []
+
+        def call(value: int) -> int:
+            made.append(value)
+            if value == 1:
+                msg = "boom"
+                raise ValueError(msg)
+            return value
+
+        # When/Then: The failure propagates and later calls are never made
+        with pytest.raises(ValueError, match="boom"):
+            run_sequentially((call(value) for value in range(3)), 8)
+        assert made == [0, 1]